@@ -0,0 +1,121 @@
+from models.boruvka import BoruvkaGraph
+from models.compact_graph import CompactGraph
+from models.graph import BFSGraph, BellmanFordGraph, DFSGraph, KruskalGraph, PrimDijkstraGraph, DijkstraGraph
+from models.messages import DEFAULT_LOCALE
+from models.timeline import DEFAULT_KEYFRAME_INTERVAL
+
+
+# Nazwy dostepnych algorytmow
+ALGORITHMS = ('BFS', 'DFS', 'Kruskal', 'Boruvka', 'PrimDijkstra', 'Dijkstra', 'BellmanFord')
+
+# Algorytmy wymagajace grafu z wagami krawedzi
+WEIGHTED_ALGORITHMS = {'Kruskal', 'Boruvka', 'PrimDijkstra', 'Dijkstra', 'BellmanFord', 'AllPairs'}
+
+# Domyslna liczba krokow na stronie, gdy podano from_step bez limit
+DEFAULT_PAGE_LIMIT = 1000
+
+# Pola zapytania okreslajace strone krokow (nie wplywaja na przebieg algorytmu)
+PAGING_FIELDS = ('from_step', 'limit')
+
+
+def create_core(algorithm, request_data):
+    """
+    Tworzy zwarta reprezentacje grafu przeslanego w zapytaniu.
+    """
+    weights = request_data['weights'] if algorithm in WEIGHTED_ALGORITHMS else None
+    return CompactGraph(request_data['vertices'], request_data['adjacency_list'], weights)
+
+
+def create_graph(algorithm, core, request_data):
+    """
+    Tworzy obiekt grafu odpowiedni dla wskazanego algorytmu na podstawie zwartej reprezentacji grafu oraz pol zapytania.
+    """
+    if algorithm in ('BFS', 'DFS'):
+        search_type = BFSGraph if algorithm == 'BFS' else DFSGraph
+        start_vertices, forest = search_starts(core, request_data)
+        graph = search_type(current_vertex=start_vertices[0] if start_vertices else core.labels[0], core=core, start_vertices=start_vertices, forest=forest)
+    elif algorithm == 'Kruskal':
+        graph = KruskalGraph(core=core)
+    elif algorithm == 'Boruvka':
+        graph = BoruvkaGraph(core=core, engine=request_data.get('engine', 'auto'))
+    elif algorithm == 'PrimDijkstra':
+        graph = PrimDijkstraGraph(current_vertex=start_index(core, request_data), core=core)
+    elif algorithm == 'Dijkstra':
+        target_vertex = vertex_index(core, request_data['target_vertex'], 'target_vertex') if request_data.get('target_vertex') is not None else None
+        graph = DijkstraGraph(current_vertex=start_index(core, request_data), target_vertex=target_vertex, core=core)
+    elif algorithm == 'BellmanFord':
+        graph = BellmanFordGraph(current_vertex=start_index(core, request_data), core=core, engine=request_data.get('engine', 'auto'))
+    else:
+        raise ValueError(f'Nieznany algorytm: {algorithm}.')
+
+    configure_step_format(graph, request_data)
+    return graph
+
+
+def start_index(core, request_data):
+    """
+    Zwraca wierzcholek startowy (pole start_vertex) algorytmow Prima-Dijkstry, Dijkstry oraz Bellmana-Forda - indeks wierzcholka grafu.
+    """
+    if 'start_vertex' not in request_data:
+        raise ValueError('Zapytanie nie zawiera wierzcholka startowego (pole start_vertex).')
+    return vertex_index(core, request_data['start_vertex'], 'start_vertex')
+
+
+def vertex_index(core, vertex, field):
+    """
+    Sprawdza, czy wartosc pola zapytania jest indeksem wierzcholka grafu, i ja zwraca.
+    """
+    if isinstance(vertex, bool) or not isinstance(vertex, int) or not 0 <= vertex < core.vertex_count():
+        raise ValueError(f'{field} musi byc indeksem wierzcholka grafu.')
+    return vertex
+
+
+def search_starts(core, request_data):
+    """
+    Zwraca liste wierzcholkow startowych przeszukiwania (pole start_vertices lub start_vertex) oraz informacje, czy ma zostac
+    przeszukany caly graf (pole forest). W trybie lasu lista wierzcholkow startowych moze byc pusta.
+    """
+    forest = request_data.get('forest', False) is True
+    if 'start_vertices' not in request_data:
+        if 'start_vertex' not in request_data:
+            raise ValueError('Zapytanie nie zawiera wierzcholka startowego (pole start_vertex lub start_vertices).')
+        return [vertex_label(core, request_data['start_vertex'], 'start_vertex')], forest
+
+    start_vertices = request_data['start_vertices']
+    if not isinstance(start_vertices, list) or (not start_vertices and not (forest and core.vertex_count())):
+        raise ValueError('start_vertices musi byc niepusta lista wierzcholkow (pusta lista jest dozwolona jedynie w trybie lasu).')
+    return [vertex_label(core, vertex, 'start_vertices') for vertex in start_vertices], forest
+
+
+def vertex_label(core, vertex, field):
+    """
+    Sprawdza, czy wartosc pola zapytania jest etykieta wierzcholka grafu (algorytmy przeszukiwania uzywaja etykiet), i ja zwraca.
+    """
+    if isinstance(vertex, (list, dict)):
+        raise ValueError(f'{field} musi zawierac etykiety wierzcholkow grafu.')
+    if vertex not in core.index_of:
+        raise ValueError(f'Nieznany wierzcholek startowy: {vertex}.')
+    return vertex
+
+
+def configure_step_format(graph, request_data):
+    """
+    Ustawia format zwracanych krokow na podstawie opcjonalnych pol zapytania step_format oraz keyframe_interval,
+    a takze sposob przekazywania komunikatow krokow na podstawie pol info (tresc lub kod komunikatu) oraz locale (jezyk tresci).
+    """
+    if request_data.get('step_format', 'full') == 'delta':
+        graph.use_delta_steps(request_data.get('keyframe_interval', DEFAULT_KEYFRAME_INTERVAL))
+    graph.use_message_codes(request_data.get('info', True) is not False, request_data.get('locale', DEFAULT_LOCALE))
+
+
+def paging_range(request_data):
+    """
+    Zwraca numer pierwszego kroku oraz maksymalna liczbe krokow strony na podstawie pol from_step oraz limit.
+    """
+    from_step = request_data.get('from_step', 0)
+    limit = request_data.get('limit', DEFAULT_PAGE_LIMIT)
+    if isinstance(from_step, bool) or not isinstance(from_step, int) or from_step < 0:
+        raise ValueError('from_step musi byc nieujemna liczba calkowita.')
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError('limit musi byc dodatnia liczba calkowita.')
+    return from_step, limit
@@ -0,0 +1,112 @@
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from algorithms import ALGORITHMS, WEIGHTED_ALGORITHMS
+from job_manager import job_body
+
+
+def execute_runs(core, runs):
+    """
+    Funkcja wykonywana w procesie puli. Wykonuje kolejne przebiegi na tym samym grafie i zwraca dla kazdego z nich
+    krotke (tresc JSON lub None, komunikat bledu lub None, czas wykonania w sekundach).
+    """
+    outcomes = list()
+    for run_data in runs:
+        start = time.perf_counter()
+        try:
+            body, _ = job_body(run_data['algorithm'], run_data, core)
+            outcomes.append((body.rstrip(b'\n'), None, time.perf_counter() - start))
+        except ValueError as error:
+            # Niepoprawne pola jednego przebiegu (sprawdzane przy tworzeniu grafu) nie przerywaja pozostalych przebiegow zapytania
+            outcomes.append((None, str(error), time.perf_counter() - start))
+    return outcomes
+
+
+def chunk(items, count):
+    """
+    Dzieli liste na co najwyzej count kolejnych fragmentow o zblizonej dlugosci.
+    """
+    size, remainder = divmod(len(items), count)
+    chunks, start = list(), 0
+    for i in range(count):
+        end = start + size + (1 if i < remainder else 0)
+        if end > start:
+            chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+class BatchExecutor:
+    """
+    Klasa wykonujaca wiele przebiegow algorytmow (algorytm, wierzcholek startowy, opcje) na jednym grafie.
+    Przebiegi sa dzielone na fragmenty wykonywane rownolegle w puli max_workers procesow, tworzonej przy pierwszym uzyciu.
+    Zwarta reprezentacja grafu jest przesylana raz dla kazdego fragmentu, a nie dla kazdego przebiegu.
+    """
+    def __init__(self, max_workers=None, max_runs=256):
+        """
+        Tworzy wykonawce bez uruchomionej puli procesow.
+        """
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_runs = max_runs
+        self.pool = None
+        self.lock = threading.Lock()
+
+    def executor(self):
+        """
+        Zwraca pule procesow, tworzac ja przy pierwszym wywolaniu.
+        """
+        with self.lock:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+            return self.pool
+
+    def prepare_runs(self, core, request_data):
+        """
+        Sprawdza poprawnosc listy przebiegow i zwraca pola zapytania kazdego przebiegu, uzupelnione o wspolne opcje zapytania.
+        """
+        runs = request_data.get('runs')
+        if not isinstance(runs, list) or not runs:
+            raise ValueError('Pole runs musi byc niepusta lista przebiegow.')
+        if len(runs) > self.max_runs:
+            raise ValueError(f'Liczba przebiegow ({len(runs)}) przekracza limit ({self.max_runs}).')
+
+        defaults = {name: value for name, value in request_data.items() if name not in ('runs', 'vertices', 'adjacency_list', 'weights', 'graph_id')}
+        prepared = list()
+        for run in runs:
+            if not isinstance(run, dict):
+                raise ValueError('Kazdy przebieg musi byc obiektem z polami zapytania.')
+            run_data = dict(defaults, **run)
+            if run_data.get('algorithm') not in ALGORITHMS:
+                raise ValueError(f"Nieznany algorytm: {run_data.get('algorithm')}.")
+            if run_data['algorithm'] in WEIGHTED_ALGORITHMS and core.weights is None:
+                raise ValueError('Wybrany algorytm wymaga grafu z wagami krawedzi.')
+            prepared.append(run_data)
+        return prepared
+
+    def run(self, core, request_data):
+        """
+        Wykonuje wszystkie przebiegi i zwraca tresc odpowiedzi JSON - liste wynikow w kolejnosci przebiegow z czasem wykonania
+        kazdego z nich oraz calkowitym czasem obslugi. Gotowe wyniki przebiegow sa wklejane do odpowiedzi bez ponownej serializacji.
+        """
+        start = time.perf_counter()
+        runs = self.prepare_runs(core, request_data)
+        if len(runs) == 1 or self.max_workers == 1:
+            outcomes = execute_runs(core, runs)
+        else:
+            futures = [self.executor().submit(execute_runs, core, part) for part in chunk(runs, self.max_workers)]
+            outcomes = [outcome for future in futures for outcome in future.result()]
+
+        entries = list()
+        for run_data, (body, error, elapsed) in zip(runs, outcomes):
+            entry = {"algorithm": run_data['algorithm'], "time_ms": round(elapsed * 1000, 3)}
+            if 'start_vertex' in run_data:
+                entry["start_vertex"] = run_data['start_vertex']
+            if error is not None:
+                entry["error"] = error
+                entries.append(json.dumps(entry).encode('utf-8'))
+            else:
+                entries.append(json.dumps(entry)[:-1].encode('utf-8') + b',"output":' + body + b'}')
+        total = json.dumps(round((time.perf_counter() - start) * 1000, 3)).encode('utf-8')
+        return b'{"runs":[' + b','.join(entries) + b'],"total_time_ms":' + total + b'}\n'
@@ -0,0 +1,3 @@
+"""
+Skrypty pomiarow wydajnosci oraz generatory grafow testowych. Skrypty uruchamia sie z katalogu API poleceniem python -m benchmarks.<nazwa>.
+"""
@@ -0,0 +1,68 @@
+"""
+Sprawdzenie poprawnosci oraz porownanie czasu dzialania silnikow najkrotszych drog miedzy wszystkimi parami wierzcholkow.
+Wyniki obu silnikow sa porownywane z kosztami wyznaczonymi przez DijkstraGraph (w trybie krokow) z kazdego wierzcholka.
+Uruchomienie (z katalogu API): python -m benchmarks.all_pairs [liczba_wierzcholkow] [liczba_krawedzi]
+"""
+import math
+import sys
+import time
+from benchmarks.generators import random_connected_graph
+from models.all_pairs import AllPairsShortestPaths
+from models.compact_graph import CompactGraph
+from models.graph import DijkstraGraph
+
+
+def reference_distances(core):
+    """
+    Zwraca macierz kosztow wyznaczona przez DijkstraGraph z rejestrowaniem krokow, uruchamiany osobno dla kazdego wierzcholka.
+    """
+    distances = list()
+    for source in range(core.vertex_count()):
+        graph = DijkstraGraph(current_vertex=source, core=core)
+        graph.find_shortest_paths()
+        distances.append([cost if cost != math.inf else None for cost in graph.costs])
+    return distances
+
+
+def check_predecessors(core, distances, predecessors):
+    """
+    Sprawdza, czy kazdy poprzednik lezy na najkrotszej drodze - koszt poprzednika powiekszony o wage luku jest rowny kosztowi wierzcholka.
+    """
+    for source in range(core.vertex_count()):
+        for vertex, parent in enumerate(predecessors[source]):
+            if parent == -1:
+                if vertex != source and distances[source][vertex] is not None:
+                    return False
+                continue
+            weight = min(weight for neighbour, weight in core.weighted_neighbours(parent) if neighbour == vertex)
+            if distances[source][parent] + weight != distances[source][vertex]:
+                return False
+    return True
+
+
+def verify(core):
+    """
+    Porownuje wyniki obu silnikow z wynikami DijkstraGraph i zwraca czasy ich dzialania.
+    """
+    expected = reference_distances(core)
+    times = dict()
+    for engine in ('dijkstra', 'floyd_warshall'):
+        start = time.perf_counter()
+        result = AllPairsShortestPaths(core, engine).compute()
+        times[engine] = time.perf_counter() - start
+        if result["distances"] != expected:
+            raise SystemExit(f'Silnik {engine}: koszty rozne od wyznaczonych przez DijkstraGraph.')
+        if not check_predecessors(core, result["distances"], result["predecessors"]):
+            raise SystemExit(f'Silnik {engine}: niepoprawna macierz poprzednikow.')
+    return times
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    edge_counts = [int(sys.argv[2])] if len(sys.argv) > 2 else [2 * vertex_count, vertex_count * (vertex_count - 1) // 4]
+    for edge_count in edge_counts:
+        request_data = random_connected_graph(vertex_count, edge_count)
+        core = CompactGraph(request_data['vertices'], request_data['adjacency_list'], request_data['weights'])
+        times = verify(core)
+        selected = AllPairsShortestPaths(core).selected_engine()
+        print(f"V={vertex_count} E={edge_count}: dijkstra {times['dijkstra']:.4f} s, floyd_warshall {times['floyd_warshall']:.4f} s, auto -> {selected}")
@@ -0,0 +1,33 @@
+"""
+Porownanie czasu obliczania wyniku algorytmu Bellmana-Forda petla w jezyku Python oraz silnikiem NumPy (relaksacja wszystkich lukow naraz).
+Uruchomienie (z katalogu API): python -m benchmarks.bellman_ford [liczba_wierzcholkow] [liczba_krawedzi]
+"""
+import sys
+import time
+from benchmarks.generators import random_connected_graph
+from models.compact_graph import CompactGraph
+from models.graph import BellmanFordGraph
+
+
+def measure(core, engine):
+    """
+    Zwraca czas (w sekundach) oraz wynik algorytmu Bellmana-Forda obliczonego wskazanym silnikiem.
+    """
+    graph = BellmanFordGraph(core=core, engine=engine)
+    start = time.perf_counter()
+    result = graph.compute_result()
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * vertex_count
+    request_data = random_connected_graph(vertex_count, edge_count)
+    core = CompactGraph(request_data['vertices'], request_data['adjacency_list'], request_data['weights'])
+    python_time, python_result = measure(core, 'python')
+    numpy_time, numpy_result = measure(core, 'numpy')
+    if python_result['costs'] != numpy_result['costs']:
+        raise SystemExit('Silniki zwrocily rozne koszty.')
+    print(f'V={vertex_count} E={edge_count}')
+    print(f'python: {python_time:.4f} s')
+    print(f'numpy:  {numpy_time:.4f} s ({python_time / numpy_time:.1f}x)')
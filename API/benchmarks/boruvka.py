@@ -0,0 +1,42 @@
+"""
+Porownanie czasu wyznaczania minimalnego drzewa rozpinajacego algorytmem Kruskala oraz algorytmem Boruvki (silniki python i numpy,
+rozna liczba procesow). Dla kazdego przebiegu sprawdzane jest, czy calkowita waga drzewa jest rowna wadze wyznaczonej algorytmem Kruskala.
+Uruchomienie (z katalogu API): python -m benchmarks.boruvka [liczba_wierzcholkow] [liczba_krawedzi] [liczby_procesow]
+"""
+import math
+import sys
+import time
+from algorithms import create_core
+from benchmarks.generators import random_connected_graph
+from models.boruvka import BoruvkaGraph
+from models.graph import KruskalGraph
+from models.numpy_engine import numpy
+
+
+def measure(graph):
+    """
+    Zwraca czas (w sekundach) oraz wynik wyznaczenia minimalnego drzewa rozpinajacego.
+    """
+    start = time.perf_counter()
+    result = graph.compute_result()
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * vertex_count
+    worker_counts = [int(count) for count in sys.argv[3].split(',')] if len(sys.argv) > 3 else [1, 2, 4]
+    core = create_core('Boruvka', random_connected_graph(vertex_count, edge_count))
+    # Tablice krawedzi sa zapamietywane w zwartej reprezentacji - ich wyznaczenie nie jest wliczane do zadnego z pomiarow
+    core.undirected_edges()
+
+    kruskal_time, expected = measure(KruskalGraph(core=core))
+    print(f'V={vertex_count} E={edge_count}')
+    print(f'{"algorytm":<24}{"procesy":>8}{"czas [s]":>12}{"waga zgodna":>14}')
+    print(f'{"Kruskal":<24}{1:>8}{kruskal_time:>12.4f}{"-":>14}')
+    for engine in ('python', 'numpy') if numpy is not None else ('python',):
+        for workers in worker_counts:
+            graph = BoruvkaGraph(core=core, engine=engine, workers=workers)
+            elapsed, result = measure(graph)
+            matches = 'tak' if math.isclose(result['total_weight'], expected['total_weight']) else 'NIE'
+            print(f'{"Boruvka (" + engine + ")":<24}{graph.worker_count():>8}{elapsed:>12.4f}{matches:>14}')
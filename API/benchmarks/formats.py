@@ -0,0 +1,50 @@
+"""
+Porownanie czasu odczytu grafu oraz zapisu odpowiedzi w formatach JSON oraz binarnym (postac binarna grafu, MessagePack).
+Uruchomienie (z katalogu API): python -m benchmarks.formats [liczba_wierzcholkow] [liczba_krawedzi]
+"""
+import json
+import sys
+import time
+from algorithms import create_core, create_graph
+from benchmarks.generators import random_connected_graph
+from formats import msgpack, pack_graph, pack_response, unpack_graph
+
+
+def best_time(function, repeat=5):
+    """
+    Zwraca najkrotszy z repeat pomiarow czasu wykonania funkcji (w sekundach).
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * vertex_count
+    request_data = random_connected_graph(vertex_count, edge_count)
+    json_body = json.dumps(request_data).encode('utf-8')
+    packed_body = pack_graph(request_data)
+    print(f'V={vertex_count} E={edge_count}')
+    print(f'{"":<22}{"JSON":>12}{"binarny":>12}')
+    print(f'{"rozmiar zapytania [B]":<22}{len(json_body):>12}{len(packed_body):>12}')
+
+    json_parse = best_time(lambda: create_core('Dijkstra', json.loads(json_body)))
+    packed_parse = best_time(lambda: unpack_graph(packed_body))
+    print(f'{"odczyt grafu [s]":<22}{json_parse:>12.4f}{packed_parse:>12.4f}')
+
+    if msgpack is None:
+        print('Pakiet msgpack nie jest zainstalowany - pomijanie pomiaru zapisu odpowiedzi.')
+        sys.exit(0)
+    # Liczba krokow BFS rosnie z liczba lukow, a kazdy krok jest migawka calego grafu - odpowiedz jest mierzona na mniejszym grafie
+    steps_data = random_connected_graph(min(vertex_count, 300), min(edge_count, 1200))
+    steps = create_graph('BFS', create_core('BFS', steps_data), steps_data).collect_steps()
+    json_size, packed_size = len(json.dumps(steps)), len(pack_response(steps))
+    json_write = best_time(lambda: json.dumps(steps), 3)
+    packed_write = best_time(lambda: pack_response(steps), 3)
+    print(f'{"odpowiedz BFS [B]":<22}{json_size:>12}{packed_size:>12}')
+    print(f'{"zapis odpowiedzi [s]":<22}{json_write:>12.4f}{packed_write:>12.4f}')
@@ -0,0 +1,101 @@
+"""
+Generatory grafow testowych. Kazdy generator zwraca pola zapytania (vertices, adjacency_list, weights, start_vertex)
+i dla tego samego ziarna (seed) tworzy zawsze ten sam graf.
+"""
+import random
+
+
+def from_edges(vertex_count, edges, generator):
+    """
+    Tworzy pola zapytania dla grafu nieskierowanego o wskazanych krawedziach z losowymi wagami z przedzialu 1-100.
+    """
+    adjacency_list = [list() for _ in range(vertex_count)]
+    weights = [list() for _ in range(vertex_count)]
+    for vertex1, vertex2 in edges:
+        weight = generator.randint(1, 100)
+        adjacency_list[vertex1].append(vertex2)
+        weights[vertex1].append(weight)
+        adjacency_list[vertex2].append(vertex1)
+        weights[vertex2].append(weight)
+    return {
+        "vertices": list(range(vertex_count)),
+        "adjacency_list": adjacency_list,
+        "weights": weights,
+        "start_vertex": 0
+    }
+
+
+def random_connected_graph(vertex_count, edge_count, seed=0):
+    """
+    Tworzy losowy spojny graf nieskierowany z wagami - drzewo rozpinajace uzupelnione losowymi krawedziami.
+    """
+    generator = random.Random(seed)
+    edge_count = min(edge_count, vertex_count * (vertex_count - 1) // 2)
+    edges = {(generator.randrange(i), i) for i in range(1, vertex_count)}
+    while len(edges) < edge_count:
+        vertex1, vertex2 = generator.randrange(vertex_count), generator.randrange(vertex_count)
+        if vertex1 != vertex2:
+            edges.add((min(vertex1, vertex2), max(vertex1, vertex2)))
+    return from_edges(vertex_count, sorted(edges), generator)
+
+
+def random_sparse(vertex_count, seed=0):
+    """
+    Tworzy losowy spojny graf rzadki - okolo 2V krawedzi.
+    """
+    return random_connected_graph(vertex_count, 2 * vertex_count, seed)
+
+
+def random_dense(vertex_count, seed=0):
+    """
+    Tworzy losowy spojny graf gesty - okolo 1/4 wszystkich mozliwych krawedzi.
+    """
+    return random_connected_graph(vertex_count, vertex_count * (vertex_count - 1) // 8, seed)
+
+
+def grid(vertex_count, seed=0):
+    """
+    Tworzy graf kraty o boku rownym pierwiastkowi z liczby wierzcholkow (liczba wierzcholkow jest zaokraglana w dol do kwadratu).
+    """
+    side = max(int(vertex_count ** 0.5), 1)
+    edges = list()
+    for row in range(side):
+        for column in range(side):
+            vertex = row * side + column
+            if column + 1 < side:
+                edges.append((vertex, vertex + 1))
+            if row + 1 < side:
+                edges.append((vertex, vertex + side))
+    return from_edges(side * side, edges, random.Random(seed))
+
+
+def chain(vertex_count, seed=0):
+    """
+    Tworzy sciezke przechodzaca kolejno przez wszystkie wierzcholki.
+    """
+    return from_edges(vertex_count, [(vertex, vertex + 1) for vertex in range(vertex_count - 1)], random.Random(seed))
+
+
+def star(vertex_count, seed=0):
+    """
+    Tworzy gwiazde - wierzcholek 0 polaczony ze wszystkimi pozostalymi.
+    """
+    return from_edges(vertex_count, [(0, vertex) for vertex in range(1, vertex_count)], random.Random(seed))
+
+
+def complete(vertex_count, seed=0):
+    """
+    Tworzy graf pelny.
+    """
+    edges = [(vertex1, vertex2) for vertex1 in range(vertex_count) for vertex2 in range(vertex1 + 1, vertex_count)]
+    return from_edges(vertex_count, edges, random.Random(seed))
+
+
+GENERATORS = {
+    'random_sparse': random_sparse,
+    'random_dense': random_dense,
+    'grid': grid,
+    'chain': chain,
+    'star': star,
+    'complete': complete
+}
@@ -0,0 +1,57 @@
+"""
+Porownanie czasu aktualizacji przyrostowej drzewa najkrotszych drog (Dijkstra) oraz minimalnego drzewa rozpinajacego (Kruskal)
+z obliczeniami od poczatku po losowych edycjach pojedynczych krawedzi. Kazdy wynik przyrostowy jest porownywany z wyznaczonym od poczatku.
+Uruchomienie (z katalogu API): python -m benchmarks.incremental [liczba_wierzcholkow] [liczba_edycji]
+"""
+import random
+import sys
+import time
+from algorithms import create_core
+from benchmarks.generators import random_sparse
+from models.graph import DijkstraGraph, KruskalGraph
+from models.incremental import GraphEditor, IncrementalShortestPaths, IncrementalSpanningForest, validate
+
+
+def random_edit(core, generator):
+    """
+    Zwraca losowa edycje: zmiane wagi, usuniecie lub dodanie krawedzi.
+    """
+    vertex1 = generator.randrange(core.vertex_count())
+    neighbours = list(core.neighbours(vertex1))
+    operation = generator.choice(('update', 'update', 'delete', 'insert')) if neighbours else 'insert'
+    if operation == 'insert':
+        vertex2 = generator.choice([vertex for vertex in range(core.vertex_count()) if vertex != vertex1])
+    else:
+        vertex2 = generator.choice(neighbours)
+    return {"op": operation, "vertex1": vertex1, "vertex2": vertex2, "weight": generator.randint(1, 100)}
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    edit_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    generator = random.Random(0)
+    core = create_core('Dijkstra', random_sparse(vertex_count))
+    paths, forest = IncrementalShortestPaths(core, 0), IncrementalSpanningForest(core)
+
+    incremental_time = full_time = 0.0
+    relaxed = errors = 0
+    for _ in range(edit_count):
+        editor = GraphEditor(core)
+        start = time.perf_counter()
+        change = editor.apply(random_edit(core, generator))
+        forest.apply(change, editor)
+        core = editor.build()
+        paths.update(core, editor.touched)
+        incremental_time += time.perf_counter() - start
+        relaxed += paths.relaxed_vertices
+
+        start = time.perf_counter()
+        DijkstraGraph(current_vertex=0, core=core).compute_result()
+        KruskalGraph(core=core).compute_result()
+        full_time += time.perf_counter() - start
+        errors += len(validate(paths, core)) + len(validate(forest, core))
+
+    print(f'V={vertex_count} edycje={edit_count}')
+    print(f'aktualizacja przyrostowa: {incremental_time:.4f} s (srednio {relaxed / edit_count:.1f} ponownie relaksowanych wierzcholkow)')
+    print(f'obliczenia od poczatku:   {full_time:.4f} s')
+    print(f'niezgodnosci: {errors}')
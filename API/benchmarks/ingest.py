@@ -0,0 +1,82 @@
+"""
+Porownanie wczytywania duzego zapytania JSON z grafem: dotychczasowej sciezki (json.loads calej tresci, a nastepnie CompactGraph
+z zagniezdzonych list) oraz wczytywania strumieniowego prosto do tablic (GraphReader). Kazda sciezka jest mierzona w osobnym
+procesie - mierzony jest czas oraz szczytowe zuzycie pamieci (RSS) ponad zuzycie procesu przed wczytaniem.
+Uruchomienie (z katalogu API): python -m benchmarks.ingest [liczba_wierzcholkow] [liczba_krawedzi]
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.generators import random_connected_graph
+
+
+def peak_rss():
+    """
+    Zwraca szczytowe zuzycie pamieci (RSS) biezacego procesu w bajtach. W systemie Linux odczytywana jest wartosc VmHWM,
+    poniewaz ru_maxrss jest dziedziczone po procesie nadrzednym przy uruchamianiu procesu potomnego.
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def load(path, method):
+    """
+    Wczytuje graf z pliku wskazana metoda i zwraca czas wczytywania (w sekundach) oraz liczbe lukow grafu.
+    """
+    from ingest import GraphReader
+    from models.compact_graph import CompactGraph
+    start = time.perf_counter()
+    with open(path, 'rb') as file:
+        if method == 'stream':
+            _, core, _ = GraphReader().read(file)
+        else:
+            request_data = json.loads(file.read())
+            core = CompactGraph(request_data['vertices'], request_data['adjacency_list'], request_data['weights'])
+    return time.perf_counter() - start, core.arc_count()
+
+
+def measure(path, method):
+    """
+    Wczytuje graf w nowym procesie i zwraca czas wczytywania oraz przyrost szczytowego RSS procesu.
+    """
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.ingest', '--child', path, method], capture_output=True, text=True, check=True
+    ).stdout
+    seconds, memory = output.split()
+    return float(seconds), int(memory)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        # Moduly potrzebne do wczytywania sa importowane przed pomiarem pamieci poczatkowej
+        import ingest  # noqa: F401
+        import models.compact_graph  # noqa: F401
+        baseline = peak_rss()
+        seconds, _ = load(sys.argv[2], sys.argv[3])
+        print(seconds, peak_rss() - baseline)
+        sys.exit(0)
+
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * vertex_count
+    descriptor, path = tempfile.mkstemp(suffix='.json')
+    try:
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump(dict(random_connected_graph(vertex_count, edge_count), start_vertex=0), file)
+        print(f'V={vertex_count} E={edge_count} rozmiar tresci: {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+        print(f'{"sciezka":<28}{"czas [s]":>12}{"szczyt RSS [MiB]":>20}')
+        for method, name in (('json', 'json.loads + CompactGraph'), ('stream', 'GraphReader (strumieniowo)')):
+            seconds, memory = measure(path, method)
+            print(f'{name:<28}{seconds:>12.3f}{memory / 2 ** 20:>20.1f}')
+    finally:
+        os.remove(path)
@@ -0,0 +1,39 @@
+"""
+Porownanie czasu dzialania algorytmow w trybie krokow (steps) oraz w trybie wyniku (result) na duzych grafach.
+Uruchomienie (z katalogu API): python -m benchmarks.result_mode [liczba_wierzcholkow] [liczba_krawedzi]
+"""
+import sys
+import time
+from algorithms import create_core, create_graph
+from benchmarks.generators import random_connected_graph
+
+
+ALGORITHMS = ['BFS', 'DFS', 'Kruskal', 'PrimDijkstra', 'Dijkstra', 'BellmanFord']
+
+
+def measure(algorithm, request_data, mode):
+    """
+    Zwraca czas (w sekundach) wykonania algorytmu w trybie krokow lub wyniku.
+    """
+    core = create_core(algorithm, request_data)
+    graph = create_graph(algorithm, core, request_data)
+    start = time.perf_counter()
+    if mode == 'result':
+        graph.compute_result()
+    else:
+        graph.collect_steps()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * vertex_count
+    request_data = random_connected_graph(vertex_count, edge_count)
+    print(f'V={vertex_count} E={edge_count}')
+    print(f'{"algorytm":<14}{"steps [s]":>12}{"result [s]":>12}{"przyspieszenie":>16}')
+    for algorithm in ALGORITHMS:
+        # Bellman-Ford rejestruje krok dla kazdego luku w kazdej iteracji, dlatego jest mierzony na mniejszym grafie
+        data = request_data if algorithm != 'BellmanFord' else random_connected_graph(vertex_count // 10, edge_count // 10)
+        steps_time = measure(algorithm, data, 'steps')
+        result_time = measure(algorithm, data, 'result')
+        print(f'{algorithm:<14}{steps_time:>12.4f}{result_time:>12.4f}{steps_time / result_time:>15.1f}x')
@@ -0,0 +1,39 @@
+"""
+Pomiar czasu uruchamiania aplikacji w nowym procesie (tak jak przy zimnym starcie procesu serwera): czasu importu modulu
+aplikacji, czasu fabryki create_app (w tym kompresji plikow statycznych) oraz modulow, ktorych import trwa najdluzej (python -X importtime).
+Uruchomienie (z katalogu API): python -m benchmarks.startup [liczba_modulow]
+"""
+import subprocess
+import sys
+
+
+# Kod wykonywany w nowym procesie - wypisuje czasy importu i fabryki aplikacji
+STARTUP_CODE = (
+    'import time; start = time.perf_counter(); import main; imported = time.perf_counter(); main.create_app(); '
+    'print(imported - start, time.perf_counter() - imported, main.static_assets.stats()["seconds"])'
+)
+
+
+def import_times(count):
+    """
+    Zwraca liste (skumulowany czas importu w sekundach, nazwa modulu) dla count najwolniej importowanych modulow najwyzszego poziomu.
+    """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], capture_output=True, text=True, check=True).stderr
+    modules = list()
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        # Wciecie nazwy oznacza glebokosc zagniezdzenia importu - mierzone sa moduly importowane bezposrednio przez main
+        if name.startswith('   ') and not name.startswith('    '):
+            modules.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(modules, reverse=True)[:count]
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    output = subprocess.run([sys.executable, '-c', STARTUP_CODE], capture_output=True, text=True, check=True).stdout
+    import_seconds, create_seconds, static_seconds = (float(value) for value in output.split())
+    print(f'import main: {import_seconds:.4f} s')
+    print(f'create_app:  {create_seconds:.4f} s (pliki statyczne: {static_seconds:.4f} s)')
+    print('najwolniej importowane moduly (importowane bezposrednio przez main):')
+    for seconds, name in import_times(count):
+        print(f'{name:<32}{seconds:>10.4f} s')
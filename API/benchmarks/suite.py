@@ -0,0 +1,205 @@
+"""
+Zestaw testow wydajnosci - mierzy czas, szczytowe zuzycie pamieci oraz rozmiar wyniku dla kazdej klasy algorytmu
+oraz kazdego punktu koncowego (przez klienta testowego Flask) na grafach z generatorow o rosnacej liczbie wierzcholkow.
+
+Uruchomienie (z katalogu API):
+    python -m benchmarks.suite run --sizes 50,100,200 --output wyniki.json
+    python -m benchmarks.suite compare poprzednie.json wyniki.json --threshold 1.25
+Porownanie zwraca kod wyjscia 1, jesli ktorykolwiek pomiar pogorszyl sie o wiecej niz wskazany wspolczynnik.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from algorithms import ALGORITHMS, create_core, create_graph
+from benchmarks.generators import GENERATORS
+from job_manager import estimate_cost
+
+
+# Mierzone wielkosci - dla kazdej z nich wieksza wartosc oznacza gorszy wynik
+METRICS = ('wall_time', 'peak_memory', 'response_bytes')
+
+# Pomiary czasu ponizej tej wartosci (w sekundach) sa zbyt zaszumione, aby oceniac na ich podstawie regresje
+MIN_COMPARABLE_TIME = 0.005
+
+
+def run_class(algorithm, request_data, mode):
+    """
+    Wykonuje algorytm bezposrednio na obiekcie grafu i zwraca rozmiar wyniku w postaci JSON (w bajtach).
+    """
+    graph = create_graph(algorithm, create_core(algorithm, request_data), request_data)
+    payload = graph.compute_result() if mode == 'result' else graph.collect_steps()
+    return len(json.dumps(payload, separators=(',', ':')))
+
+
+def run_route(client, algorithm, request_data, mode):
+    """
+    Wysyla zapytanie do punktu koncowego algorytmu przez klienta testowego Flask i zwraca rozmiar odpowiedzi (w bajtach).
+    """
+    response = client.post(f'/api/{algorithm}', json=dict(request_data, mode=mode))
+    if response.status_code != 200:
+        raise RuntimeError(f'/api/{algorithm}: kod odpowiedzi {response.status_code}.')
+    return len(response.get_data())
+
+
+def measure(function, repeat):
+    """
+    Zwraca najkrotszy z repeat pomiarow czasu wykonania funkcji, szczytowe zuzycie pamieci (mierzone w osobnym przebiegu,
+    poniewaz tracemalloc spowalnia obliczenia) oraz wynik funkcji (rozmiar odpowiedzi).
+    """
+    wall_time = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response_bytes = function()
+        elapsed = time.perf_counter() - start
+        wall_time = elapsed if wall_time is None else min(wall_time, elapsed)
+
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"wall_time": wall_time, "peak_memory": peak_memory, "response_bytes": response_bytes}
+
+
+def run(sizes, generators, algorithms, targets, modes, repeat, max_cost, seed):
+    """
+    Wykonuje wszystkie pomiary i zwraca ich liste. Kombinacje o szacowanym koszcie wiekszym niz max_cost sa pomijane.
+    """
+    client = None
+    if 'route' in targets:
+        import main
+        # Pamiec podreczna wynikow zwracalaby zapamietane odpowiedzi zamiast mierzyc obliczenia
+        main.result_cache.max_bytes = 0
+        main.result_cache.directory = None
+        client = main.app.test_client()
+
+    results = list()
+    for generator_name in generators:
+        for size in sizes:
+            request_data = GENERATORS[generator_name](size, seed)
+            vertex_count = len(request_data['vertices'])
+            arc_count = sum(len(neighbours) for neighbours in request_data['adjacency_list'])
+            for algorithm in algorithms:
+                for mode in modes:
+                    cost = estimate_cost(algorithm, vertex_count, arc_count, {"mode": mode})
+                    for target in targets:
+                        entry = {
+                            "target": target,
+                            "algorithm": algorithm,
+                            "mode": mode,
+                            "generator": generator_name,
+                            "vertices": vertex_count,
+                            "edges": arc_count // 2
+                        }
+                        if cost > max_cost:
+                            entry["skipped"] = True
+                        elif target == 'class':
+                            entry.update(measure(lambda: run_class(algorithm, request_data, mode), repeat))
+                        else:
+                            entry.update(measure(lambda: run_route(client, algorithm, request_data, mode), repeat))
+                        results.append(entry)
+                        print(format_entry(entry), file=sys.stderr)
+    return results
+
+
+def format_entry(entry):
+    """
+    Zwraca opis pomiaru w postaci jednej linii tekstu.
+    """
+    name = f"{entry['target']:<5} {entry['algorithm']:<12} {entry['mode']:<6} {entry['generator']:<13} V={entry['vertices']:<6} E={entry['edges']:<8}"
+    if entry.get("skipped"):
+        return f'{name} pominiety (szacowany koszt powyzej limitu)'
+    return f"{name} {entry['wall_time']:10.4f} s {entry['peak_memory'] / 1024:10.1f} KiB {entry['response_bytes']:>12} B"
+
+
+def entry_key(entry):
+    """
+    Zwraca klucz identyfikujacy pomiar - pozwala dopasowac pomiary z dwoch uruchomien.
+    """
+    return (entry["target"], entry["algorithm"], entry["mode"], entry["generator"], entry["vertices"], entry["edges"])
+
+
+def compare(previous, current, threshold):
+    """
+    Porownuje dwa uruchomienia i zwraca liste regresji - pomiarow, dla ktorych stosunek nowej wartosci do poprzedniej przekracza threshold.
+    """
+    previous_entries = {entry_key(entry): entry for entry in previous["results"] if not entry.get("skipped")}
+    regressions = list()
+    for entry in current["results"]:
+        old = previous_entries.get(entry_key(entry))
+        if old is None or entry.get("skipped"):
+            continue
+        for metric in METRICS:
+            if metric == 'wall_time' and max(old[metric], entry[metric]) < MIN_COMPARABLE_TIME:
+                continue
+            ratio = entry[metric] / old[metric] if old[metric] else (1.0 if not entry[metric] else float('inf'))
+            if ratio > threshold:
+                regressions.append({"key": entry_key(entry), "metric": metric, "previous": old[metric], "current": entry[metric], "ratio": ratio})
+    return regressions
+
+
+def parse_list(value):
+    """
+    Zamienia liste wartosci rozdzielonych przecinkami na liste napisow.
+    """
+    return [item for item in value.split(',') if item]
+
+
+def main(arguments=None):
+    """
+    Obsluguje polecenia run (wykonanie pomiarow) oraz compare (porownanie dwoch uruchomien).
+    """
+    parser = argparse.ArgumentParser(description='Testy wydajnosci algorytmow grafowych.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='wykonuje pomiary')
+    run_parser.add_argument('--sizes', type=lambda value: [int(size) for size in parse_list(value)], default=[50, 100, 200])
+    run_parser.add_argument('--generators', type=parse_list, default=list(GENERATORS))
+    run_parser.add_argument('--algorithms', type=parse_list, default=list(ALGORITHMS))
+    run_parser.add_argument('--targets', type=parse_list, default=['class', 'route'])
+    run_parser.add_argument('--modes', type=parse_list, default=['steps', 'result'])
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--max-cost', type=float, default=5 * 10 ** 7)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', help='plik JSON z wynikami (domyslnie standardowe wyjscie)')
+
+    compare_parser = commands.add_parser('compare', help='porownuje dwa uruchomienia i wskazuje regresje')
+    compare_parser.add_argument('previous')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=1.25)
+
+    arguments = parser.parse_args(arguments)
+    if arguments.command == 'run':
+        unknown = set(arguments.generators) - set(GENERATORS) or set(arguments.algorithms) - set(ALGORITHMS)
+        if unknown:
+            parser.error(f'nieznane nazwy: {", ".join(sorted(unknown))}')
+        results = run(arguments.sizes, arguments.generators, arguments.algorithms, arguments.targets,
+                      arguments.modes, arguments.repeat, arguments.max_cost, arguments.seed)
+        report = {
+            "meta": {"python": platform.python_version(), "platform": platform.platform(), "created_at": time.time(), "seed": arguments.seed},
+            "results": results
+        }
+        if arguments.output:
+            with open(arguments.output, 'w') as file:
+                json.dump(report, file, indent=2)
+        else:
+            json.dump(report, sys.stdout, indent=2)
+        return 0
+
+    with open(arguments.previous) as file:
+        previous = json.load(file)
+    with open(arguments.current) as file:
+        current = json.load(file)
+    regressions = compare(previous, current, arguments.threshold)
+    for regression in regressions:
+        print(f"REGRESJA {' '.join(map(str, regression['key']))}: {regression['metric']} "
+              f"{regression['previous']} -> {regression['current']} ({regression['ratio']:.2f}x)")
+    if not regressions:
+        print('Brak regresji.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class StoredCursor:
+    """
+    Klasa reprezentujaca kursor krokow przechowywany miedzy zapytaniami o kolejne strony wraz z czasem wygasniecia.
+    """
+    def __init__(self, cursor, expires_at):
+        """
+        Tworzy wpis przechowywanego kursora.
+        """
+        self.cursor = cursor
+        self.expires_at = expires_at
+
+
+class CursorStore:
+    """
+    Klasa reprezentujaca magazyn wstrzymanych wykonan algorytmow, pozwalajacy kontynuowac obliczenia od ostatnio pobranej strony krokow.
+    Kursor jest wyjmowany z magazynu na czas obslugi zapytania, dzieki czemu rownolegle zapytania nie wspoldziela stanu algorytmu.
+    Kursor wygasa po ttl sekundach od ostatniego uzycia. Po przekroczeniu max_cursors usuwane sa najdawniej uzywane kursory.
+    Wykonania usuwanych kursorow sa konczone (StepCursor.close), dzieki czemu nie przetrzymuja zasobow do czasu odsmiecania pamieci.
+    """
+    def __init__(self, ttl=600, max_cursors=64):
+        """
+        Tworzy pusty magazyn kursorow.
+        """
+        self.ttl = ttl
+        self.max_cursors = max_cursors
+        self.cursors = OrderedDict()
+        self.lock = threading.Lock()
+
+    def purge(self, now):
+        """
+        Usuwa kursory, ktorych czas wygasniecia minal, i zwraca ich liste. Kursory sa uporzadkowane wedlug czasu ostatniego uzycia.
+        """
+        removed = list()
+        while self.cursors:
+            key, stored = next(iter(self.cursors.items()))
+            if stored.expires_at > now and len(self.cursors) <= self.max_cursors:
+                break
+            del self.cursors[key]
+            removed.append(stored.cursor)
+        return removed
+
+    def close(self, cursors):
+        """
+        Konczy wykonania usunietych kursorow - poza blokada, poniewaz moze to wymagac zakonczenia procesow algorytmu.
+        """
+        for cursor in cursors:
+            cursor.close()
+
+    def take(self, key, from_step):
+        """
+        Wyjmuje z magazynu kursor o wskazanym kluczu, jesli pozwala on kontynuowac obliczenia od kroku from_step. W przeciwnym razie zwraca None.
+        """
+        with self.lock:
+            removed = self.purge(time.monotonic())
+            stored = self.cursors.get(key)
+            if stored is not None and stored.cursor.can_reach(from_step):
+                del self.cursors[key]
+            else:
+                stored = None
+        self.close(removed)
+        return stored.cursor if stored is not None else None
+
+    def put(self, key, cursor):
+        """
+        Odklada kursor do magazynu. Kursory zakonczonych wykonan nie sa przechowywane.
+        """
+        if cursor.finished:
+            cursor.close()
+            return
+        now = time.monotonic()
+        with self.lock:
+            replaced = self.cursors.pop(key, None)
+            self.cursors[key] = StoredCursor(cursor, now + self.ttl)
+            removed = self.purge(now)
+        self.close(removed + ([replaced.cursor] if replaced is not None else []))
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from models.compact_graph import CompactGraph
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Typ tresci zapytania z grafem w postaci binarnej oraz typ odpowiedzi MessagePack
+PACKED_MIMETYPE = 'application/vnd.graph.packed'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# Naglowek postaci binarnej: sygnatura, wersja, flagi, liczba wierzcholkow, liczba lukow, dlugosc pol zapytania (JSON)
+PACKED_HEADER = struct.Struct('<4sHHIII4x')
+PACKED_MAGIC = b'GRPK'
+PACKED_VERSION = 1
+
+# Flagi naglowka - graf zawiera wagi oraz wagi sa liczbami rzeczywistymi (float64) zamiast calkowitych (int32)
+FLAG_WEIGHTS = 1
+FLAG_FLOAT_WEIGHTS = 2
+
+# Pola zapytania przenoszone w tablicach, a nie w czesci JSON postaci binarnej
+GRAPH_FIELDS = ('vertices', 'adjacency_list', 'weights')
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def align(position):
+    """
+    Zwraca najblizsza pozycje podzielna przez 8, nie mniejsza niz wskazana.
+    """
+    return (position + 7) & ~7
+
+
+def typed_view(view, typecode):
+    """
+    Zwraca widok bajtow jako tablice elementow wskazanego typu (little-endian). Na maszynach little-endian widok nie kopiuje danych.
+    """
+    if sys.byteorder == 'little':
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
+
+
+def pack_graph(request_data):
+    """
+    Zamienia pola zapytania JSON na postac binarna: naglowek, tablice przesuniec i sasiadow (int32), wyrownanie do 8 bajtow,
+    tablice wag (int32 lub float64) oraz pozostale pola zapytania w postaci JSON. Wierzcholki musza byc oznaczone kolejnymi indeksami 0..V-1.
+    """
+    vertices, adjacency_list, weights = (request_data.get(name) for name in GRAPH_FIELDS)
+    if list(vertices) != list(range(len(vertices))):
+        raise ValueError('Postac binarna wymaga wierzcholkow oznaczonych kolejnymi indeksami 0..V-1.')
+    core = CompactGraph(vertices, adjacency_list, weights)
+
+    flags = 0
+    weight_values = None
+    if weights is not None:
+        flags |= FLAG_WEIGHTS
+        integer = core.weight_format() == 'q' and all(INT32_MIN <= weight <= INT32_MAX for weight in core.weights)
+        if not integer:
+            flags |= FLAG_FLOAT_WEIGHTS
+        weight_values = array('i' if integer else 'd', core.weights)
+
+    params = json.dumps({name: value for name, value in request_data.items() if name not in GRAPH_FIELDS}).encode('utf-8')
+    body = bytearray(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, flags, core.vertex_count(), core.arc_count(), len(params)))
+    for values in (array('i', core.offsets), array('i', core.targets)):
+        if sys.byteorder != 'little':
+            values.byteswap()
+        body += values.tobytes()
+    body += bytes(align(len(body)) - len(body))
+    if weight_values is not None:
+        if sys.byteorder != 'little':
+            weight_values.byteswap()
+        body += weight_values.tobytes()
+    return bytes(body + params)
+
+
+def unpack_graph(body):
+    """
+    Odczytuje graf w postaci binarnej. Zwraca pola zapytania, zwarta reprezentacje grafu, ktorej tablice sa widokami na tresc zapytania
+    (bez kopiowania), oraz skrot SHA-256 czesci binarnej, identyfikujacy graf w pamieci podrecznej wynikow.
+    """
+    view = memoryview(body)
+    if len(view) < PACKED_HEADER.size:
+        raise ValueError('Tresc zapytania jest krotsza niz naglowek postaci binarnej grafu.')
+    magic, version, flags, vertex_count, arc_count, params_length = PACKED_HEADER.unpack_from(view)
+    if magic != PACKED_MAGIC or version != PACKED_VERSION:
+        raise ValueError('Nieobslugiwana postac binarna grafu.')
+
+    position = PACKED_HEADER.size
+    offsets_end = position + 4 * (vertex_count + 1)
+    targets_end = offsets_end + 4 * arc_count
+    weights_start = align(targets_end)
+    weights_end = weights_start
+    if flags & FLAG_WEIGHTS:
+        weights_end += (8 if flags & FLAG_FLOAT_WEIGHTS else 4) * arc_count
+    if len(view) != weights_end + params_length:
+        raise ValueError('Rozmiar tresci zapytania nie odpowiada naglowkowi postaci binarnej grafu.')
+
+    weights = None
+    if flags & FLAG_WEIGHTS:
+        weights = typed_view(view[weights_start:weights_end], 'd' if flags & FLAG_FLOAT_WEIGHTS else 'i')
+    core = CompactGraph.from_arrays(typed_view(view[position:offsets_end], 'i'), typed_view(view[offsets_end:targets_end], 'i'), weights)
+
+    request_data = json.loads(view[weights_end:].tobytes() or b'{}')
+    if not isinstance(request_data, dict):
+        raise ValueError('Pola zapytania w postaci binarnej musza byc obiektem JSON.')
+    return request_data, core, hashlib.sha256(view[:weights_end]).hexdigest()
+
+
+def pack_response(payload):
+    """
+    Zwraca tresc odpowiedzi w formacie MessagePack - tych samych danych, ktore w formacie JSON zwraca jsonify.
+    """
+    return msgpack.packb(payload, use_bin_type=True)
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from models.compact_graph import CompactGraph
+from models.incremental import GraphEditor, IncrementalShortestPaths, IncrementalSpanningForest, validate
+
+
+# Algorytmy, ktorych wyniki moga byc aktualizowane przyrostowo po edycji przechowywanego grafu
+TRACKED_ALGORITHMS = ('Dijkstra', 'Kruskal')
+
+
+class UnknownGraphError(LookupError):
+    """
+    Wyjatek zglaszany, gdy graf o wskazanym identyfikatorze nie istnieje lub wygasl.
+    """
+
+
+def graph_fingerprint(vertices, adjacency_list, weights=None):
+    """
+    Zwraca skrot SHA-256 kanonicznej postaci JSON grafu.
+    """
+    canonical = json.dumps([vertices, adjacency_list, weights], separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def edited_fingerprint(fingerprint, edits):
+    """
+    Zwraca skrot grafu po edycji - skrot SHA-256 skrotu grafu sprzed edycji oraz kanonicznej postaci JSON listy edycji.
+    """
+    canonical = json.dumps([fingerprint, edits], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def tracked_key(request_data):
+    """
+    Zwraca klucz sledzonego wyniku - nazwe algorytmu oraz wierzcholek startowy (None dla algorytmu Kruskala).
+    """
+    algorithm = request_data.get('algorithm')
+    if algorithm not in TRACKED_ALGORITHMS:
+        raise ValueError(f'Przyrostowo aktualizowane moga byc jedynie wyniki algorytmow: {", ".join(TRACKED_ALGORITHMS)}.')
+    return (algorithm, request_data.get('start_vertex', 0) if algorithm == 'Dijkstra' else None)
+
+
+def tracked_status(key, tracked):
+    """
+    Zwraca sledzony wynik w postaci trybu result wraz z nazwa algorytmu oraz informacja, czy zostal zaktualizowany przyrostowo.
+    """
+    algorithm, start_vertex = key
+    status = {"algorithm": algorithm, **tracked.result(), "incremental": tracked.incremental}
+    if start_vertex is not None:
+        status["start_vertex"] = start_vertex
+        status["relaxed_vertices"] = tracked.relaxed_vertices
+    return status
+
+
+class StoredGraph:
+    """
+    Klasa reprezentujaca graf przechowywany po stronie serwera - jego zwarta reprezentacje, skrot oraz czas wygasniecia.
+    """
+    def __init__(self, graph_id, core, fingerprint, expires_at):
+        """
+        Tworzy wpis przechowywanego grafu.
+        """
+        self.graph_id = graph_id
+        self.core = core
+        self.fingerprint = fingerprint
+        self.expires_at = expires_at
+        self.tracked = dict()
+        self.lock = threading.Lock()
+
+
+class GraphStore:
+    """
+    Klasa reprezentujaca magazyn grafow przeslanych jednokrotnie i wykorzystywanych przez wiele algorytmow.
+    Graf wygasa po ttl sekundach od ostatniego uzycia. Po przekroczeniu max_graphs usuwane sa najdawniej uzywane grafy.
+    """
+    def __init__(self, ttl=3600, max_graphs=1024, max_tracked=16):
+        """
+        Tworzy pusty magazyn grafow. Dla kazdego grafu przyrostowo aktualizowanych jest co najwyzej max_tracked wynikow.
+        """
+        self.ttl = ttl
+        self.max_graphs = max_graphs
+        self.max_tracked = max_tracked
+        self.graphs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def purge(self, now):
+        """
+        Usuwa grafy, ktorych czas wygasniecia minal. Grafy sa uporzadkowane wedlug czasu ostatniego uzycia.
+        """
+        while self.graphs:
+            graph_id, stored = next(iter(self.graphs.items()))
+            if stored.expires_at > now and len(self.graphs) <= self.max_graphs:
+                break
+            del self.graphs[graph_id]
+
+    def add(self, vertices, adjacency_list, weights=None):
+        """
+        Tworzy (i tym samym sprawdza poprawnosc) zwarta reprezentacje grafu, zapisuje ja w magazynie oraz zwraca wpis z nadanym identyfikatorem.
+        """
+        core = CompactGraph(vertices, adjacency_list, weights)
+        return self.add_core(core, graph_fingerprint(vertices, adjacency_list, weights))
+
+    def add_core(self, core, fingerprint):
+        """
+        Zapisuje gotowa zwarta reprezentacje grafu w magazynie oraz zwraca wpis z nadanym identyfikatorem.
+        """
+        now = time.monotonic()
+        stored = StoredGraph(uuid.uuid4().hex, core, fingerprint, now + self.ttl)
+        with self.lock:
+            self.graphs[stored.graph_id] = stored
+            self.purge(now)
+        return stored
+
+    def get(self, graph_id):
+        """
+        Zwraca wpis grafu o wskazanym identyfikatorze i przedluza jego waznosc.
+        """
+        now = time.monotonic()
+        with self.lock:
+            self.purge(now)
+            stored = self.graphs.get(graph_id)
+            if stored is None:
+                raise UnknownGraphError(f'Graf o identyfikatorze {graph_id} nie istnieje lub wygasl.')
+            stored.expires_at = now + self.ttl
+            self.graphs.move_to_end(graph_id)
+        return stored
+
+    def remove(self, graph_id):
+        """
+        Usuwa graf o wskazanym identyfikatorze.
+        """
+        with self.lock:
+            if self.graphs.pop(graph_id, None) is None:
+                raise UnknownGraphError(f'Graf o identyfikatorze {graph_id} nie istnieje lub wygasl.')
+
+    def edit(self, graph_id, edits, track=(), validate_results=False):
+        """
+        Nanosi edycje krawedzi na przechowywany graf oraz aktualizuje przyrostowo sledzone wyniki - drzewa najkrotszych drog
+        algorytmu Dijkstry oraz minimalny las rozpinajacy. Wyniki z listy track, ktore nie sa jeszcze sledzone, sa wyznaczane
+        na grafie sprzed edycji. Gdy validate_results jest ustawione, kazdy wynik jest porownywany z wyznaczonym od poczatku
+        (i w razie niezgodnosci zastepowany nim). Zwraca wpis grafu, liste sledzonych wynikow oraz liste niezgodnosci.
+        """
+        if not isinstance(edits, list) or not isinstance(track, list):
+            raise ValueError('Pola edits oraz track musza byc listami.')
+        stored = self.get(graph_id)
+        with stored.lock:
+            for request_data in track:
+                key = tracked_key(request_data)
+                if key in stored.tracked:
+                    continue
+                if len(stored.tracked) >= self.max_tracked:
+                    raise ValueError(f'Dla jednego grafu mozna sledzic co najwyzej {self.max_tracked} wynikow.')
+                if stored.core.weights is None:
+                    raise ValueError('Wybrany algorytm wymaga grafu z wagami krawedzi.')
+                if key[0] == 'Dijkstra':
+                    stored.tracked[key] = IncrementalShortestPaths(stored.core, key[1])
+                else:
+                    stored.tracked[key] = IncrementalSpanningForest(stored.core)
+
+            # Las rozpinajacy jest aktualizowany po kazdej edycji, dlatego wymaga list sasiedztwa z chwili jej naniesienia
+            editor = GraphEditor(stored.core)
+            forests = list()
+            if stored.core.weights is not None and stored.core.is_undirected():
+                forests = [tracked for tracked in stored.tracked.values() if isinstance(tracked, IncrementalSpanningForest)]
+            try:
+                for edit in edits:
+                    change = editor.apply(edit)
+                    for forest in forests:
+                        forest.apply(change, editor)
+            except ValueError:
+                for forest in forests:
+                    forest.recompute(stored.core)
+                raise
+            core = editor.build()
+
+            # Zmiana typu wag (z calkowitych na rzeczywiste) zmienia postac wynikow, ktore sa wtedy wyznaczane od poczatku
+            retyped = core.weights is not None and (core.weight_format() == 'd') != (stored.core.weight_format() == 'd')
+            errors = list()
+            for tracked in stored.tracked.values():
+                if retyped or (isinstance(tracked, IncrementalSpanningForest) and tracked not in forests):
+                    tracked.recompute(core)
+                elif isinstance(tracked, IncrementalShortestPaths):
+                    tracked.update(core, editor.touched)
+                if validate_results:
+                    mismatches = validate(tracked, core)
+                    if mismatches:
+                        tracked.recompute(core)
+                        errors.extend(mismatches)
+
+            stored.core = core
+            stored.fingerprint = edited_fingerprint(stored.fingerprint, edits)
+            results = [tracked_status(key, tracked) for key, tracked in stored.tracked.items()]
+        return stored, results, errors
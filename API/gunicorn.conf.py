@@ -0,0 +1,34 @@
+"""
+Konfiguracja serwera gunicorn dla srodowiska produkcyjnego. Uruchomienie (z katalogu API): gunicorn -c gunicorn.conf.py wsgi:app
+Wszystkie ustawienia mozna zmienic zmiennymi srodowiskowymi.
+
+Kazdy proces roboczy ma wlasna pamiec - przechowywane grafy (/api/graphs), zadania (/api/jobs), kursory krokow, pamiec podreczna
+wynikow oraz metryki nie sa wspoldzielone miedzy procesami. Dlatego domyslnie uruchamiany jest jeden proces z wieloma watkami
+(WEB_THREADS), a dlugie obliczenia sa wykonywane w osobnych procesach (/api/jobs, /api/batch). Wiecej procesow (WEB_CONCURRENCY)
+mozna uruchomic jedynie wtedy, gdy zapytania klienta sa zawsze kierowane do tego samego procesu.
+Pamiec podreczna wynikow moze byc wspoldzielona przez katalog RESULT_CACHE_DIR (o rozmiarze ograniczonym przez RESULT_CACHE_DISK_MAX_BYTES).
+"""
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+
+# Jeden proces - stan aplikacji (grafy, zadania, kursory) jest przechowywany w jego pamieci
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('WEB_THREADS', 8))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Aplikacja (w tym kompresja plikow statycznych) jest tworzona raz, przed utworzeniem procesow roboczych - procesy wspoldziela
+# jej pamiec (kopiowanie przy zapisie), a uruchomienie kolejnego procesu nie wymaga ponownego importu Flask i NumPy
+preload_app = os.environ.get('PRELOAD_APP', '1') == '1'
+
+# Wykonanie algorytmu na duzym grafie moze trwac dlugo - dluzsze obliczenia powinny korzystac z /api/jobs
+timeout = int(os.environ.get('WEB_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('WEB_KEEPALIVE', 5))
+
+# Okresowe zastepowanie procesu roboczego ogranicza wzrost zuzycia pamieci, ale usuwa caly stan aplikacji - domyslnie wylaczone
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('WEB_MAX_REQUESTS_JITTER', 0))
+
+accesslog = os.environ.get('WEB_ACCESS_LOG', '-')
+loglevel = os.environ.get('WEB_LOG_LEVEL', 'info')
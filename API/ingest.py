@@ -0,0 +1,236 @@
+import codecs
+import hashlib
+import json
+from array import array
+from models.compact_graph import CompactGraph
+
+
+# Rozmiar fragmentu tresci zapytania wczytywanego jednorazowo (w bajtach)
+CHUNK_SIZE = 64 * 1024
+
+# Biale znaki dopuszczalne miedzy elementami JSON
+WHITESPACE = ' \t\n\r'
+
+
+class GraphTooLargeError(ValueError):
+    """
+    Wyjatek zglaszany, gdy graf przekracza dopuszczalna liczbe wierzcholkow lub lukow.
+    """
+
+
+def check_limits(vertex_count, arc_count, max_vertices, max_arcs):
+    """
+    Sprawdza, czy liczba wierzcholkow oraz lukow grafu nie przekracza limitow (None oznacza brak limitu).
+    """
+    if max_vertices is not None and vertex_count > max_vertices:
+        raise GraphTooLargeError(f'Liczba wierzcholkow grafu przekracza limit ({max_vertices}).')
+    if max_arcs is not None and arc_count > max_arcs:
+        raise GraphTooLargeError(f'Liczba lukow grafu przekracza limit ({max_arcs}).')
+
+
+class JsonStream:
+    """
+    Klasa reprezentujaca tresc JSON wczytywana fragmentami ze strumienia. W pamieci przechowywana jest jedynie nieprzetworzona
+    czesc tresci, a pojedyncze wartosci sa dekodowane dekoderem modulu json (w jezyku C).
+    """
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        """
+        Tworzy obiekt odczytujacy wskazany strumien bajtow (UTF-8).
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.finished = False
+
+    def fill(self, size=None):
+        """
+        Usuwa z bufora przetworzona czesc tresci i dopisuje kolejny fragment strumienia. Zwraca False, jesli strumien sie skonczyl.
+        """
+        if self.finished:
+            return False
+        chunk = self.stream.read(size or self.chunk_size)
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(chunk, final=not chunk)
+        self.position = 0
+        self.finished = not chunk
+        return True
+
+    def peek(self):
+        """
+        Zwraca pierwszy znak po bialych znakach (bez jego pobierania) lub pusty napis na koncu tresci.
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ''
+
+    def expect(self, characters):
+        """
+        Pobiera kolejny znak (po bialych znakach), ktory musi byc jednym ze wskazanych znakow, i go zwraca.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(f"Niepoprawna tresc JSON: oczekiwano jednego ze znakow {' '.join(characters)}.")
+        self.position += 1
+        return character
+
+    def value(self):
+        """
+        Dekoduje i pobiera kolejna wartosc JSON. Niekompletna wartosc (lub liczba konczaca sie na koncu bufora) powoduje
+        wczytanie kolejnego fragmentu - o rozmiarze co najmniej dotychczasowego bufora, dzieki czemu duze wartosci
+        sa dekodowane ponownie jedynie logarytmiczna liczbe razy.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+                if end < len(self.buffer) or self.finished:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError as error:
+                if self.finished:
+                    raise ValueError(f'Niepoprawna tresc JSON: {error.msg}.')
+            self.fill(max(self.chunk_size, len(self.buffer) - self.position))
+
+    def rows(self):
+        """
+        Generator kolejnych elementow tablicy JSON, z ktorych kazdy musi byc tablica (np. lista sasiedztwa jednego wierzcholka).
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.position += 1
+            return
+        while True:
+            row = self.value()
+            if not isinstance(row, list):
+                raise ValueError('Elementy list sasiedztwa oraz wag musza byc tablicami.')
+            yield row
+            if self.expect(',]') == ']':
+                return
+
+
+def extend(values, row, fallback):
+    """
+    Dopisuje wiersz do tablicy. Jesli element nie miesci sie w typie tablicy, zwraca tablice przekonwertowana funkcja fallback
+    (np. z liczb calkowitych na rzeczywiste) z dopisanym wierszem.
+    """
+    length = len(values)
+    try:
+        values.extend(row)
+        return values
+    except (TypeError, OverflowError):
+        # Elementy dopisane przed napotkaniem niepasujacego elementu sa usuwane
+        del values[length:]
+    values = fallback(values)
+    try:
+        values.extend(row)
+    except TypeError:
+        raise ValueError('Wagi krawedzi musza byc liczbami.')
+    return values
+
+
+class GraphReader:
+    """
+    Klasa wczytujaca zapytanie JSON z grafem bezposrednio ze strumienia do tablic zwartej reprezentacji grafu (CSR) - bez tworzenia
+    zagniezdzonych list adjacency_list oraz weights dla calego grafu. W pamieci jest jednoczesnie co najwyzej jeden wiersz tych list.
+    Limity liczby wierzcholkow i lukow sa sprawdzane w trakcie wczytywania, dlatego zbyt duzy graf jest odrzucany bez wczytywania reszty tresci.
+    Kolejnosc pol zapytania jest dowolna - sasiedzi wczytani przed polem vertices sa zamieniani na indeksy po jego wczytaniu.
+    """
+    def __init__(self, max_vertices=None, max_arcs=None, chunk_size=CHUNK_SIZE):
+        """
+        Tworzy obiekt wczytujacy grafy o wskazanych limitach liczby wierzcholkow oraz lukow fragmentami po chunk_size bajtow.
+        """
+        self.max_vertices = max_vertices
+        self.max_arcs = max_arcs
+        self.chunk_size = chunk_size
+
+    def read(self, stream):
+        """
+        Wczytuje zapytanie ze strumienia. Zwraca pozostale pola zapytania, zwarta reprezentacje grafu oraz jej skrot SHA-256
+        (lub None, None, gdy zapytanie nie zawiera grafu, np. zawiera jedynie pole graph_id).
+        """
+        source = JsonStream(stream, self.chunk_size)
+        request_data = dict()
+        labels = weights = None
+        offsets, targets = array('q', [0]), array('q')
+        weight_offsets = array('q', [0])
+
+        source.expect('{')
+        if source.peek() == '}':
+            source.position += 1
+        else:
+            while True:
+                key = source.value()
+                if not isinstance(key, str):
+                    raise ValueError('Niepoprawna tresc JSON: klucz obiektu musi byc napisem.')
+                source.expect(':')
+                if key == 'vertices':
+                    labels = source.value()
+                    if not isinstance(labels, list):
+                        raise ValueError('Pole vertices musi byc lista wierzcholkow.')
+                    check_limits(len(labels), 0, self.max_vertices, None)
+                elif key == 'adjacency_list':
+                    # Etykiety sasiadow sa zamieniane na indeksy po wczytaniu calego zapytania (pole vertices moze wystapic pozniej)
+                    for row in source.rows():
+                        targets = extend(targets, row, list)
+                        offsets.append(len(targets))
+                        check_limits(len(offsets) - 1, len(targets), self.max_vertices, self.max_arcs)
+                elif key == 'weights':
+                    weights = array('q')
+                    for row in source.rows():
+                        weights = extend(weights, row, lambda values: array('d', values))
+                        weight_offsets.append(len(weights))
+                        check_limits(len(weight_offsets) - 1, len(weights), self.max_vertices, self.max_arcs)
+                else:
+                    request_data[key] = source.value()
+                if source.expect(',}') == '}':
+                    break
+        if source.peek():
+            raise ValueError('Niepoprawna tresc JSON: nadmiarowe dane po obiekcie zapytania.')
+
+        if labels is None and len(offsets) == 1 and weights is None:
+            return request_data, None, None
+        return request_data, *self.build(labels, offsets, targets, weights, weight_offsets)
+
+    def resolve(self, targets, labels):
+        """
+        Zamienia etykiety sasiadow na indeksy wierzcholkow. Jesli etykietami sa kolejne indeksy 0..V-1 (najczestszy przypadek),
+        sprawdzany jest jedynie ich zakres, bez tworzenia nowej tablicy.
+        """
+        if isinstance(targets, array) and labels == list(range(len(labels))):
+            if len(targets) and (min(targets) < 0 or max(targets) >= len(labels)):
+                unknown = next(target for target in targets if not 0 <= target < len(labels))
+                raise ValueError(f'Nieznany wierzcholek na liscie sasiedztwa: {unknown}.')
+            return targets
+
+        index_of = {label: i for i, label in enumerate(labels)}
+        try:
+            return array('q', map(index_of.__getitem__, targets))
+        except KeyError as error:
+            raise ValueError(f'Nieznany wierzcholek na liscie sasiedztwa: {error.args[0]}.')
+
+    def build(self, labels, offsets, targets, weights, weight_offsets):
+        """
+        Sprawdza zgodnosc wczytanych tablic i zwraca zwarta reprezentacje grafu oraz jej skrot.
+        """
+        if labels is None:
+            raise ValueError('Zapytanie nie zawiera listy wierzcholkow (pole vertices).')
+        if len(offsets) - 1 != len(labels):
+            raise ValueError('Liczba list sasiedztwa musi byc rowna liczbie wierzcholkow.')
+        if weights is not None and len(weight_offsets) != len(offsets):
+            raise ValueError('Liczba list wag musi byc rowna liczbie list sasiedztwa.')
+        if weights is not None and weight_offsets != offsets:
+            raise ValueError('Kazdy sasiad wierzcholka musi miec przypisana wage.')
+
+        targets = self.resolve(targets, labels)
+        core = CompactGraph.from_arrays(offsets, targets, weights, labels)
+        digest = hashlib.sha256(json.dumps(labels, separators=(',', ':')).encode('utf-8'))
+        for values in (offsets, targets) if weights is None else (offsets, targets, weights):
+            digest.update(values.typecode.encode('ascii'))
+            digest.update(values.tobytes())
+        return core, digest.hexdigest()
@@ -0,0 +1,275 @@
+import json
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from algorithms import PAGING_FIELDS, create_graph, paging_range
+from models.step_cursor import StepCursor
+
+
+# Stany zadania - zadanie w stanie koncowym nie zmienia juz stanu
+QUEUED, RUNNING, DONE, FAILED, TIMEOUT, CANCELLED = 'queued', 'running', 'done', 'failed', 'timeout', 'cancelled'
+FINAL_STATES = (DONE, FAILED, TIMEOUT, CANCELLED)
+
+
+class UnknownJobError(LookupError):
+    """
+    Wyjatek zglaszany, gdy zadanie o wskazanym identyfikatorze nie istnieje lub zostalo juz usuniete.
+    """
+
+
+class JobRejectedError(RuntimeError):
+    """
+    Wyjatek zglaszany, gdy zadanie nie zostalo przyjete - jego szacowany koszt przekracza limit (retryable False)
+    lub kolejka zadan jest pelna i warto ponowic probe pozniej (retryable True).
+    """
+    def __init__(self, message, retryable):
+        """
+        Tworzy wyjatek z komunikatem oraz informacja, czy ponowienie zgloszenia ma sens.
+        """
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def estimate_cost(algorithm, vertex_count, arc_count, request_data):
+    """
+    Zwraca szacowany koszt wykonania algorytmu (liczbe operacji elementarnych) na podstawie liczby wierzcholkow i lukow grafu.
+    Kazdy krok wizualizacji jest migawka rozmiaru O(V + E), dlatego w trybie krokow praca algorytmu jest mnozona przez rozmiar kroku.
+    """
+    size = vertex_count + arc_count
+    work = vertex_count * max(arc_count, 1) if algorithm == 'BellmanFord' else size
+    if request_data.get('mode', 'steps') == 'result':
+        return work
+    if any(name in request_data for name in PAGING_FIELDS):
+        _, limit = paging_range(request_data)
+        return work + limit * size
+    return work * size
+
+
+def job_body(algorithm, request_data, core):
+    """
+    Wykonuje algorytm i zwraca tresc (JSON) oraz naglowki odpowiedzi - w tym samym formacie, co synchroniczne punkty koncowe.
+    """
+    graph = create_graph(algorithm, core, request_data)
+    headers = dict()
+    if request_data.get('mode', 'steps') == 'result':
+        payload = graph.compute_result()
+    elif any(name in request_data for name in PAGING_FIELDS):
+        from_step, limit = paging_range(request_data)
+        cursor = StepCursor(graph)
+        payload = cursor.page(from_step, limit)
+        headers['X-Step-From'] = str(from_step)
+        headers['X-Step-Count'] = str(len(payload))
+        headers['X-Has-More-Steps'] = 'false' if cursor.finished else 'true'
+        cursor.close()
+    else:
+        payload = graph.collect_steps()
+
+    memory = core.memory_usage()
+    headers['X-Graph-Memory-Bytes'] = str(memory['bytes'])
+    headers['X-Graph-Bytes-Per-Edge'] = f"{memory['bytes_per_edge']:.2f}"
+    body = json.dumps(payload, separators=(',', ':'), sort_keys=True) + '\n'
+    return body.encode('utf-8'), headers
+
+
+def execute_job(algorithm, request_data, core, connection):
+    """
+    Funkcja wykonywana w osobnym procesie. Przesyla przez polaczenie pare (stan, wynik) - tresc z naglowkami lub komunikat bledu.
+    """
+    try:
+        connection.send((DONE, job_body(algorithm, request_data, core)))
+    except ValueError as error:
+        connection.send((FAILED, str(error)))
+    except Exception as error:
+        connection.send((FAILED, f'Blad wykonania algorytmu: {error!r}'))
+    finally:
+        connection.close()
+
+
+class Job:
+    """
+    Klasa reprezentujaca zadanie wykonania algorytmu w osobnym procesie wraz z jego stanem i wynikiem.
+    """
+    def __init__(self, algorithm, request_data, core, cost, timeout):
+        """
+        Tworzy zadanie oczekujace w kolejce.
+        """
+        self.job_id = uuid.uuid4().hex
+        self.algorithm = algorithm
+        self.request_data = request_data
+        self.core = core
+        self.cost = cost
+        self.timeout = timeout
+        self.state = QUEUED
+        self.error = None
+        self.body = None
+        self.headers = None
+        self.process = None
+        self.cancel_requested = False
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def status(self):
+        """
+        Zwraca opis stanu zadania.
+        """
+        status = {
+            "job_id": self.job_id,
+            "algorithm": self.algorithm,
+            "state": self.state,
+            "estimated_cost": self.cost,
+            "timeout": self.timeout,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+        if self.error is not None:
+            status["error"] = self.error
+        return status
+
+
+class JobManager:
+    """
+    Klasa zarzadzajaca zadaniami wykonywanymi w ograniczonej puli procesow (max_workers rownoczesnie wykonywanych zadan).
+    Kazde zadanie dziala w osobnym procesie, dzieki czemu moze zostac przerwane po przekroczeniu limitu czasu lub anulowane.
+    Zadania o szacowanym koszcie wiekszym niz max_cost sa odrzucane, podobnie jak nowe zadania przy max_pending oczekujacych zadaniach.
+    Zakonczone zadania sa przechowywane przez result_ttl sekund.
+    """
+    def __init__(self, max_workers=2, max_pending=32, max_cost=10 ** 11, timeout=300, result_ttl=600, poll_interval=0.1):
+        """
+        Tworzy menedzera zadan bez zadnych zadan.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_cost = max_cost
+        self.timeout = timeout
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.slots = threading.Semaphore(max_workers)
+        self.context = multiprocessing.get_context('spawn')
+
+    def purge(self, now):
+        """
+        Usuwa zakonczone zadania, ktorych wynik byl przechowywany dluzej niz result_ttl sekund.
+        """
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.state in FINAL_STATES and job.finished_at + self.result_ttl < now]:
+            del self.jobs[job_id]
+
+    def submit(self, algorithm, request_data, core, timeout=None):
+        """
+        Przyjmuje zadanie do wykonania (po sprawdzeniu limitu czasu, szacowanego kosztu zadania oraz zajetosci kolejki) i zwraca je.
+        """
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not timeout > 0):
+            raise ValueError('Pole timeout musi byc dodatnia liczba sekund.')
+        cost = estimate_cost(algorithm, core.vertex_count(), core.arc_count(), request_data)
+        if cost > self.max_cost:
+            raise JobRejectedError(f'Szacowany koszt zadania ({cost}) przekracza limit ({self.max_cost}).', retryable=False)
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        job = Job(algorithm, request_data, core, cost, timeout)
+
+        with self.lock:
+            self.purge(time.time())
+            pending = sum(1 for queued in self.jobs.values() if queued.state in (QUEUED, RUNNING))
+            if pending >= self.max_pending:
+                raise JobRejectedError('Kolejka zadan jest pelna - sprobuj ponownie pozniej.', retryable=True)
+            self.jobs[job.job_id] = job
+
+        threading.Thread(target=self.run_job, args=(job,), daemon=True).start()
+        return job
+
+    def get(self, job_id):
+        """
+        Zwraca zadanie o wskazanym identyfikatorze.
+        """
+        with self.lock:
+            self.purge(time.time())
+            job = self.jobs.get(job_id)
+        if job is None:
+            raise UnknownJobError(f'Zadanie o identyfikatorze {job_id} nie istnieje.')
+        return job
+
+    def cancel(self, job_id):
+        """
+        Anuluje zadanie - oczekujace nie zostanie uruchomione, a wykonywane zostanie przerwane. Zwraca zadanie.
+        """
+        job = self.get(job_id)
+        with self.lock:
+            if job.state == QUEUED:
+                self.finish(job, CANCELLED)
+            elif job.state == RUNNING:
+                job.cancel_requested = True
+        return job
+
+    def finish(self, job, state, error=None, result=None):
+        """
+        Przeprowadza zadanie do stanu koncowego. Wywolywana z zalozona blokada.
+        """
+        job.state = state
+        job.error = error
+        if result is not None:
+            job.body, job.headers = result
+        job.core = None
+        job.finished_at = time.time()
+
+    def run_job(self, job):
+        """
+        Watek nadzorujacy zadanie - czeka na wolne miejsce w puli, uruchamia proces i odbiera wynik, pilnujac limitu czasu oraz anulowania.
+        """
+        with self.slots:
+            with self.lock:
+                if job.state != QUEUED:
+                    return
+                job.state = RUNNING
+                job.started_at = time.time()
+
+            receiver, sender = self.context.Pipe(duplex=False)
+            job.process = self.context.Process(target=execute_job, args=(job.algorithm, job.request_data, job.core, sender), daemon=True)
+            try:
+                job.process.start()
+            except Exception as error:
+                receiver.close()
+                with self.lock:
+                    self.finish(job, FAILED, error=f'Nie udalo sie uruchomic procesu: {error!r}')
+                return
+            finally:
+                sender.close()
+
+            deadline = time.monotonic() + job.timeout
+            outcome = None
+            while outcome is None:
+                if receiver.poll(self.poll_interval):
+                    try:
+                        outcome = receiver.recv()
+                    except EOFError:
+                        outcome = (FAILED, 'Proces wykonujacy algorytm zakonczyl sie nieoczekiwanie.')
+                elif job.cancel_requested:
+                    outcome = (CANCELLED, None)
+                elif time.monotonic() > deadline:
+                    outcome = (TIMEOUT, f'Przekroczono limit czasu wykonania ({job.timeout} s).')
+
+            if job.process.is_alive():
+                job.process.terminate()
+            job.process.join()
+            receiver.close()
+
+            state, value = outcome
+            with self.lock:
+                if state == DONE:
+                    self.finish(job, DONE, result=value)
+                else:
+                    self.finish(job, state, error=value)
+
+    def stats(self):
+        """
+        Zwraca liczbe zadan w poszczegolnych stanach.
+        """
+        with self.lock:
+            counts = {state: 0 for state in (QUEUED, RUNNING) + FINAL_STATES}
+            for job in self.jobs.values():
+                counts[job.state] += 1
+        counts["max_workers"] = self.max_workers
+        return counts
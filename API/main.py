@@ -1,10 +1,92 @@
-from flask import Flask, request, jsonify
+import cProfile
+import gzip
+import os
+import tempfile
+import time
+import uuid
+from contextlib import nullcontext
+from flask import Flask, Response, g, json, request, jsonify, stream_with_context
 from flask_swagger_ui import get_swaggerui_blueprint
-from models.graph import BFSGraph, BellmanFordGraph, DFSGraph, KruskalGraph, PrimDijkstraGraph, DijkstraGraph
+from algorithms import ALGORITHMS, PAGING_FIELDS, WEIGHTED_ALGORITHMS, create_core, create_graph, paging_range
+from batch import BatchExecutor
+from cursor_store import CursorStore
+from formats import MSGPACK_MIMETYPE, PACKED_MIMETYPE, msgpack, pack_response, unpack_graph
+from graph_store import GraphStore, StoredGraph, UnknownGraphError
+from ingest import GraphReader, GraphTooLargeError, check_limits
+from job_manager import DONE, FINAL_STATES, JobManager, JobRejectedError, UnknownJobError
+from metrics import SIZE_BUCKETS, MetricsRegistry, PhaseTimer
+from models.all_pairs import AllPairsShortestPaths
+from models.boruvka import BoruvkaGraph
+from models.compact_graph import CompactGraph
+from models.messages import DEFAULT_LOCALE, catalog
+from models.step_cursor import StepCursor
+from result_cache import ResultCache, canonical_key
+from static_assets import StaticAssets
 
 app = Flask(__name__, template_folder='swagger/templates')
 app.config['RESTPLUS_MASK_SWAGGER'] = False
+app.config['RESULT_CACHE_MAX_BYTES'] = int(os.environ.get('RESULT_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+app.config['RESULT_CACHE_DIR'] = os.environ.get('RESULT_CACHE_DIR')
+app.config['RESULT_CACHE_DISK_MAX_BYTES'] = int(os.environ.get('RESULT_CACHE_DISK_MAX_BYTES', 1024 * 1024 * 1024))
+app.config['GRAPH_TTL_SECONDS'] = int(os.environ.get('GRAPH_TTL_SECONDS', 3600))
+app.config['MAX_STORED_GRAPHS'] = int(os.environ.get('MAX_STORED_GRAPHS', 1024))
+app.config['MAX_TRACKED_RESULTS'] = int(os.environ.get('MAX_TRACKED_RESULTS', 16))
+app.config['INCREMENTAL_VALIDATE'] = os.environ.get('INCREMENTAL_VALIDATE', '0') == '1'
+app.config['CURSOR_TTL_SECONDS'] = int(os.environ.get('CURSOR_TTL_SECONDS', 600))
+app.config['MAX_STEP_CURSORS'] = int(os.environ.get('MAX_STEP_CURSORS', 64))
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+app.config['JOB_MAX_PENDING'] = int(os.environ.get('JOB_MAX_PENDING', 32))
+app.config['JOB_MAX_COST'] = int(os.environ.get('JOB_MAX_COST', 10 ** 11))
+app.config['JOB_TIMEOUT_SECONDS'] = int(os.environ.get('JOB_TIMEOUT_SECONDS', 300))
+app.config['JOB_RESULT_TTL_SECONDS'] = int(os.environ.get('JOB_RESULT_TTL_SECONDS', 600))
+app.config['BATCH_WORKERS'] = int(os.environ.get('BATCH_WORKERS', os.cpu_count() or 1))
+app.config['BATCH_MAX_RUNS'] = int(os.environ.get('BATCH_MAX_RUNS', 256))
+app.config['BORUVKA_WORKERS'] = int(os.environ.get('BORUVKA_WORKERS', os.cpu_count() or 1))
+app.config['COMPRESS_MIN_BYTES'] = int(os.environ.get('COMPRESS_MIN_BYTES', 64 * 1024))
+app.config['COMPRESS_LEVEL'] = int(os.environ.get('COMPRESS_LEVEL', 6))
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', '1') == '1'
+app.config['PROFILING_ENABLED'] = os.environ.get('PROFILING_ENABLED', '0') == '1'
+app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR', tempfile.gettempdir())
+app.config['STATIC_MAX_AGE'] = int(os.environ.get('STATIC_MAX_AGE', 7 * 24 * 3600))
+app.config['STATIC_GZIP_LEVEL'] = int(os.environ.get('STATIC_GZIP_LEVEL', 9))
+app.config['STATIC_BROTLI_QUALITY'] = int(os.environ.get('STATIC_BROTLI_QUALITY', 9))
+app.config['STATIC_CACHE_DIR'] = os.environ.get('STATIC_CACHE_DIR')
+app.config['STREAM_MIN_BYTES'] = int(os.environ.get('STREAM_MIN_BYTES', 256 * 1024))
+app.config['MAX_GRAPH_VERTICES'] = int(os.environ.get('MAX_GRAPH_VERTICES', 2 * 10 ** 6))
+app.config['MAX_GRAPH_ARCS'] = int(os.environ.get('MAX_GRAPH_ARCS', 2 * 10 ** 7))
 
+result_cache = ResultCache(app.config['RESULT_CACHE_MAX_BYTES'], app.config['RESULT_CACHE_DIR'], app.config['RESULT_CACHE_DISK_MAX_BYTES'])
+graph_store = GraphStore(app.config['GRAPH_TTL_SECONDS'], app.config['MAX_STORED_GRAPHS'], app.config['MAX_TRACKED_RESULTS'])
+cursor_store = CursorStore(app.config['CURSOR_TTL_SECONDS'], app.config['MAX_STEP_CURSORS'])
+job_manager = JobManager(
+    app.config['JOB_WORKERS'],
+    app.config['JOB_MAX_PENDING'],
+    app.config['JOB_MAX_COST'],
+    app.config['JOB_TIMEOUT_SECONDS'],
+    app.config['JOB_RESULT_TTL_SECONDS']
+)
+
+batch_executor = BatchExecutor(app.config['BATCH_WORKERS'], app.config['BATCH_MAX_RUNS'])
+graph_reader = GraphReader(app.config['MAX_GRAPH_VERTICES'], app.config['MAX_GRAPH_ARCS'])
+static_assets = StaticAssets(app.config['STATIC_GZIP_LEVEL'], app.config['STATIC_BROTLI_QUALITY'], app.config['STATIC_CACHE_DIR'])
+BoruvkaGraph.default_workers = app.config['BORUVKA_WORKERS']
+
+metrics_registry = MetricsRegistry()
+REQUESTS = metrics_registry.counter('graph_api_requests_total', 'Liczba obsluzonych zapytan.', ('endpoint', 'status'))
+REQUEST_SECONDS = metrics_registry.histogram('graph_api_request_duration_seconds', 'Czas obslugi zapytania.', ('endpoint',))
+PHASE_SECONDS = metrics_registry.histogram(
+    'graph_api_phase_duration_seconds',
+    'Czas faz obslugi zapytania: parse (odczyt tresci zapytania), build (utworzenie grafu), algorithm (petla algorytmu), '
+    'snapshot (tworzenie migawek krokow), serialize (zapis odpowiedzi JSON lub MessagePack), compress (kompresja odpowiedzi).',
+    ('endpoint', 'phase')
+)
+STEPS_EMITTED = metrics_registry.counter('graph_api_steps_emitted_total', 'Liczba zwroconych krokow algorytmow.', ('endpoint',))
+BYTES_OUT = metrics_registry.counter('graph_api_response_bytes_total', 'Liczba bajtow wyslanych w odpowiedziach.', ('endpoint',))
+GRAPH_VERTICES = metrics_registry.histogram('graph_api_graph_vertices', 'Liczba wierzcholkow przetwarzanych grafow.', ('endpoint',), SIZE_BUCKETS)
+GRAPH_ARCS = metrics_registry.histogram('graph_api_graph_arcs', 'Liczba lukow przetwarzanych grafow.', ('endpoint',), SIZE_BUCKETS)
+STARTUP_SECONDS = metrics_registry.gauge('graph_api_startup_seconds', 'Czas poszczegolnych etapow uruchamiania aplikacji.', ('phase',))
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
 
 SWAGGER_URL = '/swagger'
 API_URL = '/static/swagger.json'
@@ -17,17 +99,502 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 )
 
 
+def phase(name):
+    """
+    Zwraca kontekst mierzacy czas wskazanej fazy obslugi biezacego zapytania lub pusty kontekst, gdy metryki sa wylaczone.
+    """
+    timer = g.get('phase_timer')
+    return timer.measure(name) if timer is not None else nullcontext()
+
+
+def build_graph(algorithm, request_data, stored):
+    """
+    Tworzy obiekt grafu dla wskazanego algorytmu, mierzac czas tworzenia oraz (gdy metryki sa wlaczone) wlaczajac pomiar faz algorytmu.
+    """
+    with phase('build'):
+        graph = create_graph(algorithm, request_core(algorithm, request_data, stored), request_data)
+    if g.get('phase_timer') is not None:
+        graph.enable_timing()
+        GRAPH_VERTICES.observe(graph.core.vertex_count(), endpoint=request.endpoint)
+        GRAPH_ARCS.observe(graph.core.arc_count(), endpoint=request.endpoint)
+    return graph
+
+
+def add_graph_timings(timer, graph, endpoint):
+    """
+    Dolicza zmierzony czas algorytmu i tworzenia migawek do faz zapytania oraz zlicza zwrocone kroki.
+    """
+    if timer is None or graph.timings is None:
+        return
+    timer.add('algorithm', graph.timings['algorithm'])
+    timer.add('snapshot', graph.timings['snapshot'])
+    STEPS_EMITTED.inc(graph.timings['steps'], endpoint=endpoint)
+
+
+def observe_phases(timer, endpoint):
+    """
+    Zapisuje czasy faz zapytania w histogramie.
+    """
+    for name, seconds in timer.phases.items():
+        PHASE_SECONDS.observe(seconds, endpoint=endpoint, phase=name)
+
+
+def stream_steps(graph, endpoint):
+    """
+    Generator linii odpowiedzi NDJSON. Metryki odpowiedzi strumieniowej sa zapisywane dopiero po wyslaniu ostatniego kroku.
+    """
+    timer = PhaseTimer() if graph.timings is not None else None
+    if timer is None:
+        for step in graph.iter_steps():
+            yield json.dumps(step) + '\n'
+        return
+
+    sent = 0
+    for step in graph.iter_steps():
+        with timer.measure('serialize'):
+            line = json.dumps(step) + '\n'
+        sent += len(line)
+        yield line
+    add_graph_timings(timer, graph, endpoint)
+    observe_phases(timer, endpoint)
+    REQUEST_SECONDS.observe(time.perf_counter() - g.request_start, endpoint=endpoint)
+    BYTES_OUT.inc(sent, endpoint=endpoint)
+
+
+def wants_ndjson():
+    """
+    Sprawdza, czy klient oczekuje odpowiedzi strumieniowej w formacie NDJSON (naglowek Accept).
+    """
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def wants_msgpack():
+    """
+    Sprawdza, czy klient oczekuje odpowiedzi w formacie MessagePack (naglowek Accept). Bez zainstalowanego pakietu msgpack
+    odpowiedzi sa zawsze zwracane w formacie JSON.
+    """
+    return msgpack is not None and request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+
+
+def payload_response(payload):
+    """
+    Tworzy odpowiedz z danymi w formacie JSON lub MessagePack, zaleznie od naglowka Accept.
+    """
+    if wants_msgpack():
+        return Response(pack_response(payload), mimetype=MSGPACK_MIMETYPE)
+    return jsonify(payload)
+
+
+def request_graph():
+    """
+    Zwraca pola zapytania oraz wpis grafu przechowywanego na serwerze (pole graph_id) lub None, gdy graf jest przeslany w zapytaniu.
+    Graf przeslany w postaci binarnej (typ tresci application/vnd.graph.packed) lub w duzym zapytaniu JSON (od STREAM_MIN_BYTES bajtow,
+    wczytywanym strumieniowo prosto do tablic) jest traktowany jak graf przechowywany jedynie na czas zapytania - a jego skrot
+    identyfikuje go w pamieci podrecznej. Grafy przekraczajace limity MAX_GRAPH_VERTICES lub MAX_GRAPH_ARCS sa odrzucane.
+    """
+    with phase('parse'):
+        if request.mimetype == PACKED_MIMETYPE:
+            request_data, core, fingerprint = unpack_graph(request.get_data())
+            check_graph_limits(core.vertex_count(), core.arc_count())
+            return request_data, StoredGraph(None, core, fingerprint, None)
+        if (request.content_length or 0) >= app.config['STREAM_MIN_BYTES']:
+            request_data, core, fingerprint = graph_reader.read(request.stream)
+            if core is not None:
+                return request_data, StoredGraph(None, core, fingerprint, None)
+        else:
+            request_data = request.get_json(force=True)
+            if 'vertices' in request_data and 'adjacency_list' in request_data:
+                check_graph_limits(len(request_data['vertices']), sum(map(len, request_data['adjacency_list'])))
+    stored = graph_store.get(request_data['graph_id']) if 'graph_id' in request_data else None
+    return request_data, stored
+
+
+def check_graph_limits(vertex_count, arc_count):
+    """
+    Sprawdza, czy graf nie przekracza limitow MAX_GRAPH_VERTICES oraz MAX_GRAPH_ARCS.
+    """
+    check_limits(vertex_count, arc_count, app.config['MAX_GRAPH_VERTICES'], app.config['MAX_GRAPH_ARCS'])
+
+
+def graph_headers(graph):
+    """
+    Zwraca naglowki odpowiedzi raportujace rozmiar pamieci zajmowanej przez reprezentacje grafu.
+    """
+    memory = graph.core.memory_usage()
+    return {
+        'X-Graph-Memory-Bytes': str(memory['bytes']),
+        'X-Graph-Bytes-Per-Edge': f"{memory['bytes_per_edge']:.2f}"
+    }
+
+
+def steps_response(graph):
+    """
+    Tworzy odpowiedz z lista krokow algorytmu.
+    W formacie NDJSON kroki sa wysylane strumieniowo, po jednym w kazdej linii, bez gromadzenia calej listy w pamieci.
+    """
+    if wants_ndjson():
+        response = Response(stream_with_context(stream_steps(graph, request.endpoint)), mimetype=NDJSON_MIMETYPE)
+    else:
+        steps = graph.collect_steps()
+        add_graph_timings(g.get('phase_timer'), graph, request.endpoint)
+        with phase('serialize'):
+            response = payload_response(steps)
+    response.headers.extend(graph_headers(graph))
+    return response
+
+
+def result_response(graph):
+    """
+    Tworzy odpowiedz zawierajaca wylacznie wynik algorytmu - bez rejestrowania krokow i tworzenia ich opisow.
+    """
+    with phase('algorithm'):
+        result = graph.compute_result()
+    with phase('serialize'):
+        response = payload_response(result)
+    response.headers.extend(graph_headers(graph))
+    return response
+
+
+def page_response(algorithm, request_data, stored, key_data):
+    """
+    Tworzy odpowiedz ze strona krokow algorytmu. Obliczenia sa kontynuowane od przechowywanego kursora (jesli nie znajduje sie on
+    za zadanym krokiem) lub rozpoczynane od poczatku, przy czym kroki przed strona sa pomijane bez tworzenia migawek.
+    """
+    from_step, limit = paging_range(request_data)
+    key = canonical_key(algorithm, {name: value for name, value in key_data.items() if name not in PAGING_FIELDS})
+    cursor = cursor_store.take(key, from_step)
+    if cursor is None:
+        cursor = StepCursor(build_graph(algorithm, request_data, stored))
+
+    # Kursor wykonuje algorytm bezposrednio (bez iter_steps), dlatego tworzenie migawek jest wliczane do fazy algorytmu
+    with phase('algorithm'):
+        steps = cursor.page(from_step, limit)
+    cursor_store.put(key, cursor)
+    with phase('serialize'):
+        if wants_ndjson():
+            response = Response(''.join(json.dumps(step) + '\n' for step in steps), mimetype=NDJSON_MIMETYPE)
+        else:
+            response = payload_response(steps)
+    response.headers.extend(graph_headers(cursor.graph))
+    response.headers['X-Step-From'] = str(from_step)
+    response.headers['X-Step-Count'] = str(len(steps))
+    response.headers['X-Has-More-Steps'] = 'false' if cursor.finished else 'true'
+    return response
+
+
+def request_core(algorithm, request_data, stored):
+    """
+    Zwraca zwarta reprezentacje grafu - przechowywanego na serwerze (pole graph_id) lub przeslanego w zapytaniu.
+    """
+    if stored is None:
+        return create_core(algorithm, request_data)
+    if algorithm in WEIGHTED_ALGORITHMS and stored.core.weights is None:
+        raise ValueError('Wybrany algorytm wymaga grafu z wagami krawedzi.')
+    return stored.core
+
+
+def algorithm_response(algorithm):
+    """
+    Wykonuje wskazany algorytm na grafie przeslanym w zapytaniu (lub przechowywanym na serwerze) i zwraca liste jego krokow.
+    Odpowiedzi JSON sa zapamietywane w pamieci podrecznej - ponowne zapytanie o ten sam graf, algorytm i wierzcholek startowy
+    zwraca identyczna tresc bez ponownych obliczen. Odpowiedzi strumieniowe (NDJSON) nie sa zapamietywane.
+    Dla pola mode rownego "result" zwracany jest wylacznie wynik algorytmu zamiast listy krokow.
+    Pola from_step oraz limit powoduja zwrocenie jedynie wskazanej strony krokow (strony nie sa zapamietywane w pamieci podrecznej).
+    """
+    request_data, stored = request_graph()
+    result_mode = request_data.get('mode', 'steps') == 'result'
+
+    # Dla grafu przechowywanego kluczem jest skrot grafu, a nie jego identyfikator
+    key_data = request_data if stored is None else dict(request_data, graph_id=stored.fingerprint)
+    if not result_mode and any(name in request_data for name in PAGING_FIELDS):
+        return page_response(algorithm, request_data, stored, key_data)
+    if wants_ndjson() and not result_mode:
+        return steps_response(build_graph(algorithm, request_data, stored))
+
+    def build():
+        graph = build_graph(algorithm, request_data, stored)
+        return result_response(graph) if result_mode else steps_response(graph)
+
+    return cached_response(canonical_key(algorithm, key_data), build)
+
+
+def cached_response(key, build):
+    """
+    Zwraca odpowiedz zapamietana pod wskazanym kluczem lub tworzy ja funkcja build i zapamietuje jej tresc oraz naglowki.
+    Odpowiedzi JSON oraz MessagePack sa zapamietywane pod roznymi kluczami.
+    """
+    mimetype = 'application/json'
+    if wants_msgpack():
+        key, mimetype = f'{key}-msgpack', MSGPACK_MIMETYPE
+    cached = result_cache.get(key)
+    if cached is not None:
+        body, headers = cached
+        return Response(body, mimetype=mimetype, headers=headers)
+
+    response = build()
+    result_cache.put(key, response.get_data(), {name: value for name, value in response.headers.items() if name.startswith('X-')})
+    return response
+
+
+@app.before_request
+def start_request_metrics():
+    """
+    Rozpoczyna pomiar czasu obslugi zapytania (gdy metryki sa wlaczone) oraz profilowanie cProfile, jesli profilowanie jest
+    dozwolone w konfiguracji, a zapytanie zawiera naglowek X-Profile: 1 lub parametr profile=1.
+    """
+    if app.config['METRICS_ENABLED']:
+        g.request_start = time.perf_counter()
+        g.phase_timer = PhaseTimer()
+    if app.config['PROFILING_ENABLED'] and '1' in (request.headers.get('X-Profile'), request.args.get('profile')):
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+
+@app.before_request
+def serve_static_asset():
+    """
+    Zwraca specyfikacje API oraz pliki interfejsu Swagger UI z pamieci - w wersji skompresowanej przy uruchomieniu aplikacji,
+    z naglowkami ETag i Cache-Control. Pozostale zapytania sa obslugiwane bez zmian.
+    """
+    return static_assets.response(request)
+
+
+@app.after_request
+def finish_request_metrics(response):
+    """
+    Zapisuje metryki zakonczonego zapytania oraz zapisuje wynik profilowania do pliku w katalogu PROFILE_DIR
+    (nazwa pliku jest zwracana w naglowku X-Profile-File).
+    """
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        path = os.path.join(app.config['PROFILE_DIR'], f'{request.endpoint}-{int(time.time())}-{uuid.uuid4().hex[:8]}.prof')
+        profiler.dump_stats(path)
+        response.headers['X-Profile-File'] = path
+
+    timer = g.pop('phase_timer', None)
+    if timer is None:
+        return response
+    endpoint = request.endpoint or 'unknown'
+    REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+    # Czas i liczba bajtow odpowiedzi strumieniowych sa znane dopiero po ich wyslaniu - zapisuje je generator stream_steps
+    if not response.is_streamed:
+        REQUEST_SECONDS.observe(time.perf_counter() - g.request_start, endpoint=endpoint)
+        BYTES_OUT.inc(response.content_length or 0, endpoint=endpoint)
+    observe_phases(timer, endpoint)
+    return response
+
+
+@app.after_request
+def compress_response(response):
+    """
+    Kompresuje gzipem odpowiedzi wieksze niz COMPRESS_MIN_BYTES, jesli klient to dopuszcza (naglowek Accept-Encoding).
+    Odpowiedzi strumieniowe oraz pliki statyczne nie sa kompresowane. Funkcja jest wykonywana przed zapisem metryk,
+    dzieki czemu liczba bajtow odpowiedzi odpowiada danym faktycznie wyslanym.
+    """
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or 'gzip' not in request.accept_encodings
+            or (response.content_length or 0) < app.config['COMPRESS_MIN_BYTES']):
+        return response
+    with phase('compress'):
+        response.set_data(gzip.compress(response.get_data(), compresslevel=app.config['COMPRESS_LEVEL']))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+@app.errorhandler(ValueError)
+def invalid_graph(error):
+    """
+    Zwraca odpowiedz z kodem 400 dla niepoprawnie zdefiniowanego grafu.
+    """
+    return jsonify({"error": str(error)}), 400
+
+
+@app.errorhandler(GraphTooLargeError)
+def too_large_graph(error):
+    """
+    Zwraca odpowiedz z kodem 413 dla grafu przekraczajacego limit liczby wierzcholkow lub lukow.
+    """
+    return jsonify({"error": str(error)}), 413
+
+
+@app.errorhandler(UnknownGraphError)
+def unknown_graph(error):
+    """
+    Zwraca odpowiedz z kodem 404 dla nieistniejacego lub wygaslego grafu.
+    """
+    return jsonify({"error": error.args[0]}), 404
+
+
+@app.errorhandler(UnknownJobError)
+def unknown_job(error):
+    """
+    Zwraca odpowiedz z kodem 404 dla nieistniejacego zadania.
+    """
+    return jsonify({"error": error.args[0]}), 404
+
+
+@app.errorhandler(JobRejectedError)
+def rejected_job(error):
+    """
+    Zwraca odpowiedz z kodem 503 (z naglowkiem Retry-After) dla pelnej kolejki zadan lub 413 dla zbyt kosztownego zadania.
+    """
+    if error.retryable:
+        return jsonify({"error": str(error)}), 503, {'Retry-After': '5'}
+    return jsonify({"error": str(error)}), 413
+
+
+@app.route("/api/jobs", methods=['POST'])
+def submit_job():
+    """
+    Funkcja obslugujaca punkt koncowy /api/jobs. Przyjmuje zadanie wykonania algorytmu (pole algorithm oraz pola zapytania
+    synchronicznych punktow koncowych) w osobnym procesie i zwraca jego identyfikator. Opcjonalne pole timeout skraca limit czasu zadania.
+    """
+    request_data, stored = request_graph()
+    algorithm = request_data.get('algorithm')
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Nieznany algorytm: {algorithm}.')
+    core = request_core(algorithm, request_data, stored)
+    job = job_manager.submit(algorithm, request_data, core, request_data.get('timeout'))
+    return jsonify(job.status()), 202, {'Location': f'/api/jobs/{job.job_id}'}
+
+
+@app.route("/api/jobs/<job_id>", methods=['GET'])
+def job_status(job_id):
+    """
+    Funkcja obslugujaca punkt koncowy zwracajacy stan zadania.
+    """
+    return jsonify(job_manager.get(job_id).status())
+
+
+@app.route("/api/jobs/<job_id>/result", methods=['GET'])
+def job_result(job_id):
+    """
+    Funkcja obslugujaca punkt koncowy zwracajacy wynik zadania - liste krokow lub wynik algorytmu w formacie wybranym przy zgloszeniu.
+    Dla zadania w toku zwracany jest jego stan z kodem 202, a dla zadania zakonczonego bez wyniku - z kodem 409.
+    """
+    job = job_manager.get(job_id)
+    if job.state == DONE:
+        return Response(job.body, mimetype='application/json', headers=job.headers)
+    return jsonify(job.status()), 409 if job.state in FINAL_STATES else 202
+
+
+@app.route("/api/jobs/<job_id>", methods=['DELETE'])
+def cancel_job(job_id):
+    """
+    Funkcja obslugujaca anulowanie zadania oczekujacego lub wykonywanego.
+    """
+    return jsonify(job_manager.cancel(job_id).status())
+
+
+@app.route("/api/jobs/stats", methods=['GET'])
+def job_stats():
+    """
+    Funkcja obslugujaca punkt koncowy /api/jobs/stats. Zwraca liczbe zadan w poszczegolnych stanach.
+    """
+    return jsonify(job_manager.stats())
+
+
+@app.route("/api/batch", methods=['POST'])
+def batch():
+    """
+    Funkcja obslugujaca punkt koncowy /api/batch. Tworzy graf jednokrotnie, wykonuje na nim wszystkie przebiegi z listy runs
+    (algorytm, wierzcholek startowy oraz opcje) rownolegle w puli procesow i zwraca ich wyniki w jednej odpowiedzi wraz z czasem wykonania.
+    """
+    request_data, stored = request_graph()
+    if stored is not None:
+        core = stored.core
+    else:
+        core = CompactGraph(request_data['vertices'], request_data['adjacency_list'], request_data.get('weights'))
+    return Response(batch_executor.run(core, request_data), mimetype='application/json')
+
+
+@app.route("/api/graphs", methods=['POST'])
+def upload_graph():
+    """
+    Funkcja obslugujaca punkt koncowy /api/graphs. Sprawdza poprawnosc przeslanego grafu, zapisuje go na serwerze
+    i zwraca jego identyfikator, ktory moze zostac uzyty w polu graph_id zamiast przesylania grafu w kolejnych zapytaniach.
+    """
+    request_data, stored = request_graph()
+    if stored is not None and stored.graph_id is None:
+        stored = graph_store.add_core(stored.core, stored.fingerprint)
+    else:
+        stored = graph_store.add(request_data['vertices'], request_data['adjacency_list'], request_data.get('weights'))
+    return jsonify({
+        "graph_id": stored.graph_id,
+        "vertices": stored.core.vertex_count(),
+        "arcs": stored.core.arc_count(),
+        "ttl": graph_store.ttl
+    }), 201
+
+
+@app.route("/api/graphs/<graph_id>", methods=['PATCH'])
+def edit_graph(graph_id):
+    """
+    Funkcja obslugujaca edycje grafu przechowywanego na serwerze. Pole edits zawiera liste edycji krawedzi (op: insert, update
+    lub delete; vertex1, vertex2 oraz weight), a pole track - liste wynikow aktualizowanych przyrostowo po kazdej edycji
+    (algorithm: Dijkstra ze start_vertex lub Kruskal). Zwraca wszystkie sledzone wyniki w postaci trybu result.
+    Pole validate (lub opcja INCREMENTAL_VALIDATE) powoduje porownanie wynikow z wyznaczonymi od poczatku.
+    """
+    request_data = request.get_json(force=True)
+    validate_results = app.config['INCREMENTAL_VALIDATE'] or request_data.get('validate') is True
+    stored, results, errors = graph_store.edit(graph_id, request_data.get('edits', []), request_data.get('track', []), validate_results)
+    if errors:
+        app.logger.warning('Niezgodnosc wynikow przyrostowych grafu %s: %s', graph_id, '; '.join(errors))
+
+    body = {
+        "graph_id": stored.graph_id,
+        "vertices": stored.core.vertex_count(),
+        "arcs": stored.core.arc_count(),
+        "results": results
+    }
+    if validate_results:
+        body["validation_errors"] = errors
+    return payload_response(body)
+
+
+@app.route("/api/graphs/<graph_id>", methods=['DELETE'])
+def delete_graph(graph_id):
+    """
+    Funkcja obslugujaca usuwanie grafu przechowywanego na serwerze.
+    """
+    graph_store.remove(graph_id)
+    return '', 204
+
+
+@app.route("/api/messages", methods=['GET'])
+def messages():
+    """
+    Funkcja obslugujaca punkt koncowy /api/messages. Zwraca katalog komunikatow krokow (kod - szablon) dla jezyka wskazanego
+    parametrem locale, pozwalajacy klientowi wyswietlic kroki pobrane z polem info ustawionym na false.
+    """
+    return jsonify(catalog(request.args.get('locale', DEFAULT_LOCALE)))
+
+
+@app.route("/metrics", methods=['GET'])
+def metrics():
+    """
+    Funkcja obslugujaca punkt koncowy /metrics. Zwraca liczniki zapytan, krokow i bajtow odpowiedzi oraz histogramy czasu
+    poszczegolnych faz obslugi zapytan i rozmiaru grafow w formacie tekstowym Prometheusa.
+    """
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route("/api/cache/stats", methods=['GET'])
+def cache_stats():
+    """
+    Funkcja obslugujaca punkt koncowy /api/cache/stats. Zwraca liczniki trafien, chybien oraz usuniec wpisow pamieci podrecznej wynikow.
+    """
+    return jsonify(result_cache.stats())
+
+
 @app.route("/api/BFS", methods=['POST'])
 def BFS():
     """
     Funkcja obslugujaca punkt koncowy /api/BFS. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu BFS wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    start_vertex = request_data['start_vertex']
-    graph = BFSGraph(vertices, adjacency_list, start_vertex)
-    return jsonify(graph.search())
+    return algorithm_response('BFS')
 
 
 @app.route("/api/DFS", methods=['POST'])
@@ -35,12 +602,7 @@ def DFS():
     """
     Funkcja obslugujaca punkt koncowy /api/DFS. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu DFS wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    current_vertex = request_data['start_vertex']
-    graph = DFSGraph(vertices, adjacency_list, current_vertex)
-    return jsonify(graph.search())
+    return algorithm_response('DFS')
 
 
 @app.route("/api/Kruskal", methods=['POST'])
@@ -48,12 +610,16 @@ def Kruskal():
     """
     Funkcja obslugujaca punkt koncowy /api/Kruskal. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu Kruskala wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    weights = request_data['weights']
-    graph = KruskalGraph(vertices, adjacency_list, weights)
-    return jsonify(graph.find_minimum_spanning_tree())
+    return algorithm_response('Kruskal')
+
+
+@app.route("/api/Boruvka", methods=['POST'])
+def Boruvka():
+    """
+    Funkcja obslugujaca punkt koncowy /api/Boruvka. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu Boruvki wykonanego na danym grafie.
+    Dla duzych grafow najtansze krawedzie skladowych sa wyszukiwane rownolegle w BORUVKA_WORKERS procesach.
+    """
+    return algorithm_response('Boruvka')
 
 
 @app.route("/api/PrimDijkstra", methods=['POST'])
@@ -61,26 +627,15 @@ def PrimDijkstra():
     """
     Funkcja obslugujaca punkt koncowy /api/PrimDijkstra. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu Prima-Dijkstry wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    weights = request_data['weights']
-    current_vertex = request_data['start_vertex']
-    graph = PrimDijkstraGraph(vertices, adjacency_list, weights, current_vertex)
-    return jsonify(graph.find_minimum_spanning_tree())
+    return algorithm_response('PrimDijkstra')
+
 
 @app.route("/api/Dijkstra", methods=['POST'])
 def Dijkstra():
     """
     Funkcja obslugujaca punkt koncowy /api/Dijkstra. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu Dijkstry wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    weights = request_data['weights']
-    current_vertex = request_data['start_vertex']
-    graph = DijkstraGraph(vertices, adjacency_list, weights, current_vertex)
-    return jsonify(graph.find_shortest_paths())
+    return algorithm_response('Dijkstra')
 
 
 @app.route("/api/BellmanFord", methods=['POST'])
@@ -88,18 +643,58 @@ def BellmanFord():
     """
     Funkcja obslugujaca punkt koncowy /api/BellmanFord. Jako odpowiedz na zapytanie zwraca liste krokow algorytmu Bellmana-Forda wykonanego na danym grafie.
     """
-    request_data = request.get_json(force=True)
-    vertices = request_data['vertices']
-    adjacency_list = request_data['adjacency_list']
-    weights = request_data['weights']
-    current_vertex = request_data['start_vertex']
-    graph = BellmanFordGraph(vertices, adjacency_list, weights, current_vertex)
-    return jsonify(graph.find_shortest_paths())
+    return algorithm_response('BellmanFord')
 
-if __name__ == '__main__':
+
+@app.route("/api/AllPairs", methods=['POST'])
+def AllPairs():
+    """
+    Funkcja obslugujaca punkt koncowy /api/AllPairs. Jako odpowiedz na zapytanie zwraca macierz kosztow najkrotszych drog miedzy
+    wszystkimi parami wierzcholkow oraz macierz poprzednikow (Floyd-Warshall dla grafow gestych, Dijkstra z kazdego wierzcholka dla rzadkich).
     """
-    Glowna funkcja programu uruchamiajaca aplikacje webowa.
+    request_data, stored = request_graph()
+    key_data = request_data if stored is None else dict(request_data, graph_id=stored.fingerprint)
+
+    def build():
+        with phase('build'):
+            all_pairs = AllPairsShortestPaths(request_core('AllPairs', request_data, stored), request_data.get('engine', 'auto'))
+        with phase('algorithm'):
+            result = all_pairs.compute()
+        with phase('serialize'):
+            response = payload_response(result)
+        response.headers.extend(graph_headers(all_pairs))
+        return response
+
+    return cached_response(canonical_key('AllPairs', key_data), build)
+
+
+def create_app(import_seconds=None):
+    """
+    Fabryka aplikacji uzywana przez serwer WSGI (wsgi.py) oraz serwer deweloperski. Rejestruje interfejs Swagger UI, wczytuje
+    i kompresuje pliki statyczne oraz zapisuje czasy uruchamiania (import_seconds - czas importu modulu, jesli zostal zmierzony)
+    w metrykach. Kolejne wywolania zwracaja te sama, juz skonfigurowana aplikacje.
     """
+    if swaggerui_blueprint.name in app.blueprints:
+        return app
+
+    start = time.perf_counter()
     app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
-    app.run(debug=True)
+    # Specyfikacja API zmienia sie z kazdym wdrozeniem - przegladarka sprawdza ja przy kazdym uzyciu (ETag pozwala odpowiedziec kodem 304)
+    static_assets.add_file(API_URL, os.path.join(app.static_folder, 'swagger.json'), 'no-cache')
+    static_assets.add_directory(SWAGGER_URL, swaggerui_blueprint.static_folder, f"public, max-age={app.config['STATIC_MAX_AGE']}")
+
+    STARTUP_SECONDS.set(static_assets.seconds, phase='static_assets')
+    STARTUP_SECONDS.set(time.perf_counter() - start, phase='create_app')
+    if import_seconds is not None:
+        STARTUP_SECONDS.set(import_seconds, phase='import')
+    app.logger.info('Aplikacja skonfigurowana w %.3f s (pliki statyczne: %s)', time.perf_counter() - start, static_assets.stats())
+    return app
+
+
+if __name__ == '__main__':
+    """
+    Glowna funkcja programu uruchamiajaca aplikacje webowa (serwer deweloperski). W srodowisku produkcyjnym aplikacja jest
+    uruchamiana przez serwer WSGI: gunicorn -c gunicorn.conf.py wsgi:app
+    """
+    create_app().run(debug=True)
 
@@ -0,0 +1,192 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Domyslne granice przedzialow histogramow czasu (w sekundach)
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Granice przedzialow histogramow rozmiaru grafu (liczba wierzcholkow lub lukow)
+SIZE_BUCKETS = (10, 100, 1000, 10000, 100000, 1000000)
+
+
+def format_labels(names, values, extra=()):
+    """
+    Zwraca etykiety probki w formacie tekstowym Prometheusa, np. {endpoint="BFS",phase="build"}.
+    """
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def format_value(value):
+    """
+    Zwraca wartosc probki w formacie tekstowym Prometheusa.
+    """
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Klasa reprezentujaca licznik (wartosc tylko rosnaca) z etykietami.
+    """
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Tworzy licznik o wskazanej nazwie, opisie oraz nazwach etykiet.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = dict()
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        """
+        Zwieksza wartosc licznika dla wskazanych etykiet.
+        """
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        """
+        Zwraca linie formatu tekstowego Prometheusa opisujace licznik.
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f'{self.name}{format_labels(self.labelnames, key)} {format_value(value)}')
+        return lines
+
+
+class Gauge(Counter):
+    """
+    Klasa reprezentujaca wartosc chwilowa (np. czas uruchamiania aplikacji) z etykietami.
+    """
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        """
+        Ustawia wartosc dla wskazanych etykiet.
+        """
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self.lock:
+            self.values[key] = value
+
+
+class Histogram:
+    """
+    Klasa reprezentujaca histogram z etykietami - liczniki obserwacji w przedzialach (kumulatywnie), sume oraz liczbe obserwacji.
+    """
+    def __init__(self, name, documentation, labelnames=(), buckets=TIME_BUCKETS):
+        """
+        Tworzy histogram o wskazanej nazwie, opisie, nazwach etykiet oraz granicach przedzialow.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.values = dict()
+        self.lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """
+        Dodaje obserwacje dla wskazanych etykiet.
+        """
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            counts, total = self.values.get(key, ([0] * (len(self.buckets) + 1), 0))
+            counts[index] += 1
+            self.values[key] = (counts, total + value)
+
+    def render(self):
+        """
+        Zwraca linie formatu tekstowego Prometheusa opisujace histogram.
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self.lock:
+            for key, (counts, total) in sorted(self.values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), counts):
+                    cumulative += count
+                    lines.append(f'{self.name}_bucket{format_labels(self.labelnames, key, [("le", format_value(bound))])} {cumulative}')
+                lines.append(f'{self.name}_sum{format_labels(self.labelnames, key)} {format_value(float(total))}')
+                lines.append(f'{self.name}_count{format_labels(self.labelnames, key)} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Klasa reprezentujaca zbior metryk udostepnianych w formacie tekstowym Prometheusa.
+    """
+    def __init__(self):
+        """
+        Tworzy pusty zbior metryk.
+        """
+        self.metrics = list()
+
+    def counter(self, name, documentation, labelnames=()):
+        """
+        Tworzy i rejestruje licznik.
+        """
+        metric = Counter(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def gauge(self, name, documentation, labelnames=()):
+        """
+        Tworzy i rejestruje wartosc chwilowa.
+        """
+        metric = Gauge(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=TIME_BUCKETS):
+        """
+        Tworzy i rejestruje histogram.
+        """
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """
+        Zwraca wszystkie metryki w formacie tekstowym Prometheusa.
+        """
+        return '\n'.join(line for metric in self.metrics for line in metric.render()) + '\n'
+
+
+class PhaseTimer:
+    """
+    Klasa sumujaca czas poszczegolnych faz obslugi jednego zapytania.
+    """
+    def __init__(self):
+        """
+        Tworzy licznik bez zmierzonych faz.
+        """
+        self.phases = dict()
+
+    def add(self, phase, seconds):
+        """
+        Dodaje czas do wskazanej fazy.
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, phase):
+        """
+        Mierzy czas wykonania bloku with i dolicza go do wskazanej fazy.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
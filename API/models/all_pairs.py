@@ -0,0 +1,84 @@
+import math
+from models.graph import DijkstraGraph
+from models.numpy_engine import numpy, numpy_floyd_warshall
+
+
+# Wzgledne koszty operacji elementarnych silnikow (zmierzone skryptem benchmarks/all_pairs.py): jednej komorki macierzy
+# w iteracji Floyda-Warshalla oraz zdjecia wierzcholka z kopca i relaksacji luku w algorytmie Dijkstry
+FLOYD_WARSHALL_CELL_COST = 1
+DIJKSTRA_VERTEX_COST = 48
+DIJKSTRA_ARC_COST = 24
+
+# Maksymalna liczba wierzcholkow, dla ktorej silnik 'auto' wybiera algorytm Floyda-Warshalla (macierze V x V)
+FLOYD_WARSHALL_MAX_VERTICES = 3000
+
+
+class AllPairsShortestPaths:
+    """
+    Klasa wyznaczajaca najkrotsze drogi miedzy wszystkimi parami wierzcholkow grafu - macierz kosztow oraz macierz poprzednikow.
+    Dla grafow gestych uzywany jest algorytm Floyda-Warshalla w NumPy, dla rzadkich - algorytm Dijkstry (z kopcem) z kazdego wierzcholka.
+    """
+    def __init__(self, core, engine='auto'):
+        """
+        Tworzy obiekt dla zwartej reprezentacji grafu z wagami. Parametr engine: 'auto', 'dijkstra' lub 'floyd_warshall'.
+        """
+        if core.weights is None:
+            raise ValueError('Wybrany algorytm wymaga grafu z wagami krawedzi.')
+        if engine not in ('auto', 'dijkstra', 'floyd_warshall'):
+            raise ValueError(f'Nieznany silnik obliczen: {engine}.')
+        if engine == 'floyd_warshall' and numpy is None:
+            raise ValueError('Silnik floyd_warshall wymaga zainstalowanej biblioteki NumPy.')
+        self.core = core
+        self.engine = engine
+
+    def estimated_costs(self):
+        """
+        Zwraca szacowane koszty silnikow: O(V^3) dla Floyda-Warshalla oraz O(V * (V log V + E)) dla algorytmu Dijkstry z kazdego wierzcholka.
+        Algorytm Floyda-Warshalla jest tanszy dla grafow gestych, a algorytm Dijkstry - dla rzadkich.
+        """
+        vertex_count = self.core.vertex_count()
+        floyd_warshall = FLOYD_WARSHALL_CELL_COST * vertex_count ** 3
+        dijkstra = vertex_count * (DIJKSTRA_VERTEX_COST * vertex_count * math.log2(max(vertex_count, 2)) + DIJKSTRA_ARC_COST * self.core.arc_count())
+        return floyd_warshall, dijkstra
+
+    def selected_engine(self):
+        """
+        Zwraca nazwe silnika, ktory zostanie uzyty do obliczen.
+        """
+        if self.engine != 'auto':
+            return self.engine
+        if numpy is None or self.core.vertex_count() > FLOYD_WARSHALL_MAX_VERTICES:
+            return 'dijkstra'
+        floyd_warshall, dijkstra = self.estimated_costs()
+        if floyd_warshall < dijkstra:
+            return 'floyd_warshall'
+        return 'dijkstra'
+
+    def repeated_dijkstra(self):
+        """
+        Wykonuje algorytm Dijkstry (bez rejestrowania krokow) z kazdego wierzcholka na wspolnej reprezentacji grafu.
+        """
+        distances, predecessors = list(), list()
+        for source in range(self.core.vertex_count()):
+            graph = DijkstraGraph(current_vertex=source, core=self.core)
+            result = graph.compute_result()
+            distances.append(result["costs"])
+            predecessors.append(result["parents"])
+        return distances, predecessors
+
+    def compute(self):
+        """
+        Zwraca macierz kosztow (None dla nieosiagalnych par), macierz poprzednikow (predecessors[s][v] to poprzednik v
+        na najkrotszej drodze z s, -1 dla v = s i par nieosiagalnych) oraz nazwe uzytego silnika.
+        """
+        engine = self.selected_engine()
+        if engine == 'floyd_warshall':
+            distances, predecessors = numpy_floyd_warshall(self.core)
+            distances = [[cost if cost != math.inf else None for cost in row] for row in distances]
+        else:
+            distances, predecessors = self.repeated_dijkstra()
+        return {
+            "distances": distances,
+            "predecessors": predecessors,
+            "engine": engine
+        }
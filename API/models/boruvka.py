@@ -0,0 +1,311 @@
+import multiprocessing
+from array import array
+from models.disjoint_set import DisjointSet
+from models.graph import MinimumSpanningTreeGraph
+from models.numpy_engine import numpy, numpy_cheapest_edges, numpy_first_crossing_edges
+
+
+# Minimalna liczba krawedzi przypadajaca na jeden proces - dla mniejszych fragmentow koszt uruchomienia procesow
+# oraz przesylania etykiet skladowych przewyzsza zysk z rownoleglego wyszukiwania
+MIN_CHUNK_EDGES = 500000
+
+# Minimalna liczba krawedzi, od ktorej wyszukiwanie najtanszych krawedzi korzysta z silnika NumPy (silnik 'auto')
+NUMPY_MIN_EDGES = 5000
+
+
+def cheapest_edges(labels, weights, edge_ids):
+    """
+    Zwraca (etykiety, wagi, numery krawedzi) - po jednej, najtanszej krawedzi dla kazdej etykiety spojnej skladowej.
+    Krawedzie o rownych wagach sa porzadkowane wedlug numeru, tak jak w algorytmie Kruskala, dzieki czemu nie powstaja cykle.
+    """
+    cheapest = dict()
+    for label, weight, edge_id in zip(labels, weights, edge_ids):
+        best = cheapest.get(label)
+        if best is None or (weight, edge_id) < best:
+            cheapest[label] = (weight, edge_id)
+    return list(cheapest), [key[0] for key in cheapest.values()], [key[1] for key in cheapest.values()]
+
+
+class EdgeChunk:
+    """
+    Klasa reprezentujaca fragment tablic krawedzi, w ktorym wyszukiwane sa najtansze krawedzie wychodzace ze spojnych skladowych.
+    Krawedzie, ktorych oba konce naleza juz do tej samej skladowej, sa usuwane z fragmentu - kolejne fazy przegladaja coraz mniej krawedzi.
+    """
+    def __init__(self, edge_ids, edge_start, edge_end, edge_weight, use_numpy):
+        """
+        Tworzy fragment z numerow krawedzi oraz odpowiadajacych im poczatkow, koncow i wag.
+        """
+        self.edge_ids = edge_ids
+        self.edge_start = edge_start
+        self.edge_end = edge_end
+        self.edge_weight = edge_weight
+        self.use_numpy = use_numpy
+
+    def cheapest_edges(self, components):
+        """
+        Zwraca najtansze krawedzie fragmentu wychodzace z kazdej skladowej (w postaci zwracanej przez cheapest_edges)
+        dla etykiet skladowych wierzcholkow components.
+        """
+        if self.use_numpy:
+            return self.numpy_cheapest_edges(components)
+
+        labels, weights, edge_ids = list(), list(), list()
+        kept = 0
+        for position in range(len(self.edge_ids)):
+            component1, component2 = components[self.edge_start[position]], components[self.edge_end[position]]
+            if component1 == component2:
+                continue
+
+            # Krawedz laczy rozne skladowe - jest kandydatem dla obu z nich i pozostaje we fragmencie na kolejne fazy
+            weight, edge_id = self.edge_weight[position], self.edge_ids[position]
+            labels += (component1, component2)
+            weights += (weight, weight)
+            edge_ids += (edge_id, edge_id)
+            self.edge_ids[kept], self.edge_weight[kept] = edge_id, weight
+            self.edge_start[kept], self.edge_end[kept] = self.edge_start[position], self.edge_end[position]
+            kept += 1
+
+        for values in (self.edge_ids, self.edge_start, self.edge_end, self.edge_weight):
+            del values[kept:]
+        return cheapest_edges(labels, weights, edge_ids)
+
+    def numpy_cheapest_edges(self, components):
+        """
+        Wersja cheapest_edges operujaca na calych tablicach NumPy naraz. Przy pierwszym wywolaniu krawedzie fragmentu sa sortowane
+        wedlug (waga, numer) - najtansza krawedz skladowej jest wtedy jej pierwsza krawedzia we fragmencie.
+        """
+        if not isinstance(self.edge_ids, numpy.ndarray):
+            self.edge_ids, self.edge_start, self.edge_end, self.edge_weight = (
+                numpy.asarray(values) for values in (self.edge_ids, self.edge_start, self.edge_end, self.edge_weight)
+            )
+            order = numpy.lexsort((self.edge_ids, self.edge_weight))
+            self.edge_ids, self.edge_start, self.edge_end, self.edge_weight = (
+                values[order] for values in (self.edge_ids, self.edge_start, self.edge_end, self.edge_weight)
+            )
+
+        components = numpy.asarray(components)
+        component1, component2 = components[self.edge_start], components[self.edge_end]
+        crossing = component1 != component2
+        self.edge_ids, self.edge_start, self.edge_end, self.edge_weight = (
+            values[crossing] for values in (self.edge_ids, self.edge_start, self.edge_end, self.edge_weight)
+        )
+        labels, positions = numpy_first_crossing_edges(component1[crossing], component2[crossing], len(components))
+        return labels, self.edge_weight[positions], self.edge_ids[positions]
+
+
+def chunk_worker(chunk, connection):
+    """
+    Funkcja wykonywana w procesie puli. Dla kazdej otrzymanej tablicy etykiet skladowych odsyla najtansze krawedzie fragmentu;
+    konczy dzialanie po otrzymaniu None.
+    """
+    while True:
+        components = connection.recv()
+        if components is None:
+            break
+        connection.send(chunk.cheapest_edges(components))
+    connection.close()
+
+
+class ChunkPool:
+    """
+    Klasa reprezentujaca pule procesow, z ktorych kazdy przechowuje jeden fragment tablic krawedzi przez caly czas dzialania algorytmu.
+    Fragmenty sa przesylane raz, przy uruchomieniu procesow - w kolejnych fazach przesylane sa jedynie etykiety skladowych wierzcholkow.
+    """
+    def __init__(self, chunks):
+        """
+        Uruchamia po jednym procesie dla kazdego fragmentu.
+        """
+        context = multiprocessing.get_context('spawn')
+        self.connections = list()
+        self.processes = list()
+        for chunk in chunks:
+            connection, child_connection = context.Pipe()
+            process = context.Process(target=chunk_worker, args=(chunk, child_connection), daemon=True)
+            process.start()
+            child_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    def cheapest_edges(self, components):
+        """
+        Rozsyla etykiety skladowych do wszystkich procesow i zwraca liste ich wynikow.
+        """
+        for connection in self.connections:
+            connection.send(components)
+        return [connection.recv() for connection in self.connections]
+
+    def close(self):
+        """
+        Konczy dzialanie procesow puli.
+        """
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+        self.connections, self.processes = list(), list()
+
+
+class InlinePool:
+    """
+    Klasa o interfejsie ChunkPool przetwarzajaca jeden fragment obejmujacy wszystkie krawedzie w biezacym procesie.
+    """
+    def __init__(self, chunk):
+        """
+        Tworzy pule z jednym fragmentem.
+        """
+        self.chunk = chunk
+
+    def cheapest_edges(self, components):
+        """
+        Zwraca jednoelementowa liste z wynikiem fragmentu.
+        """
+        return [self.chunk.cheapest_edges(components)]
+
+    def close(self):
+        """
+        Pula nie uruchamia procesow - nie ma czego konczyc.
+        """
+
+
+class BoruvkaGraph(MinimumSpanningTreeGraph):
+    """
+    Klasa reprezentujaca graf, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Boruvki.
+    W kazdej fazie dla kazdej spojnej skladowej wyszukiwana jest najtansza wychodzaca z niej krawedz - dla duzych grafow rownolegle,
+    we fragmentach tablic krawedzi przetwarzanych w osobnych procesach. Liczba skladowych maleje co najmniej dwukrotnie w kazdej fazie.
+    Przy porzadku krawedzi (waga, numer) minimalne drzewo jest jednoznaczne - algorytm znajduje te same krawedzie co algorytm Kruskala.
+    """
+    # Domyslna maksymalna liczba procesow (ustawiana przez aplikacje na podstawie konfiguracji)
+    default_workers = 1
+
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, core=None, engine='auto', workers=None):
+        """
+        Tworzy obiekt grafu, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Boruvki, ze wszystkimi niezbednymi atrybutami.
+        Parametr engine wybiera sposob wyszukiwania najtanszych krawedzi: 'python', 'numpy' lub 'auto' (NumPy dla duzych grafow, jesli jest dostepny).
+        """
+        super().__init__(vertices, adjacency_list, weights, core=core)
+        if engine not in ('auto', 'python', 'numpy'):
+            raise ValueError(f'Nieznany silnik obliczen: {engine}.')
+        if engine == 'numpy' and numpy is None:
+            raise ValueError('Silnik numpy wymaga zainstalowanej biblioteki NumPy.')
+        self.engine = engine
+        self.workers = workers or BoruvkaGraph.default_workers
+        self.components = DisjointSet(len(self.vertices))
+        self.phase_count = 0
+
+    def use_numpy(self):
+        """
+        Sprawdza, czy najtansze krawedzie maja byc wyszukiwane przez silnik NumPy.
+        """
+        if self.engine == 'auto':
+            return numpy is not None and len(self.edge_weight) >= NUMPY_MIN_EDGES
+        return self.engine == 'numpy'
+
+    def worker_count(self):
+        """
+        Zwraca liczbe procesow, na ktore zostanie podzielone wyszukiwanie - 1 dla malych grafow, w procesach potomnych
+        (zadaniach w tle i przebiegach wsadowych), ktore same sa juz wykonywane rownolegle, oraz przy rejestrowaniu krokow.
+        Kroki moga byc pobierane stronami lub porzucone przez klienta, a procesy puli sa konczone dopiero po zakonczeniu generatora -
+        dlatego sa uruchamiane tylko przy obliczaniu samego wyniku (compute_result), ktore wykonuje caly algorytm w jednym wywolaniu.
+        """
+        if self.tracing or multiprocessing.parent_process() is not None:
+            return 1
+        return max(1, min(self.workers, len(self.edge_weight) // MIN_CHUNK_EDGES))
+
+    def create_pool(self):
+        """
+        Dzieli tablice krawedzi na fragmenty o zblizonej dlugosci i zwraca pule przetwarzajaca je rownolegle (lub w biezacym procesie).
+        Fragmenty sa kopiami - tablice krawedzi zwartej reprezentacji grafu pozostaja niezmienione.
+        """
+        count = self.worker_count()
+        size, remainder = divmod(len(self.edge_weight), count)
+        chunks, start = list(), 0
+        for i in range(count):
+            end = start + size + (1 if i < remainder else 0)
+            chunks.append(EdgeChunk(
+                array('q', range(start, end)),
+                self.edge_start[start:end],
+                self.edge_end[start:end],
+                self.edge_weight[start:end],
+                self.use_numpy()
+            ))
+            start = end
+        return ChunkPool(chunks) if count > 1 else InlinePool(chunks[0])
+
+    def merge(self, partials):
+        """
+        Laczy wyniki fragmentow i zwraca numery krawedzi dodawanych w fazie - najtanszych dla kazdej skladowej, bez powtorzen
+        (dwie skladowe moga wybrac te sama krawedz), uporzadkowane wedlug wagi oraz numeru.
+        """
+        if self.use_numpy():
+            _, weights, edge_ids = partials[0]
+            if len(partials) > 1:
+                labels, weights, edge_ids = (numpy.concatenate(values) for values in zip(*partials))
+                _, weights, edge_ids = numpy_cheapest_edges(labels, weights, edge_ids)
+            edge_ids, first = numpy.unique(edge_ids, return_index=True)
+            order = numpy.lexsort((edge_ids, weights[first]))
+            return edge_ids[order].tolist()
+
+        labels, weights, edge_ids = (sum(values, list()) for values in zip(*partials))
+        _, weights, edge_ids = cheapest_edges(labels, weights, edge_ids)
+        return [edge_id for _, edge_id in sorted(set(zip(weights, edge_ids)))]
+
+    def relabel(self, components):
+        """
+        Zwraca etykiety skladowych wierzcholkow po polaczeniu skladowych w biezacej fazie - reprezentantow ich zbiorow.
+        Reprezentanci sa wyznaczani tylko dla dotychczasowych etykiet, ktorych liczba maleje w kazdej fazie.
+        """
+        find = self.components.find
+        if self.use_numpy():
+            labels = numpy.unique(components)
+            lookup = numpy.zeros(len(components), dtype=numpy.int64)
+            lookup[labels] = [find(label) for label in labels.tolist()]
+            return lookup[components]
+        representatives = {label: find(label) for label in set(components)}
+        return array('q', map(representatives.__getitem__, components))
+
+    def run(self):
+        """
+        Generator znajdujacy minimalne drzewo rozpinajace za pomoca algorytmu Boruvki.
+        """
+        self.step_number = 0
+        vertex_count = len(self.vertices)
+        components = numpy.arange(vertex_count, dtype=numpy.int64) if self.use_numpy() else array('q', range(vertex_count))
+        component_count = vertex_count
+        pool = self.create_pool()
+        try:
+            while component_count > 1:
+                self.phase_count += 1
+                if self.tracing:
+                    self.current_edge = (0, 0)
+                    self.say('boruvka.phase', self.phase_count, component_count)
+                    yield
+                self.step_number += 1
+
+                # Najtansza krawedz kazdej skladowej sposrod najtanszych krawedzi poszczegolnych fragmentow
+                selected = self.merge(pool.cheapest_edges(components))
+                if not selected:
+                    break
+
+                for edge in selected:
+                    vertex1, vertex2 = self.edge_start[edge], self.edge_end[edge]
+                    self.components.union(vertex1, vertex2)
+                    self.mst_edges.append(self.serialize_edge(edge))
+                    if self.tracing:
+                        self.current_edge = (vertex1, vertex2)
+                        self.green_edges.add((vertex1, vertex2))
+                        self.green_vertices.add(vertex1)
+                        self.green_vertices.add(vertex2)
+                        self.say('boruvka.edge_added', vertex1, vertex2)
+                        yield
+                    self.step_number += 1
+
+                components = self.relabel(components)
+                component_count -= len(selected)
+        finally:
+            pool.close()
@@ -0,0 +1,213 @@
+import operator
+import sys
+from array import array
+from collections import Counter
+
+
+def weight_typecode(weights):
+    """
+    Zwraca kod typu tablicy wag - liczby calkowite sa przechowywane jako 'q', pozostale jako 'd'.
+    """
+    for row in weights:
+        for weight in row:
+            if not isinstance(weight, int):
+                return 'd'
+    return 'q'
+
+
+class CompactGraph:
+    """
+    Klasa reprezentujaca graf w zwartej postaci tablicowej (CSR), tworzona jednokrotnie dla kazdego zapytania.
+    Sasiedzi wierzcholka o indeksie i zajmuja pozycje od offsets[i] do offsets[i+1]-1 w tablicach targets oraz weights.
+    """
+    def __init__(self, vertices=None, adjacency_list=None, weights=None):
+        """
+        Tworzy zwarta reprezentacje grafu na podstawie listy wierzcholkow, list sasiedztwa oraz (opcjonalnie) list wag.
+        """
+        vertices = vertices if vertices is not None else list()
+        adjacency_list = adjacency_list if adjacency_list is not None else list()
+        if len(adjacency_list) != len(vertices):
+            raise ValueError('Liczba list sasiedztwa musi byc rowna liczbie wierzcholkow.')
+        if weights is not None and len(weights) != len(adjacency_list):
+            raise ValueError('Liczba list wag musi byc rowna liczbie list sasiedztwa.')
+
+        self.labels = list(vertices)
+        self.index_of = {label: i for i, label in enumerate(self.labels)}
+        if len(self.index_of) != len(self.labels):
+            raise ValueError('Etykiety wierzcholkow musza byc unikalne.')
+
+        self.offsets = array('q', [0])
+        self.targets = array('q')
+        for neighbours in adjacency_list:
+            try:
+                self.targets.extend(self.index_of[neighbour] for neighbour in neighbours)
+            except KeyError as error:
+                raise ValueError(f'Nieznany wierzcholek na liscie sasiedztwa: {error.args[0]}.')
+            self.offsets.append(len(self.targets))
+
+        self.weights = None
+        if weights is not None:
+            self.weights = array(weight_typecode(weights))
+            for neighbours, row in zip(adjacency_list, weights):
+                if len(row) != len(neighbours):
+                    raise ValueError('Kazdy sasiad wierzcholka musi miec przypisana wage.')
+                self.weights.extend(row)
+
+        self.edge_arrays = None
+        self.incidence = None
+        self.undirected = None
+
+    @classmethod
+    def from_arrays(cls, offsets, targets, weights=None, labels=None):
+        """
+        Tworzy zwarta reprezentacje grafu bezposrednio z gotowych tablic CSR (np. widokow memoryview na tresc zapytania) bez ich kopiowania.
+        Jesli nie podano etykiet wierzcholkow, sa nimi ich indeksy. Sprawdzana jest jedynie spojnosc tablic.
+        """
+        vertex_count = len(offsets) - 1
+        if vertex_count < 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError('Tablica przesuniec nie odpowiada liczbie lukow.')
+        if any(map(operator.gt, offsets[:-1], offsets[1:])):
+            raise ValueError('Tablica przesuniec musi byc niemalejaca.')
+        if len(targets) and (min(targets) < 0 or max(targets) >= vertex_count):
+            raise ValueError('Indeks sasiada spoza zakresu wierzcholkow.')
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError('Kazdy sasiad wierzcholka musi miec przypisana wage.')
+        if labels is not None and len(labels) != vertex_count:
+            raise ValueError('Liczba etykiet musi byc rowna liczbie wierzcholkow.')
+
+        graph = cls.__new__(cls)
+        graph.labels = list(labels) if labels is not None else list(range(vertex_count))
+        graph.index_of = {label: i for i, label in enumerate(graph.labels)}
+        if len(graph.index_of) != len(graph.labels):
+            raise ValueError('Etykiety wierzcholkow musza byc unikalne.')
+        graph.offsets = offsets
+        graph.targets = targets
+        graph.weights = weights
+        graph.edge_arrays = None
+        graph.incidence = None
+        graph.undirected = None
+        return graph
+
+    def __getstate__(self):
+        """
+        Zwraca stan obiektu do serializacji pickle (np. przy przekazaniu grafu do procesu roboczego). Widoki memoryview,
+        ktorych nie mozna serializowac, sa zamieniane na tablice array.
+        """
+        state = dict(self.__dict__)
+        for name in ('offsets', 'targets', 'weights'):
+            if isinstance(state[name], memoryview):
+                state[name] = array(state[name].format, state[name].tobytes())
+        return state
+
+    def is_undirected(self):
+        """
+        Sprawdza, czy graf jest nieskierowany - czy dla kazdego luku istnieje luk przeciwny o tej samej wadze. Wynik jest zapamietywany.
+        """
+        if self.undirected is None:
+            arcs = Counter()
+            for vertex in range(len(self.labels)):
+                start, end = self.offsets[vertex], self.offsets[vertex + 1]
+                weights = self.weights[start:end] if self.weights is not None else [None] * (end - start)
+                for neighbour, weight in zip(self.targets[start:end], weights):
+                    arcs[(vertex, neighbour, weight)] += 1
+            self.undirected = all(arcs[(end, start, weight)] == count for (start, end, weight), count in arcs.items())
+
+        return self.undirected
+
+    def weight_format(self):
+        """
+        Zwraca kod typu elementow tablicy wag - 'q' lub 'i' dla wag calkowitych, 'd' dla rzeczywistych.
+        """
+        return memoryview(self.weights).format
+
+    def vertex_count(self):
+        """
+        Zwraca liczbe wierzcholkow grafu.
+        """
+        return len(self.labels)
+
+    def arc_count(self):
+        """
+        Zwraca liczbe lukow (wpisow na listach sasiedztwa) grafu.
+        """
+        return len(self.targets)
+
+    def index(self, label):
+        """
+        Zwraca indeks wierzcholka o wskazanej etykiecie.
+        """
+        return self.index_of[label]
+
+    def neighbours(self, vertex):
+        """
+        Zwraca indeksy sasiadow wierzcholka o wskazanym indeksie.
+        """
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def weighted_neighbours(self, vertex):
+        """
+        Zwraca pary (indeks sasiada, waga) dla wierzcholka o wskazanym indeksie.
+        """
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def undirected_edges(self):
+        """
+        Zwraca tablice poczatkow, koncow oraz wag krawedzi nieskierowanych (kazda krawedz wystepuje raz, od mniejszego indeksu).
+        Numer krawedzi to jej pozycja w tych tablicach. Wynik jest zapamietywany.
+        """
+        if self.edge_arrays is None:
+            edge_start, edge_end = array('q'), array('q')
+            edge_weight = array(self.weight_format() if self.weights is not None else 'q')
+            for vertex in range(len(self.labels)):
+                for position in range(self.offsets[vertex], self.offsets[vertex + 1]):
+                    if self.targets[position] > vertex:
+                        edge_start.append(vertex)
+                        edge_end.append(self.targets[position])
+                        edge_weight.append(self.weights[position] if self.weights is not None else 0)
+            self.edge_arrays = (edge_start, edge_end, edge_weight)
+
+        return self.edge_arrays
+
+    def incident_edges(self):
+        """
+        Zwraca indeks krawedzi incydentnych w postaci CSR - numery krawedzi incydentnych z wierzcholkiem i
+        zajmuja pozycje od offsets[i] do offsets[i+1]-1. Kolejnosc krawedzi odpowiada ich numeracji. Wynik jest zapamietywany.
+        """
+        if self.incidence is None:
+            edge_start, edge_end, _ = self.undirected_edges()
+            offsets = array('q', [0 for _ in range(len(self.labels) + 1)])
+            for vertex in edge_start:
+                offsets[vertex + 1] += 1
+            for vertex in edge_end:
+                offsets[vertex + 1] += 1
+            for vertex in range(len(self.labels)):
+                offsets[vertex + 1] += offsets[vertex]
+
+            edges = array('q', bytes(8 * offsets[-1]))
+            positions = array('q', offsets[:-1])
+            for edge_id in range(len(edge_start)):
+                for vertex in (edge_start[edge_id], edge_end[edge_id]):
+                    edges[positions[vertex]] = edge_id
+                    positions[vertex] += 1
+            self.incidence = (offsets, edges)
+
+        return self.incidence
+
+    def memory_usage(self):
+        """
+        Zwraca rozmiar pamieci zajmowanej przez reprezentacje grafu (w bajtach) oraz jego przelicznik na jeden luk.
+        """
+        arrays = [self.offsets, self.targets]
+        if self.weights is not None:
+            arrays.append(self.weights)
+        for derived in (self.edge_arrays, self.incidence):
+            if derived is not None:
+                arrays.extend(derived)
+        # Widok memoryview nie obejmuje w sys.getsizeof pamieci bufora, na ktory wskazuje
+        total = sum(sys.getsizeof(x) + (x.nbytes if isinstance(x, memoryview) else 0) for x in arrays)
+        total += sys.getsizeof(self.labels) + sys.getsizeof(self.index_of)
+        return {
+            "bytes": total,
+            "bytes_per_edge": total / max(len(self.targets), 1)
+        }
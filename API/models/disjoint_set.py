@@ -0,0 +1,41 @@
+class DisjointSet:
+    """
+    Klasa reprezentujaca rodzine zbiorow rozlacznych (union-find) z kompresja sciezek oraz laczeniem wedlug rangi.
+    """
+    def __init__(self, size=0):
+        """
+        Tworzy rodzine size jednoelementowych zbiorow.
+        """
+        self.parents = list(range(size))
+        self.ranks = [0 for _ in range(size)]
+
+    def find(self, vertex):
+        """
+        Znajduje reprezentanta zbioru zawierajacego wskazany wierzcholek i skraca sciezke do niego.
+        """
+        root = vertex
+        while self.parents[root] != root:
+            root = self.parents[root]
+
+        # Kompresja sciezki - kazdy wierzcholek na sciezce wskazuje bezposrednio na reprezentanta
+        while self.parents[vertex] != root:
+            self.parents[vertex], vertex = root, self.parents[vertex]
+
+        return root
+
+    def union(self, vertex1, vertex2):
+        """
+        Laczy zbiory zawierajace wskazane wierzcholki. Zwraca False, jesli wierzcholki juz naleza do tego samego zbioru.
+        """
+        root1, root2 = self.find(vertex1), self.find(vertex2)
+        if root1 == root2:
+            return False
+
+        # Korzen nizszego drzewa zostaje podpiety pod korzen wyzszego
+        if self.ranks[root1] < self.ranks[root2]:
+            root1, root2 = root2, root1
+        self.parents[root2] = root1
+        if self.ranks[root1] == self.ranks[root2]:
+            self.ranks[root1] += 1
+
+        return True
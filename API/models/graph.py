@@ -1,20 +1,26 @@
+import heapq
 import math
-import queue
-from queue import LifoQueue
-from models.edge import Edge, edge_sort
-from bisect import insort
+import time
+from collections import deque
+from models.compact_graph import CompactGraph
+from models.disjoint_set import DisjointSet
+from models.edge import Edge
+from models.messages import DEFAULT_LOCALE, catalog, render
+from models.numpy_engine import numpy, numpy_bellman_ford
+from models.timeline import DeltaStepEncoder, DEFAULT_KEYFRAME_INTERVAL
 
 
 class Graph:
     """
     Klasa reprezentujaca graf prosty.
     """
-    def __init__(self, vertices=list(), adjacency_list=list(), current_vertex=0):
+    def __init__(self, vertices=list(), adjacency_list=list(), current_vertex=0, weights=None, core=None):
         """
         Tworzy obiekt grafu ze wszystkimi niezbednymi atrybutami.
+        Jesli nie podano gotowej zwartej reprezentacji grafu (core), jest ona tworzona na podstawie list wierzcholkow, sasiedztwa oraz wag.
         """
-        self.vertices = vertices
-        self.adjacency_list = adjacency_list
+        self.core = core if core is not None else CompactGraph(vertices, adjacency_list, weights)
+        self.vertices = self.core.labels
         self.current_vertex = current_vertex
         self.parents = [-1 for _ in range(len(self.vertices))]
         self.current_edge = (0,0)
@@ -22,440 +28,715 @@ class Graph:
         self.collection = list()
         self.red_edges = set()
         self.green_edges = set()
-        self.text = ''
+        self.message = (None, ())
+        self.render_info = True
+        self.info_locale = DEFAULT_LOCALE
+        self.step_encoder = None
+        self.tracing = True
+        self.timings = None
+
+    def use_delta_steps(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Wlacza zapis krokow w formacie roznicowym z pelna klatka kluczowa co keyframe_interval krokow.
+        """
+        self.step_encoder = DeltaStepEncoder(keyframe_interval)
+
+    def use_message_codes(self, render_info=True, locale=DEFAULT_LOCALE):
+        """
+        Ustawia sposob przekazywania komunikatow krokow - tresc w wybranym jezyku (pole info)
+        lub kod komunikatu z argumentami (pola info_code oraz info_args) do wyswietlenia przez klienta.
+        """
+        catalog(locale)
+        self.render_info = render_info
+        self.info_locale = locale
+
+    def say(self, code, *args):
+        """
+        Ustawia komunikat biezacego kroku - kod z katalogu komunikatow oraz argumenty. Tresc jest tworzona dopiero w migawce kroku.
+        """
+        self.message = (code, args)
+
+    def info_fields(self):
+        """
+        Zwraca pola migawki opisujace biezacy krok - tresc komunikatu lub jego kod z argumentami.
+        """
+        code, args = self.message
+        if self.render_info:
+            return {"info": render(code, args, self.info_locale)}
+        return {"info_code": code, "info_args": list(args)}
+
+    def create_step(self):
+        """
+        Zwraca migawke aktualnego stanu algorytmu (pojedynczy krok).
+        """
+        raise NotImplementedError
+
+    def run(self):
+        """
+        Generator wykonujacy algorytm. Zatrzymuje sie (yield) w kazdym miejscu, w ktorym aktualny stan algorytmu stanowi kolejny krok.
+        """
+        raise NotImplementedError
+
+    def enable_timing(self):
+        """
+        Wlacza pomiar czasu wykonania algorytmu (algorithm) oraz tworzenia migawek krokow (snapshot) i zliczanie krokow (steps).
+        """
+        self.timings = {"algorithm": 0.0, "snapshot": 0.0, "steps": 0}
+
+    def iter_steps(self):
+        """
+        Generator zwracajacy kolejne kroki algorytmu (zakodowane roznicowo, jesli wybrano taki format).
+        W pamieci przechowywany jest wylacznie biezacy krok.
+        """
+        if self.timings is not None:
+            yield from self.iter_timed_steps()
+            return
+        for _ in self.run():
+            step = self.create_step()
+            if self.step_encoder is not None:
+                step = self.step_encoder.encode(step)
+            yield step
+
+    def iter_timed_steps(self):
+        """
+        Odpowiednik iter_steps, ktory dodatkowo sumuje czas wykonania algorytmu oraz tworzenia migawek krokow w slowniku timings.
+        """
+        clock = time.perf_counter
+        steps = self.run()
+        while True:
+            start = clock()
+            try:
+                next(steps)
+            except StopIteration:
+                self.timings["algorithm"] += clock() - start
+                return
+            snapshot_start = clock()
+            step = self.create_step()
+            if self.step_encoder is not None:
+                step = self.step_encoder.encode(step)
+            self.timings["algorithm"] += snapshot_start - start
+            self.timings["snapshot"] += clock() - snapshot_start
+            self.timings["steps"] += 1
+            yield step
+
+    def collect_steps(self):
+        """
+        Wykonuje algorytm oraz zwraca liste wszystkich wykonanych krokow.
+        """
+        self.steps = list(self.iter_steps())
+        return self.steps
+
+    def result(self):
+        """
+        Zwraca wynik dzialania algorytmu (bez krokow wizualizacji).
+        """
+        raise NotImplementedError
+
+    def compute_result(self):
+        """
+        Wykonuje algorytm bez rejestrowania krokow i tworzenia ich opisow oraz zwraca wylacznie wynik.
+        """
+        self.tracing = False
+        for _ in self.run():
+            pass
+        return self.result()
 
 
 class SearchGraph(Graph):
     """
     Klasa reprezentujaca graf, na ktorym ma zostac wykonane przeszukiwanie wszerz lub w glab.
     """
-    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='queue'):
+    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='queue', core=None, start_vertices=None, forest=False):
         """
         Tworzy obiekt grafu, na ktorym ma zostac wykonane przeszukiwanie wszerz lub w glab, ze wszystkimi niezbednymi atrybutami.
+        Kolekcja wierzcholkow (deque) jest kolejka (collection_type 'queue') lub stosem ('stack'). Przeszukiwanie rozpoczyna sie
+        jednoczesnie od wszystkich wierzcholkow start_vertices (domyslnie od current_vertex). W trybie lasu (forest) po wyczerpaniu
+        kolekcji przeszukiwanie jest kontynuowane od kolejnego nieodwiedzonego wierzcholka, az do odwiedzenia calego grafu.
         """
-        super().__init__(vertices, adjacency_list, current_vertex)
+        super().__init__(vertices, adjacency_list, current_vertex, core=core)
         self.visited = [0 for _ in range(len(self.vertices))]
         self.collection_type = collection_type
+        self.collection = deque()
+        self.start_vertices = list(start_vertices) if start_vertices is not None else [current_vertex]
+        self.forest = forest
+        self.step_number = 0
+        self.order = list()
 
-    def add_to_step_list(self, step_number):
+    def create_step(self):
         """
-        Dodaje aktualny krok algorytmu do listy wszystkich krokow.
+        Zwraca migawke aktualnego stanu przeszukiwania.
         """
-        self.steps.append({
-            "step_number": step_number,
+        return {
+            "step_number": self.step_number,
             "visited": self.visited.copy(),
             "current_vertex": self.current_vertex,
             "current_edge": self.current_edge,
             "red_edges": list(self.red_edges),
             "green_edges": list(self.green_edges),
-            "info": self.text
-        })
+            **self.info_fields()
+        }
 
     def search(self):
         """
         Wykonuje przeszukiwanie zadanego grafu oraz zwraca liste wykonanych krokow.
         """
-        self.steps = list()
-        current_vertex_index = self.vertices.index(self.current_vertex)
-        self.collection.put(self.current_vertex)
-        self.visited[current_vertex_index] = 1
-        step_number = 0
+        return self.collect_steps()
+
+    def result(self):
+        """
+        Zwraca kolejnosc przetwarzania wierzcholkow oraz drzewo przeszukiwania (rodzica kazdego wierzcholka, -1 dla korzenia i wierzcholkow nieosiagalnych).
+        """
+        return {
+            "order": [self.vertices[vertex] for vertex in self.order],
+            "parents": [self.vertices[parent] if parent != -1 else -1 for parent in self.parents]
+        }
+
+    def run(self):
+        """
+        Generator wykonujacy przeszukiwanie zadanego grafu.
+        """
+        try:
+            start_indices = [self.core.index(vertex) for vertex in self.start_vertices]
+        except KeyError as error:
+            raise ValueError(f'Nieznany wierzcholek startowy: {error.args[0]}.')
+        for vertex in start_indices:
+            if self.visited[vertex] == 0:
+                self.collection.append(vertex)
+                self.visited[vertex] = 1
+        take = self.collection.popleft if self.collection_type == 'queue' else self.collection.pop
+        next_root = 0
+        self.step_number = 0
 
         # Petla przetwarzajaca kolejne wierzcholki z kolejki / stosu
-        while not self.collection.empty():
-            self.current_vertex = self.collection.get()
-            self.current_edge = (0, 0)
-            current_vertex_index = self.vertices.index(self.current_vertex)
-            neighbours = self.adjacency_list[current_vertex_index]
-            self.text = f'Przetwarzanie wierzchołka {self.current_vertex}.'
-            self.add_to_step_list(step_number)
+        while self.collection or self.forest:
+            if not self.collection:
+                # W trybie lasu przeszukiwanie jest kontynuowane od pierwszego nieodwiedzonego wierzcholka
+                while next_root < len(self.visited) and self.visited[next_root] != 0:
+                    next_root += 1
+                if next_root == len(self.visited):
+                    break
+                self.collection.append(next_root)
+                self.visited[next_root] = 1
+                if self.tracing:
+                    self.current_vertex = self.vertices[next_root]
+                    self.current_edge = (0, 0)
+                    self.say('search.new_root', self.current_vertex)
+                    yield
+
+            current_vertex_index = take()
+            self.order.append(current_vertex_index)
+            if self.tracing:
+                self.current_vertex = self.vertices[current_vertex_index]
+                self.current_edge = (0, 0)
+                self.say('search.processing_vertex', self.current_vertex)
+                yield
 
             # Petla sprawdzajaca kazdego sasiada aktualnie przetwarzanego wierzcholka
-            for neighbour in neighbours:
-                current_neighbour_index = self.vertices.index(neighbour)
-                self.current_edge = (self.current_vertex, current_neighbour_index)
+            for current_neighbour_index in self.core.neighbours(current_vertex_index):
 
                 # Jesli sprawdzany sasiad jest nieodwiedzony, dodaj go do kolejki / stosu
                 if self.visited[current_neighbour_index] == 0:
-                    self.text = f'Dodanie wierzchołka {current_neighbour_index} do kolejki. Dodanie krawędzi łączącej wierzchołki {self.current_vertex} oraz {current_neighbour_index} do drzewa wynikowego.'
-                    self.collection.put(neighbour)
+                    self.collection.append(current_neighbour_index)
                     self.visited[current_neighbour_index] = 1
-                    self.parents[current_neighbour_index] = self.current_vertex
-                    self.green_edges.add((self.current_vertex, current_neighbour_index))
+                    self.parents[current_neighbour_index] = current_vertex_index
+                    if self.tracing:
+                        self.say('search.edge_added', self.current_vertex, current_neighbour_index)
+                        self.green_edges.add((self.current_vertex, current_neighbour_index))
 
                 # Sprawdzany sasiad byl juz wczesniej odwiedzony
-                elif self.parents[self.current_vertex] != current_neighbour_index:
-                    self.text = f'Krawędź łącząca wierzchołki {self.current_vertex} oraz {current_neighbour_index} nie zostaje dodana do drzewa wynikowego.'
+                elif not self.tracing:
+                    continue
+                elif self.parents[current_vertex_index] != current_neighbour_index:
+                    self.say('search.edge_rejected', self.current_vertex, current_neighbour_index)
                     self.red_edges.add((self.current_vertex, current_neighbour_index))
                 else:
                     self.red_edges.add((self.current_vertex, current_neighbour_index))
-                    self.text = f'Krawędź łącząca wierzchołki {self.current_vertex} oraz {current_neighbour_index} została już wcześniej odwiedzona i dodana do drzewa wynikowego.'
-                step_number += 1
-                self.add_to_step_list(step_number)
+                    self.say('search.edge_in_tree', self.current_vertex, current_neighbour_index)
 
-            self.visited[current_vertex_index] = 2
-            step_number += 1
+                if self.tracing:
+                    self.current_edge = (self.current_vertex, current_neighbour_index)
+                    self.step_number += 1
+                    yield
 
-        self.text = f'Wynik działania algorytmu.'
-        self.add_to_step_list(step_number)
+            self.visited[current_vertex_index] = 2
+            self.step_number += 1
 
-        return self.steps
+        self.say('search.result')
+        yield
 
 
 class BFSGraph(SearchGraph):
     """
     Klasa reprezentujaca graf, na ktorym ma zostac wykonane przeszukiwanie wszerz.
     """
-    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='queue'):
+    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='queue', core=None, start_vertices=None, forest=False):
         """
         Tworzy obiekt grafu, na ktorym ma zostac wykonane przeszukiwanie wszerz, ze wszystkimi niezbednymi atrybutami.
         """
-        super().__init__(vertices, adjacency_list, current_vertex, collection_type)
-        self.collection = queue.Queue()
+        super().__init__(vertices, adjacency_list, current_vertex, collection_type, core, start_vertices, forest)
 
 
 class DFSGraph(SearchGraph):
     """
     Klasa reprezentujaca graf, na ktorym ma zostac wykonane przeszukiwanie w glab.
     """
-    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='stack'):
+    def __init__(self, vertices=None, adjacency_list=None, current_vertex=0, collection_type='stack', core=None, start_vertices=None, forest=False):
         """
         Tworzy obiekt grafu, na ktorym ma zostac wykonane przeszukiwanie w glab, ze wszystkimi niezbednymi atrybutami.
         """
-        super().__init__(vertices, adjacency_list, current_vertex, collection_type)
-        self.collection = LifoQueue()
+        super().__init__(vertices, adjacency_list, current_vertex, collection_type, core, start_vertices, forest)
 
 
 class MinimumSpanningTreeGraph(Graph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST).
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0, core=None):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST), ze wszystkimi niezbednymi atrybutami.
+        Krawedzie grafu sa identyfikowane numerami pozycji w tablicach edge_start, edge_end oraz edge_weight.
         """
-        super().__init__(vertices, adjacency_list, current_vertex)
-        self.weights = weights
-        self.edge_list = list()
+        super().__init__(vertices, adjacency_list, current_vertex, weights, core)
+        self.edge_start, self.edge_end, self.edge_weight = self.core.undirected_edges()
         self.mst_edges = list()
         self.green_vertices = set()
-        self.create_edge_list()
+        self.step_number = 0
 
-    def create_edge_list(self):
+    def serialize_edge(self, edge_id):
         """
-        Tworzy liste krawedzi grafu na podstawie list sasiedztwa.
+        Zwraca krawedz o wskazanym numerze w postaci zserializowanej.
         """
-        for i in range(len(self.adjacency_list)):
-            for j in range(len(self.adjacency_list[i])):
-                if self.adjacency_list[i][j] > i:
-                    self.edge_list.append(Edge(i, self.adjacency_list[i][j], self.weights[i][j]))    
+        return Edge(self.edge_start[edge_id], self.edge_end[edge_id], self.edge_weight[edge_id]).serialize()
 
-    def add_to_step_list(self, step_number, current_edge):
+    def create_step(self):
         """
-        Dodaje aktualny krok algorytmu do listy wszystkich krokow.
+        Zwraca migawke aktualnego stanu algorytmu.
         """
-        self.steps.append({
-            "step_number": step_number,
-            "current_edge": (current_edge.start, current_edge.end),
+        return {
+            "step_number": self.step_number,
+            "current_edge": self.current_edge,
             "red_edges": list(self.red_edges),
             "green_edges": list(self.green_edges),
             "green_vertices": list(self.green_vertices),
-            "info": self.text
-        })
+            **self.info_fields()
+        }
+
+    def find_minimum_spanning_tree(self):
+        """
+        Znajduje minimalne drzewo rozpinajace oraz zwraca liste wszystkich wykonanych krokow.
+        """
+        return self.collect_steps()
+
+    def result(self):
+        """
+        Zwraca krawedzie minimalnego drzewa rozpinajacego oraz jego calkowita wage.
+        """
+        return {
+            "mst_edges": self.mst_edges,
+            "total_weight": sum(edge["weight"] for edge in self.mst_edges)
+        }
 
 
 class KruskalGraph(MinimumSpanningTreeGraph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Kruskala.
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, core=None):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Kruskala, ze wszystkimi niezbednymi atrybutami.
         """
-        super().__init__(vertices, adjacency_list, weights)
-        self.edge_list.sort(key=edge_sort)
+        super().__init__(vertices, adjacency_list, weights, core=core)
+        self.edge_order = sorted(range(len(self.edge_weight)), key=self.edge_weight.__getitem__)
+        self.components = DisjointSet(len(self.vertices))
 
     def find_representative(self, vertex):
         """
         Znajduje reprezentanta wskazanego wierzcholka.
         """
-        parent = self.parents[vertex]
-        if parent == -1:
-            return vertex
-        else:
-            return self.find_representative(parent)
+        return self.components.find(vertex)
 
-    def find_minimum_spanning_tree(self):
+    def run(self):
         """
-        Znajduje minimalne drzewo rozpinajace za pomoca algorytmu Kruskala oraz zwraca liste wszystkich wykonanych krokow.
+        Generator znajdujacy minimalne drzewo rozpinajace za pomoca algorytmu Kruskala.
         """
-        step_number = 0
+        self.step_number = 0
 
         # Przetwarzanie kolejnych krawedzi z posortowanej listy
-        for edge in self.edge_list:
+        for edge in self.edge_order:
 
             # Sprawdzanie reprezentantow dla kazdego z koncow badanej krawedzi
-            vertex1, vertex2 = edge.start, edge.end
+            vertex1, vertex2 = self.edge_start[edge], self.edge_end[edge]
             parent1, parent2 = self.find_representative(vertex1), self.find_representative(vertex2)
-            self.text = f'Sprawdzanie krawędzi łączącej wierzchołki {vertex1} oraz {vertex2}.'
-            self.add_to_step_list(step_number, edge)
-            step_number += 1
+            if self.tracing:
+                self.current_edge = (vertex1, vertex2)
+                self.say('mst.checking_edge', vertex1, vertex2)
+                yield
+            self.step_number += 1
 
             # Jesli wierzcholki naleza do roznych spojnych skladowych, dodaj krawedz do wyniku
             if parent1 != parent2:
-                self.parents[parent2] = parent1
-                self.mst_edges.append(edge.serialize())
-                self.green_edges.add((edge.start, edge.end))
-                self.green_vertices.add(edge.start)
-                self.green_vertices.add(edge.end)
-                self.text = f'Krawędź łącząca wierzchołki {vertex1} oraz {vertex2} nie utworzy cyklu - zostaje dodana do drzewa wynikowego.'
-                self.add_to_step_list(step_number, edge)
+                self.components.union(parent1, parent2)
+                self.mst_edges.append(self.serialize_edge(edge))
+                if self.tracing:
+                    self.green_edges.add((vertex1, vertex2))
+                    self.green_vertices.add(vertex1)
+                    self.green_vertices.add(vertex2)
+                    self.say('kruskal.edge_added', vertex1, vertex2)
+                    yield
 
                 # Jesli graf wynikowy ma n-1 krawedzi, zakoncz dzialanie algorytmu
                 if len(self.mst_edges) == len(self.vertices) - 1:
                     break
 
             # Jesli wierzcholki naleza do tej samej spojnej skladowej, krawedz jest odrzucana
-            else:
-                self.text = f'Krawędź łącząca wierzchołki {vertex1} oraz {vertex2} spowoduje utworzenie cyklu - nie zostaje dodana do drzewa wynikowego.'
-                self.red_edges.add((edge.start, edge.end))
-                self.add_to_step_list(step_number, edge)
-            step_number += 1
-
-        return self.steps
+            elif self.tracing:
+                self.say('kruskal.edge_rejected', vertex1, vertex2)
+                self.red_edges.add((vertex1, vertex2))
+                yield
+            self.step_number += 1
 
 
 class PrimDijkstraGraph(MinimumSpanningTreeGraph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Prima-Dijkstry.
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0, core=None):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione minimalne drzewo rozpinajace (MST) za pomoca algorytmu Prima-Dijkstry, ze wszystkimi niezbednymi atrybutami.
         """
-        super().__init__(vertices, adjacency_list, weights, current_vertex)
-        self.visited_edge = [-1 for _ in range(len(self.edge_list))]
+        super().__init__(vertices, adjacency_list, weights, current_vertex, core)
+        self.visited_edge = bytearray(len(self.edge_weight))
+        self.incidence_offsets, self.incident_edges = self.core.incident_edges()
+        self.insertion_counter = 0
 
     def find_and_add_edges(self, edges, vertex):
         """
-        Znajduje wszystkie nieodwiedzone krawedzie incydentne ze wskazanym wierzcholkiem.
+        Dodaje do kopca wszystkie nieodwiedzone krawedzie incydentne ze wskazanym wierzcholkiem.
+        Krawedzie o rownych wagach sa zdejmowane z kopca w kolejnosci dodania.
         """
-        new_edges = [x for x in self.edge_list if x.start == vertex or x.end == vertex]
-        for edge in new_edges:
-            index = self.edge_list.index(edge)
-            if self.visited_edge[index] == -1:
-                insort(edges, edge, key=edge_sort)
-                self.visited_edge[index] = 1
+        for position in range(self.incidence_offsets[vertex], self.incidence_offsets[vertex + 1]):
+            edge_id = self.incident_edges[position]
+            if self.visited_edge[edge_id] == 0:
+                heapq.heappush(edges, (self.edge_weight[edge_id], self.insertion_counter, edge_id))
+                self.insertion_counter += 1
+                self.visited_edge[edge_id] = 1
 
         return edges
 
-    def find_minimum_spanning_tree(self):
+    def run(self):
         """
-        Znajduje minimalne drzewo rozpinajace za pomoca algorytmu Prima-Dijkstry oraz zwraca liste wszystkich wykonanych krokow.
+        Generator znajdujacy minimalne drzewo rozpinajace za pomoca algorytmu Prima-Dijkstry.
         """
         # Nadanie wartosci poczatkowych
-        edges = [x for x in self.edge_list if x.start == self.current_vertex or x.end == self.current_vertex]
-        edges.sort(key=edge_sort)
+        edges = self.find_and_add_edges(list(), self.current_vertex)
         n = len(self.vertices)
         self.parents[self.current_vertex] = -2
-        step_number = 0
-        sum = 0
-
-        for edge in edges:
-            index = self.edge_list.index(edge)
-            self.visited_edge[index] = 1
+        self.step_number = 0
 
         # Sprawdzanie kazdej krawedzi, z ktora incydentne sa wierzcholki w grafie
         while len(edges) > 0 and n - 1 != len(self.mst_edges):
-            current_edge = edges[0]
-            edges.pop(0)
-            vertex1, vertex2 = current_edge.start, current_edge.end
-            self.text = f'Sprawdzanie krawędzi łączącej wierzchołki {vertex1} oraz {vertex2}.'
-            self.add_to_step_list(step_number, current_edge)
-            step_number += 1
+            current_edge = heapq.heappop(edges)[2]
+            vertex1, vertex2 = self.edge_start[current_edge], self.edge_end[current_edge]
+            if self.tracing:
+                self.current_edge = (vertex1, vertex2)
+                self.say('mst.checking_edge', vertex1, vertex2)
+                yield
+            self.step_number += 1
 
             # Jesli pierwszy wierzcholek jeszcze nie jest w grafie, dodaj go do wyniku
             if self.parents[vertex1] == -1:
-                self.mst_edges.append(current_edge.serialize())
+                self.mst_edges.append(self.serialize_edge(current_edge))
                 edges = self.find_and_add_edges(edges, vertex1)
                 self.parents[vertex1] = vertex2
-                self.green_edges.add((vertex1, vertex2))
-                self.green_vertices.add(vertex1)
-                self.green_vertices.add(vertex2)
-                self.text = f'Krawędź łącząca wierzchołki {vertex1} oraz {vertex2} została dodana.'
+                if self.tracing:
+                    self.green_edges.add((vertex1, vertex2))
+                    self.green_vertices.add(vertex1)
+                    self.green_vertices.add(vertex2)
+                    self.say('prim.edge_added', vertex1, vertex2)
 
             # Jesli drugi wierzcholek jeszcze nie jest w grafie, dodaj go do wyniku
             elif self.parents[vertex2] == -1:
-                self.mst_edges.append(edges[0].serialize())
+                self.mst_edges.append(self.serialize_edge(current_edge))
                 edges = self.find_and_add_edges(edges, vertex2)
                 self.parents[vertex2] = vertex1
-                self.green_edges.add((vertex1, vertex2))
-                self.green_vertices.add(vertex1)
-                self.green_vertices.add(vertex2)
-                self.text = f'Krawędź łącząca wierzchołki {vertex1} oraz {vertex2} nie utworzy cyklu - została dodana do drzewa wynikowego.'
+                if self.tracing:
+                    self.green_edges.add((vertex1, vertex2))
+                    self.green_vertices.add(vertex1)
+                    self.green_vertices.add(vertex2)
+                    self.say('prim.edge_added_without_cycle', vertex1, vertex2)
             
             # Jesli obydwa wierzcholki sa juz w grafie, odrzuc krawedz
-            else:
+            elif self.tracing:
                 self.red_edges.add((vertex1, vertex2))
-                self.text = f'Krawędź łącząca wierzchołki {vertex1} oraz {vertex2} spowoduje powstanie cyklu - nie została dodana do drzewa wynikowego.'
+                self.say('prim.edge_rejected', vertex1, vertex2)
 
-            self.add_to_step_list(step_number, current_edge)
-            step_number += 1
-            
-        return self.steps
+            if self.tracing:
+                yield
+            self.step_number += 1
 
     
 class ShortestPathsGraph(Graph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione drzewo najkrotszych drog.
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0, core=None):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione drzewo najkrotszych drog, ze wszystkimi niezbednymi atrybutami.
         """
-        super().__init__(vertices, adjacency_list, current_vertex)
-        self.weights = weights
+        super().__init__(vertices, adjacency_list, current_vertex, weights, core)
         self.costs = [math.inf for _ in range(len(self.vertices))]
 
+    def find_shortest_paths(self):
+        """
+        Znajduje drzewo najkrotszych drog dla zadanego grafu oraz zwraca liste wszystkich wykonanych krokow.
+        """
+        return self.collect_steps()
+
+    def result(self):
+        """
+        Zwraca koszty dotarcia do wierzcholkow (None dla wierzcholkow nieosiagalnych) oraz ich poprzednikow w drzewie najkrotszych drog.
+        """
+        return {
+            "costs": [cost if cost != math.inf else None for cost in self.costs],
+            "parents": self.parents
+        }
+
 
 class DijkstraGraph(ShortestPathsGraph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione drzewo najkrotszych drog za pomoca algoytmu Dijkstry.
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0, target_vertex=None, core=None):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione drzewo najkrotszych drog za pomoca algorytmu Dijkstry, ze wszystkimi niezbednymi atrybutami.
+        Jesli podano wierzcholek docelowy, algorytm konczy dzialanie po jego odwiedzeniu.
         """
-        super().__init__(vertices, adjacency_list, weights, current_vertex)
+        super().__init__(vertices, adjacency_list, weights, current_vertex, core)
+        self.target_vertex = target_vertex
         self.visited = [-1 for _ in range(len(self.vertices))]
         self.green_vertices = set()
+        self.queue = list()
+        self.next_unvisited = 0
 
-    def add_to_step_list(self):
+    def create_step(self):
         """
-        Dodaje aktualny krok algorytmu do listy wszystkich krokow.
+        Zwraca migawke aktualnego stanu algorytmu.
         """
-        self.steps.append({
+        return {
             "green_vertices": list(self.green_vertices),
             "green_edges": list(self.green_edges),
-            "info": self.text,
+            **self.info_fields(),
             "current_edge": self.current_edge
-        })
+        }
 
-    def find_shortest_paths(self):
+    def pop_min_cost_vertex(self):
         """
-        Znajduje drzewo najkrotszych drog dla zadanego grafu przy pomocy algorytmu Dijkstry oraz zwraca liste wszystkich wykonanych krokow.
+        Zdejmuje z kopca najtanszy nieodwiedzony wierzcholek (przy rownych kosztach - o najmniejszym numerze).
+        Nieaktualne wpisy kopca sa pomijane. Gdy kopiec jest pusty, zwracany jest pierwszy nieodwiedzony (nieosiagalny) wierzcholek.
+        """
+        while self.queue:
+            cost, vertex = heapq.heappop(self.queue)
+            if self.visited[vertex] == -1 and cost == self.costs[vertex]:
+                return vertex
+
+        while self.visited[self.next_unvisited] != -1:
+            self.next_unvisited += 1
+        return self.next_unvisited
+
+    def run(self):
+        """
+        Generator znajdujacy drzewo najkrotszych drog dla zadanego grafu przy pomocy algorytmu Dijkstry.
         """
         # Ustalanie kosztow poczatkowych dla wierzcholkow polaczonych z wierzcholkiem startowym
-        step_number = 0
         self.costs[self.current_vertex] = 0
-        for vertex in self.adjacency_list[self.current_vertex]:
-            vertex_index = self.adjacency_list[self.current_vertex].index(vertex)
-            self.costs[vertex] = self.weights[self.current_vertex][vertex_index]
-            self.parents[vertex] = self.current_vertex
+        for vertex, weight in self.core.weighted_neighbours(self.current_vertex):
+            # Przy krawedziach wielokrotnych kosztem poczatkowym jest najmniejsza z wag
+            if weight < self.costs[vertex] and vertex != self.current_vertex:
+                self.costs[vertex] = weight
+                self.parents[vertex] = self.current_vertex
         self.visited[self.current_vertex] = 1
+        self.queue = [(self.costs[vertex], vertex) for vertex in set(self.core.neighbours(self.current_vertex))]
+        heapq.heapify(self.queue)
         
-        self.green_vertices.add(self.current_vertex)
-        self.text = 'Inicjalizacja - poszukiwanie najtańszego sąsiada wierzchołka startowego.'
-        self.add_to_step_list()
-        step_number += 1
+        if self.tracing:
+            self.green_vertices.add(self.current_vertex)
+            self.say('dijkstra.init')
+            yield
+        if self.target_vertex == self.current_vertex:
+            return
 
         # Petla przechodzaca po kolejnych wierzcholkach, do ktorych koszt dotarcia jest najnizszy
         for _ in range(len(self.vertices)-1):
-            self.current_edge = (0, 0)
-            min_cost_vertex = self.visited.index(-1)
-            for i in range(min_cost_vertex+1, len(self.vertices)):
-                if self.visited[i] == -1 and self.costs[i] < self.costs[min_cost_vertex]:
-                    min_cost_vertex = i
-            self.text = f'Wybór najtańszego nieodwiedzonego wierzchołka - wierzchołek {min_cost_vertex}.'
-            self.green_vertices.add(min_cost_vertex)
-            self.green_edges.add((self.parents[min_cost_vertex], min_cost_vertex))
-            self.add_to_step_list()
-            step_number += 1
+            min_cost_vertex = self.pop_min_cost_vertex()
+            if self.tracing:
+                self.current_edge = (0, 0)
+                self.say('dijkstra.vertex_selected', min_cost_vertex)
+                self.green_vertices.add(min_cost_vertex)
+                self.green_edges.add((self.parents[min_cost_vertex], min_cost_vertex))
+                yield
+
+            # Jesli odwiedzono wierzcholek docelowy, jego koszt jest juz ostateczny
+            if min_cost_vertex == self.target_vertex:
+                self.visited[min_cost_vertex] = 1
+                if self.tracing:
+                    self.say('dijkstra.target_reached', min_cost_vertex)
+                    yield
+                break
 
             # Korygowanie kosztu dla wszystkich nieodwiedzonych sasiadow aktualnie przetwarzanego wierzcholka
-            for neighbour in self.adjacency_list[min_cost_vertex]:
+            for neighbour, weight in self.core.weighted_neighbours(min_cost_vertex):
                 if self.visited[neighbour] == -1:
-                    self.text = f'Korekta kosztu na podstawie krawędzi łączącej wierzchołki {min_cost_vertex} oraz {neighbour}.'
-                    self.current_edge = (min_cost_vertex, neighbour)
-                    neighbour_index = self.adjacency_list[min_cost_vertex].index(neighbour)
-                    if self.costs[neighbour] > self.costs[min_cost_vertex] + self.weights[min_cost_vertex][neighbour_index]:
-                        self.costs[neighbour] = self.costs[min_cost_vertex] + self.weights[min_cost_vertex][neighbour_index]
+                    if self.costs[neighbour] > self.costs[min_cost_vertex] + weight:
+                        self.costs[neighbour] = self.costs[min_cost_vertex] + weight
                         self.parents[neighbour] = min_cost_vertex
-                    self.add_to_step_list()
-                    step_number += 1
+                        heapq.heappush(self.queue, (self.costs[neighbour], neighbour))
+                    if self.tracing:
+                        self.say('dijkstra.edge_relaxed', min_cost_vertex, neighbour)
+                        self.current_edge = (min_cost_vertex, neighbour)
+                        yield
             self.visited[min_cost_vertex] = 1
-            self.text = f'Wszystkie korekty wierzchołka {min_cost_vertex} zostały dokonane - jest już odwiedzony.'
-            self.current_edge = (0, 0)
-            self.add_to_step_list()
-            step_number += 1
-        return self.steps
+            if self.tracing:
+                self.say('dijkstra.vertex_visited', min_cost_vertex)
+                self.current_edge = (0, 0)
+                yield
+
+
+# Minimalna liczba lukow, od ktorej tryb result algorytmu Bellmana-Forda korzysta z silnika NumPy (silnik 'auto')
+NUMPY_MIN_ARCS = 20000
 
 
 class BellmanFordGraph(ShortestPathsGraph):
     """
     Klasa reprezentujaca graf, dla ktorego ma zostac znalezione drzewo najkrotszych drog za pomoca algorytmu Bellmana-Forda.
     """
-    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0):
+    def __init__(self, vertices=None, adjacency_list=None, weights=None, current_vertex=0, core=None, engine='auto'):
         """
         Tworzy obiekt grafu, dla ktorego ma zostac znalezione drzewo najkrotszych drog za pomoca algorytmu Bellmana-Forda, ze wszystkimi niezbednymi atrybutami.
+        Parametr engine wybiera sposob obliczania samego wyniku (tryb result): 'python', 'numpy' lub 'auto' (NumPy dla duzych grafow, jesli jest dostepny).
         """
-        super().__init__(vertices, adjacency_list, weights, current_vertex)
+        super().__init__(vertices, adjacency_list, weights, current_vertex, core)
+        if engine not in ('auto', 'python', 'numpy'):
+            raise ValueError(f'Nieznany silnik obliczen: {engine}.')
+        if engine == 'numpy' and numpy is None:
+            raise ValueError('Silnik numpy wymaga zainstalowanej biblioteki NumPy.')
+        self.engine = engine
+        self.processed_vertex = current_vertex
+        self.negative_cycle = False
 
-    def add_to_step_list(self, current_vertex):
+    def create_step(self):
         """
-        Dodaje aktualny krok algorytmu do listy wszystkich krokow.
+        Zwraca migawke aktualnego stanu algorytmu.
         """
-        self.steps.append({
-            "current_vertex": current_vertex,
+        return {
+            "current_vertex": self.processed_vertex,
             "green_edges": list(self.green_edges),
-            "info": self.text,
+            **self.info_fields(),
             "current_edge": self.current_edge
-        })
+        }
 
-    def find_shortest_paths(self):
+    def result(self):
+        """
+        Zwraca koszty dotarcia do wierzcholkow, ich poprzednikow oraz informacje o wykryciu cyklu o ujemnej wadze.
+        """
+        result = super().result()
+        result["negative_cycle"] = self.negative_cycle
+        return result
+
+    def use_numpy(self):
+        """
+        Sprawdza, czy wynik ma zostac obliczony przez silnik NumPy.
+        """
+        if self.engine == 'auto':
+            return numpy is not None and self.core.arc_count() >= NUMPY_MIN_ARCS
+        return self.engine == 'numpy'
+
+    def compute_result(self):
         """
-        Znajduje drzewo najkrotszych drog dla zadanego grafu przy pomocy algorytmu Bellmana-Forda oraz zwraca liste wszystkich wykonanych krokow.
+        Oblicza wynik bez rejestrowania krokow - petla w jezyku Python lub relaksacja wszystkich lukow naraz w silniku NumPy.
+        Przy rownych kosztach silnik NumPy moze wskazac innego (rownie dobrego) poprzednika wierzcholka.
+        """
+        if not self.use_numpy():
+            return super().compute_result()
+        self.costs, self.parents, self.negative_cycle = numpy_bellman_ford(self.core, self.current_vertex)
+        return self.result()
+
+    def has_negative_cycle(self):
+        """
+        Sprawdza, czy ktorykolwiek luk nadal pozwala zmniejszyc koszt - oznacza to cykl o ujemnej wadze osiagalny z wierzcholka startowego.
+        """
+        for vertex in range(len(self.vertices)):
+            if self.costs[vertex] == math.inf:
+                continue
+            for neighbour, weight in self.core.weighted_neighbours(vertex):
+                if self.costs[neighbour] > self.costs[vertex] + weight:
+                    return True
+        return False
+
+    def run(self):
+        """
+        Generator znajdujacy drzewo najkrotszych drog dla zadanego grafu przy pomocy algorytmu Bellmana-Forda.
+        Algorytm konczy dzialanie, gdy pelny przebieg nie zmieni zadnego kosztu. Po wykonaniu wszystkich n-1 przebiegow sprawdzane jest
+        wystepowanie cyklu o ujemnej wadze.
         """
         # Ustalanie kosztow poczatkowych dla wierzcholkow polaczonych z wierzcholkiem startowym
-        step_number = 0
         self.costs[self.current_vertex] = 0
-        for vertex in self.adjacency_list[self.current_vertex]:
-            vertex_index = self.adjacency_list[self.current_vertex].index(vertex)
-            self.costs[vertex] = self.weights[self.current_vertex][vertex_index]
-            self.parents[vertex] = self.current_vertex
-            self.green_edges.add((self.current_vertex, vertex))
+        for vertex, weight in self.core.weighted_neighbours(self.current_vertex):
+            # Petla wierzcholka startowego nie zmienia jego kosztu, a przy lukach wielokrotnych kosztem poczatkowym jest najmniejsza z wag
+            if weight < self.costs[vertex] and vertex != self.current_vertex:
+                self.costs[vertex] = weight
+                self.parents[vertex] = self.current_vertex
+                self.green_edges.add((self.current_vertex, vertex))
         
-        self.text = 'Inicjalizacja - ustalenie kosztów na podstawie danych o sąsiadach wierzchołka początkowego.'
-        self.add_to_step_list(self.current_vertex)
-        step_number += 1
+        if self.tracing:
+            self.say('bellman_ford.init')
+            self.processed_vertex = self.current_vertex
+            yield
         
         # Petla glowna - przejdzie n-1 razy po wszystkich wierzcholkach
         for i in range(len(self.vertices)-1):
-            for vertex in self.vertices:
+            relaxed = False
+            for vertex in range(len(self.vertices)):
+                self.processed_vertex = vertex
 
                 # Korygowanie wag dla wszystkich sasiadow aktualnie przetwarzanego wierzcholka
-                for neighbour in self.adjacency_list[vertex]:
-                    neighbour_index = self.adjacency_list[vertex].index(neighbour)
-                    if self.costs[neighbour] > self.costs[vertex] + self.weights[vertex][neighbour_index]:
-                        self.costs[neighbour] = self.costs[vertex] + self.weights[vertex][neighbour_index]
-                        if self.parents[neighbour] != -1:
-                            self.green_edges.remove((self.parents[neighbour], neighbour))
-                            self.text = f'Iteracja {i+1}: usunięcie krawędzi łączącej wierzchołki {self.parents[neighbour]} oraz {neighbour} z wyniku. '
-                        else:
-                            self.text = f'Iteracja {i+1}: '
-                        self.text += f'Dodanie krawędzi łączącej wierzchołki {vertex} oraz {neighbour} do wyniku. Aktualizacja kosztów dotarcia do wierzchołka {neighbour}.'
+                for neighbour, weight in self.core.weighted_neighbours(vertex):
+                    if self.costs[neighbour] > self.costs[vertex] + weight:
+                        self.costs[neighbour] = self.costs[vertex] + weight
+                        relaxed = True
+                        if self.tracing:
+                            if self.parents[neighbour] != -1:
+                                self.green_edges.remove((self.parents[neighbour], neighbour))
+                                self.say('bellman_ford.edge_replaced', i+1, self.parents[neighbour], vertex, neighbour)
+                            else:
+                                self.say('bellman_ford.edge_added', i+1, vertex, neighbour)
+                            self.green_edges.add((vertex, neighbour))
                         self.parents[neighbour] = vertex
-                        self.green_edges.add((vertex, neighbour))
-                    else:
-                        self.text = f'Iteracja {i+1}: krawędź łącząca wierzchołki {vertex} oraz {neighbour} nie wnosi żadnych zmian.'
-
-                    self.current_edge = (vertex, neighbour)
-                    self.add_to_step_list(vertex)
-                    step_number += 1
-
-                self.current_edge = (0, 0)
-                self.text = f'Iteracja {i+1}: zakończenie przetwarzania wierzchołka {vertex}.'
-                self.add_to_step_list(vertex)
-                step_number += 1
-
-        return self.steps
+                    elif self.tracing:
+                        self.say('bellman_ford.edge_unchanged', i+1, vertex, neighbour)
+
+                    if self.tracing:
+                        self.current_edge = (vertex, neighbour)
+                        yield
+
+                if self.tracing:
+                    self.current_edge = (0, 0)
+                    self.say('bellman_ford.vertex_processed', i+1, vertex)
+                    yield
+
+            # Jesli w calym przebiegu nie zmieniono zadnego kosztu, kolejne przebiegi rowniez niczego nie zmienia
+            if not relaxed:
+                if self.tracing:
+                    self.processed_vertex = self.current_vertex
+                    self.say('bellman_ford.converged', i+1)
+                    yield
+                return
+
+        # Po n-1 przebiegach koszty moga nadal malec jedynie wtedy, gdy graf zawiera cykl o ujemnej wadze
+        self.negative_cycle = self.has_negative_cycle()
+        if self.tracing:
+            self.processed_vertex = self.current_vertex
+            if self.negative_cycle:
+                self.say('bellman_ford.negative_cycle')
+            else:
+                self.say('bellman_ford.no_negative_cycle')
+            yield
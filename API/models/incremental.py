@@ -0,0 +1,445 @@
+import heapq
+import math
+from array import array
+from collections import deque
+from models.compact_graph import CompactGraph
+from models.disjoint_set import DisjointSet
+from models.edge import Edge
+from models.graph import DijkstraGraph, KruskalGraph
+
+
+# Operacje edycji grafu: dodanie krawedzi, zmiana wagi krawedzi oraz usuniecie krawedzi
+EDIT_OPERATIONS = ('insert', 'update', 'delete')
+
+
+class EdgeChange:
+    """
+    Klasa reprezentujaca zmiane jednej krawedzi nieskierowanej. Krawedz jest identyfikowana (tak jak w algorytmie Kruskala)
+    mniejszym koncem oraz pozycja luku na liscie sasiedztwa tego konca. Brak starej (nowej) wagi oznacza dodanie (usuniecie) krawedzi.
+    """
+    def __init__(self, lower, upper, position, upper_position, old_weight, new_weight):
+        """
+        Tworzy opis zmiany krawedzi. Pozycja luku przeciwnego (upper_position) jest potrzebna przy usunieciu krawedzi.
+        """
+        self.lower = lower
+        self.upper = upper
+        self.position = position
+        self.upper_position = upper_position
+        self.old_weight = old_weight
+        self.new_weight = new_weight
+
+
+class GraphEditor:
+    """
+    Klasa nanoszaca edycje krawedzi nieskierowanych na zwarta reprezentacje grafu. Zmieniane listy sasiedztwa sa przechowywane osobno,
+    a nowa reprezentacja grafu jest tworzona jednokrotnie po naniesieniu wszystkich edycji - niezmienione fragmenty tablic sa kopiowane w calosci.
+    """
+    def __init__(self, core):
+        """
+        Tworzy obiekt edycji wskazanego grafu.
+        """
+        self.core = core
+        self.rows = dict()
+        self.touched = set()
+        self.float_weights = core.weights is not None and core.weight_format() == 'd'
+
+    def row(self, vertex):
+        """
+        Zwraca aktualna (uwzgledniajaca dotychczasowe edycje) liste par [sasiad, waga] wskazanego wierzcholka.
+        """
+        if vertex not in self.rows:
+            if self.core.weights is None:
+                self.rows[vertex] = [[neighbour, None] for neighbour in self.core.neighbours(vertex)]
+            else:
+                self.rows[vertex] = [[neighbour, weight] for neighbour, weight in self.core.weighted_neighbours(vertex)]
+        return self.rows[vertex]
+
+    def edit_weight(self, edit):
+        """
+        Zwraca wage podana w edycji. Dla grafu bez wag waga jest pomijana.
+        """
+        if self.core.weights is None:
+            return None
+        weight = edit.get('weight')
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or not math.isfinite(weight):
+            raise ValueError('Waga krawedzi musi byc skonczona liczba.')
+        if isinstance(weight, float):
+            self.float_weights = True
+        return weight
+
+    def apply(self, edit):
+        """
+        Nanosi edycje (pola op, vertex1, vertex2 oraz weight) na listy sasiedztwa obu koncow krawedzi i zwraca opis zmiany.
+        Zmiana wagi oraz usuniecie dotycza pierwszej krawedzi laczacej wskazane wierzcholki.
+        """
+        operation = edit.get('op')
+        if operation not in EDIT_OPERATIONS:
+            raise ValueError(f'Nieznana operacja edycji: {operation}.')
+        try:
+            vertex1, vertex2 = self.core.index(edit['vertex1']), self.core.index(edit['vertex2'])
+        except KeyError:
+            raise ValueError('Edycja musi wskazywac istniejace wierzcholki vertex1 oraz vertex2.')
+        if vertex1 == vertex2:
+            raise ValueError('Edycja petli nie jest obslugiwana.')
+        lower, upper = min(vertex1, vertex2), max(vertex1, vertex2)
+        self.touched.add((lower, upper))
+
+        if operation == 'insert':
+            weight = self.edit_weight(edit)
+            self.row(lower).append([upper, weight])
+            self.row(upper).append([lower, weight])
+            return EdgeChange(lower, upper, len(self.row(lower)) - 1, len(self.row(upper)) - 1, None, weight)
+
+        lower_position = next((i for i, (neighbour, _) in enumerate(self.row(lower)) if neighbour == upper), None)
+        upper_position = next((i for i, (neighbour, _) in enumerate(self.row(upper)) if neighbour == lower), None)
+        if lower_position is None or upper_position is None:
+            raise ValueError(f'Krawedz laczaca wierzcholki {edit["vertex1"]} oraz {edit["vertex2"]} nie istnieje.')
+        old_weight = self.row(lower)[lower_position][1]
+        if operation == 'delete':
+            del self.row(lower)[lower_position]
+            del self.row(upper)[upper_position]
+            return EdgeChange(lower, upper, lower_position, upper_position, old_weight, None)
+
+        if self.core.weights is None:
+            raise ValueError('Zmiana wagi wymaga grafu z wagami krawedzi.')
+        weight = self.edit_weight(edit)
+        self.row(lower)[lower_position][1] = weight
+        self.row(upper)[upper_position][1] = weight
+        return EdgeChange(lower, upper, lower_position, upper_position, old_weight, weight)
+
+    def build(self):
+        """
+        Tworzy zwarta reprezentacje grafu po naniesieniu wszystkich edycji.
+        """
+        core = self.core
+        vertex_count = core.vertex_count()
+        offsets, targets = array('q', [0]), array('q')
+        weights = None
+        if core.weights is not None:
+            weights = array('d' if self.float_weights else 'q')
+
+        def extend(destination, source):
+            # Tablice array mozna laczyc bezposrednio tylko przy zgodnym typie elementow
+            destination.extend(source if not isinstance(source, array) or source.typecode == destination.typecode else source.tolist())
+
+        previous = 0
+        for vertex in sorted(self.rows) + [vertex_count]:
+            start, end = core.offsets[previous], core.offsets[vertex]
+            shift = len(targets) - start
+            extend(targets, core.targets[start:end])
+            if weights is not None:
+                extend(weights, core.weights[start:end])
+            offsets.extend(core.offsets[i] + shift for i in range(previous + 1, vertex + 1))
+            if vertex == vertex_count:
+                break
+
+            row = self.rows[vertex]
+            targets.extend(neighbour for neighbour, _ in row)
+            if weights is not None:
+                weights.extend(weight for _, weight in row)
+            offsets.append(len(targets))
+            previous = vertex + 1
+
+        edited = CompactGraph.from_arrays(offsets, targets, weights, core.labels)
+        # Edycje krawedzi nieskierowanych zachowuja symetrie list sasiedztwa
+        edited.undirected = core.undirected
+        return edited
+
+
+def supports_incremental(core):
+    """
+    Sprawdza, czy wyniki dla grafu moga byc aktualizowane przyrostowo - graf musi byc nieskierowany i miec nieujemne wagi.
+    """
+    return core.weights is not None and core.is_undirected() and (len(core.weights) == 0 or min(core.weights) >= 0)
+
+
+class IncrementalShortestPaths:
+    """
+    Klasa przechowujaca drzewo najkrotszych drog z ustalonego wierzcholka, aktualizowane po edycjach grafu.
+    Po edycji ponownie relaksowane sa jedynie wierzcholki, ktorych koszt mogl sie zmienic: poddrzewa wierzcholkow, ktorych luk
+    drzewa zostal usuniety lub wydluzony, oraz wierzcholki, do ktorych prowadzi krotsza droga przez dodana lub skrocona krawedz.
+    """
+    def __init__(self, core, source):
+        """
+        Wyznacza drzewo najkrotszych drog algorytmem Dijkstry.
+        """
+        if not isinstance(source, int) or not 0 <= source < core.vertex_count():
+            raise ValueError('start_vertex musi byc indeksem wierzcholka grafu.')
+        self.source = source
+        self.recompute(core)
+
+    def recompute(self, core):
+        """
+        Wyznacza koszty oraz poprzednikow od poczatku.
+        """
+        graph = DijkstraGraph(current_vertex=self.source, core=core)
+        graph.compute_result()
+        self.costs, self.parents = graph.costs, graph.parents
+        self.incremental = False
+        self.relaxed_vertices = core.vertex_count()
+
+    def arc_weight(self, core, vertex1, vertex2):
+        """
+        Zwraca najmniejsza wage luku z vertex1 do vertex2 lub None, gdy takiego luku nie ma.
+        """
+        return min((weight for neighbour, weight in core.weighted_neighbours(vertex1) if neighbour == vertex2), default=None)
+
+    def update(self, core, touched):
+        """
+        Aktualizuje koszty oraz poprzednikow po edycji krawedzi laczacych pary wierzcholkow touched. Dla grafu, ktory nie spelnia
+        warunkow aktualizacji przyrostowej, wyniki sa wyznaczane od poczatku.
+        """
+        if not supports_incremental(core):
+            self.recompute(core)
+            return
+
+        costs, parents = self.costs, self.parents
+
+        # Wierzcholki, ktorych luk drzewa zostal usuniety lub wydluzony, tworza korzenie poddrzew o nieaktualnych kosztach
+        roots = list()
+        for vertex1, vertex2 in touched:
+            for start, end in ((vertex1, vertex2), (vertex2, vertex1)):
+                if parents[end] == start:
+                    weight = self.arc_weight(core, start, end)
+                    if weight is None or costs[start] + weight != costs[end]:
+                        roots.append(end)
+
+        affected = set()
+        if roots:
+            children = [list() for _ in range(len(parents))]
+            for vertex, parent in enumerate(parents):
+                if parent >= 0:
+                    children[parent].append(vertex)
+            stack = roots
+            while stack:
+                vertex = stack.pop()
+                if vertex not in affected:
+                    affected.add(vertex)
+                    stack.extend(children[vertex])
+            for vertex in affected:
+                costs[vertex], parents[vertex] = math.inf, -1
+
+        # Koszty poczatkowe wierzcholkow poddrzew wyznaczane sa na podstawie sasiadow o aktualnych kosztach
+        queue = list()
+        for vertex in affected:
+            for neighbour, weight in core.weighted_neighbours(vertex):
+                if neighbour not in affected and costs[neighbour] + weight < costs[vertex]:
+                    costs[vertex], parents[vertex] = costs[neighbour] + weight, neighbour
+            if costs[vertex] != math.inf:
+                queue.append((costs[vertex], vertex))
+
+        # Dodane lub skrocone krawedzie moga skrocic droge do jednego ze swoich koncow
+        for vertex1, vertex2 in touched:
+            for start, end in ((vertex1, vertex2), (vertex2, vertex1)):
+                weight = self.arc_weight(core, start, end)
+                if weight is not None and costs[start] + weight < costs[end]:
+                    costs[end], parents[end] = costs[start] + weight, start
+                    queue.append((costs[end], end))
+
+        # Propagacja zmienionych kosztow algorytmem Dijkstry ograniczonym do wierzcholkow, ktorych koszt ulegl zmianie
+        heapq.heapify(queue)
+        relaxed = 0
+        while queue:
+            cost, vertex = heapq.heappop(queue)
+            if cost != costs[vertex]:
+                continue
+            relaxed += 1
+            for neighbour, weight in core.weighted_neighbours(vertex):
+                if cost + weight < costs[neighbour]:
+                    costs[neighbour], parents[neighbour] = cost + weight, vertex
+                    heapq.heappush(queue, (costs[neighbour], neighbour))
+
+        self.incremental = True
+        self.relaxed_vertices = relaxed
+
+    def result(self):
+        """
+        Zwraca koszty (None dla wierzcholkow nieosiagalnych) oraz poprzednikow - w tej samej postaci co tryb result algorytmu Dijkstry.
+        """
+        return {
+            "costs": [cost if cost != math.inf else None for cost in self.costs],
+            "parents": list(self.parents)
+        }
+
+
+class IncrementalSpanningForest:
+    """
+    Klasa przechowujaca minimalny las rozpinajacy, aktualizowany po kazdej edycji krawedzi. Krawedzie sa porownywane kluczem
+    (waga, mniejszy koniec, pozycja na liscie sasiedztwa) - tym samym porzadkiem co w algorytmie Kruskala, dzieki czemu wynik jest
+    identyczny z wyznaczonym od poczatku rowniez przy rownych wagach.
+    """
+    def __init__(self, core):
+        """
+        Wyznacza minimalny las rozpinajacy algorytmem Kruskala.
+        """
+        self.recompute(core)
+
+    def recompute(self, core):
+        """
+        Wyznacza minimalny las rozpinajacy od poczatku.
+        """
+        edges = list()
+        for vertex in range(core.vertex_count()):
+            for position, (neighbour, weight) in enumerate(core.weighted_neighbours(vertex)):
+                if neighbour > vertex:
+                    edges.append(((weight, vertex, position), neighbour))
+        edges.sort()
+
+        components = DisjointSet(core.vertex_count())
+        self.forest = [dict() for _ in range(core.vertex_count())]
+        for key, neighbour in edges:
+            if components.union(key[1], neighbour):
+                self.link(key[1], neighbour, key)
+        self.incremental = False
+
+    def link(self, vertex1, vertex2, key):
+        """
+        Dodaje krawedz do lasu.
+        """
+        self.forest[vertex1][vertex2] = key
+        self.forest[vertex2][vertex1] = key
+
+    def unlink(self, vertex1, vertex2):
+        """
+        Usuwa krawedz z lasu.
+        """
+        del self.forest[vertex1][vertex2]
+        del self.forest[vertex2][vertex1]
+
+    def tree_path(self, vertex1, vertex2):
+        """
+        Zwraca liste krawedzi (par wierzcholkow) sciezki w lesie miedzy wskazanymi wierzcholkami lub None, gdy leza w roznych drzewach.
+        """
+        previous = {vertex1: None}
+        queue = deque([vertex1])
+        while queue and vertex2 not in previous:
+            vertex = queue.popleft()
+            for neighbour in self.forest[vertex]:
+                if neighbour not in previous:
+                    previous[neighbour] = vertex
+                    queue.append(neighbour)
+        if vertex2 not in previous:
+            return None
+        path = list()
+        while previous[vertex2] is not None:
+            path.append((previous[vertex2], vertex2))
+            vertex2 = previous[vertex2]
+        return path
+
+    def tree_vertices(self, vertex):
+        """
+        Zwraca zbior wierzcholkow drzewa lasu zawierajacego wskazany wierzcholek.
+        """
+        seen = {vertex}
+        stack = [vertex]
+        while stack:
+            for neighbour in self.forest[stack.pop()]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        return seen
+
+    def offer(self, key, vertex1, vertex2):
+        """
+        Dodaje krawedz do lasu, jesli laczy rozne drzewa lub jest lzejsza od najciezszej krawedzi cyklu, ktory by utworzyla
+        (ta krawedz jest wtedy usuwana).
+        """
+        path = self.tree_path(vertex1, vertex2)
+        if path is None:
+            self.link(vertex1, vertex2, key)
+            return
+        heaviest = max(path, key=lambda pair: self.forest[pair[0]][pair[1]])
+        if key < self.forest[heaviest[0]][heaviest[1]]:
+            self.unlink(*heaviest)
+            self.link(vertex1, vertex2, key)
+
+    def reconnect(self, editor, vertex1, vertex2):
+        """
+        Po usunieciu krawedzi drzewa laczy powstale dwa drzewa najlzejsza krawedzia grafu przechodzaca miedzy nimi (jesli istnieje).
+        Przegladane sa jedynie listy sasiedztwa wierzcholkow mniejszego z drzew.
+        """
+        side1, side2 = self.tree_vertices(vertex1), self.tree_vertices(vertex2)
+        smaller = side1 if len(side1) <= len(side2) else side2
+        best = None
+        for vertex in smaller:
+            for position, (neighbour, weight) in enumerate(editor.row(vertex)):
+                if neighbour in smaller:
+                    continue
+                if vertex < neighbour:
+                    key = (weight, vertex, position)
+                else:
+                    key = min((other_weight, neighbour, i) for i, (other, other_weight) in enumerate(editor.row(neighbour)) if other == vertex)
+                if best is None or key < best[0]:
+                    best = (key, vertex, neighbour)
+        if best is not None:
+            self.link(best[1], best[2], best[0])
+
+    def apply(self, change, editor):
+        """
+        Aktualizuje las po zmianie jednej krawedzi. Listy sasiedztwa edytora uwzgledniaja juz te zmiane.
+        """
+        lower, upper = change.lower, change.upper
+        current = self.forest[lower].get(upper)
+        in_forest = current is not None and current[1:] == (lower, change.position) and change.old_weight is not None
+
+        if change.old_weight is None:
+            self.offer((change.new_weight, lower, change.position), lower, upper)
+        elif change.new_weight is None:
+            # Usuniecie lukow przesuwa kolejne pozycje na listach sasiedztwa obu koncow
+            if in_forest:
+                self.unlink(lower, upper)
+            for vertex, position in ((lower, change.position), (upper, change.upper_position)):
+                for neighbour, key in list(self.forest[vertex].items()):
+                    if key[1] == vertex and key[2] > position:
+                        self.link(vertex, neighbour, (key[0], vertex, key[2] - 1))
+            if in_forest:
+                self.reconnect(editor, lower, upper)
+        elif in_forest:
+            self.link(lower, upper, (change.new_weight, lower, change.position))
+            if change.new_weight > change.old_weight:
+                self.unlink(lower, upper)
+                self.reconnect(editor, lower, upper)
+        elif change.new_weight < change.old_weight:
+            self.offer((change.new_weight, lower, change.position), lower, upper)
+        self.incremental = True
+
+    def result(self):
+        """
+        Zwraca krawedzie lasu w kolejnosci ich dodawania przez algorytm Kruskala oraz jego calkowita wage - w tej samej postaci
+        co tryb result algorytmu Kruskala.
+        """
+        keys = sorted((key, vertex, neighbour) for vertex, edges in enumerate(self.forest) for neighbour, key in edges.items() if vertex < neighbour)
+        mst_edges = [Edge(vertex, neighbour, key[0]).serialize() for key, vertex, neighbour in keys]
+        return {
+            "mst_edges": mst_edges,
+            "total_weight": sum(edge["weight"] for edge in mst_edges)
+        }
+
+
+def validate(tracked, core):
+    """
+    Porownuje wynik aktualizowany przyrostowo z wyznaczonym od poczatku. Dla drzewa najkrotszych drog koszty musza byc rowne,
+    a poprzednicy (ktorzy przy rownych kosztach moga byc inni niz w obliczeniach od poczatku) musza tworzyc drzewo najkrotszych drog.
+    Zwraca liste opisow niezgodnosci.
+    """
+    errors = list()
+    if isinstance(tracked, IncrementalSpanningForest):
+        expected = KruskalGraph(core=core).compute_result()
+        if tracked.result() != expected:
+            errors.append('Minimalne drzewo rozpinajace rozni sie od wyznaczonego od poczatku.')
+        return errors
+
+    expected = DijkstraGraph(current_vertex=tracked.source, core=core).compute_result()
+    result = tracked.result()
+    if result["costs"] != expected["costs"]:
+        errors.append('Koszty roznia sie od wyznaczonych od poczatku.')
+    for vertex, parent in enumerate(result["parents"]):
+        cost = result["costs"][vertex]
+        if parent < 0:
+            if cost is not None and vertex != tracked.source:
+                errors.append(f'Wierzcholek {vertex} ma koszt, ale nie ma poprzednika.')
+        else:
+            weight = tracked.arc_weight(core, parent, vertex)
+            if cost is None or weight is None or result["costs"][parent] is None or result["costs"][parent] + weight != cost:
+                errors.append(f'Poprzednik wierzcholka {vertex} nie lezy na najkrotszej drodze.')
+    return errors
@@ -0,0 +1,81 @@
+DEFAULT_LOCALE = 'pl'
+
+# Katalog komunikatow krokow - dla kazdego jezyka szablony str.format z argumentami pozycyjnymi, identyfikowane kodem komunikatu
+MESSAGES = {
+    'pl': {
+        'search.processing_vertex': 'Przetwarzanie wierzchołka {0}.',
+        'search.edge_added': 'Dodanie wierzchołka {1} do kolejki. Dodanie krawędzi łączącej wierzchołki {0} oraz {1} do drzewa wynikowego.',
+        'search.edge_rejected': 'Krawędź łącząca wierzchołki {0} oraz {1} nie zostaje dodana do drzewa wynikowego.',
+        'search.edge_in_tree': 'Krawędź łącząca wierzchołki {0} oraz {1} została już wcześniej odwiedzona i dodana do drzewa wynikowego.',
+        'search.new_root': 'Wszystkie wierzchołki osiągalne z dotychczasowych wierzchołków startowych zostały odwiedzone - rozpoczęcie przeszukiwania od nieodwiedzonego wierzchołka {0}.',
+        'search.result': 'Wynik działania algorytmu.',
+        'mst.checking_edge': 'Sprawdzanie krawędzi łączącej wierzchołki {0} oraz {1}.',
+        'kruskal.edge_added': 'Krawędź łącząca wierzchołki {0} oraz {1} nie utworzy cyklu - zostaje dodana do drzewa wynikowego.',
+        'kruskal.edge_rejected': 'Krawędź łącząca wierzchołki {0} oraz {1} spowoduje utworzenie cyklu - nie zostaje dodana do drzewa wynikowego.',
+        'boruvka.phase': 'Faza {0}: wyszukiwanie najtańszej krawędzi wychodzącej z każdej z {1} spójnych składowych.',
+        'boruvka.edge_added': 'Krawędź łącząca wierzchołki {0} oraz {1} jest najtańszą krawędzią wychodzącą ze spójnej składowej - zostaje dodana do drzewa wynikowego.',
+        'prim.edge_added': 'Krawędź łącząca wierzchołki {0} oraz {1} została dodana.',
+        'prim.edge_added_without_cycle': 'Krawędź łącząca wierzchołki {0} oraz {1} nie utworzy cyklu - została dodana do drzewa wynikowego.',
+        'prim.edge_rejected': 'Krawędź łącząca wierzchołki {0} oraz {1} spowoduje powstanie cyklu - nie została dodana do drzewa wynikowego.',
+        'dijkstra.init': 'Inicjalizacja - poszukiwanie najtańszego sąsiada wierzchołka startowego.',
+        'dijkstra.vertex_selected': 'Wybór najtańszego nieodwiedzonego wierzchołka - wierzchołek {0}.',
+        'dijkstra.target_reached': 'Wierzchołek docelowy {0} został odwiedzony - koszt dotarcia do niego jest ostateczny.',
+        'dijkstra.edge_relaxed': 'Korekta kosztu na podstawie krawędzi łączącej wierzchołki {0} oraz {1}.',
+        'dijkstra.vertex_visited': 'Wszystkie korekty wierzchołka {0} zostały dokonane - jest już odwiedzony.',
+        'bellman_ford.init': 'Inicjalizacja - ustalenie kosztów na podstawie danych o sąsiadach wierzchołka początkowego.',
+        'bellman_ford.edge_replaced': 'Iteracja {0}: usunięcie krawędzi łączącej wierzchołki {1} oraz {3} z wyniku. Dodanie krawędzi łączącej wierzchołki {2} oraz {3} do wyniku. Aktualizacja kosztów dotarcia do wierzchołka {3}.',
+        'bellman_ford.edge_added': 'Iteracja {0}: Dodanie krawędzi łączącej wierzchołki {1} oraz {2} do wyniku. Aktualizacja kosztów dotarcia do wierzchołka {2}.',
+        'bellman_ford.edge_unchanged': 'Iteracja {0}: krawędź łącząca wierzchołki {1} oraz {2} nie wnosi żadnych zmian.',
+        'bellman_ford.vertex_processed': 'Iteracja {0}: zakończenie przetwarzania wierzchołka {1}.',
+        'bellman_ford.converged': 'Iteracja {0}: żaden koszt nie uległ zmianie - koszty są ostateczne, zakończenie algorytmu.',
+        'bellman_ford.negative_cycle': 'Wykryto cykl o ujemnej wadze osiągalny z wierzchołka początkowego - najkrótsze drogi nie istnieją.',
+        'bellman_ford.no_negative_cycle': 'Sprawdzenie cykli o ujemnej wadze - żadna krawędź nie pozwala zmniejszyć kosztów, wyznaczone koszty są ostateczne.'
+    },
+    'en': {
+        'search.processing_vertex': 'Processing vertex {0}.',
+        'search.edge_added': 'Vertex {1} is added to the queue. The edge between vertices {0} and {1} is added to the result tree.',
+        'search.edge_rejected': 'The edge between vertices {0} and {1} is not added to the result tree.',
+        'search.edge_in_tree': 'The edge between vertices {0} and {1} has already been visited and added to the result tree.',
+        'search.new_root': 'All vertices reachable from the previous start vertices have been visited - the search continues from unvisited vertex {0}.',
+        'search.result': 'Result of the algorithm.',
+        'mst.checking_edge': 'Checking the edge between vertices {0} and {1}.',
+        'kruskal.edge_added': 'The edge between vertices {0} and {1} does not create a cycle - it is added to the result tree.',
+        'kruskal.edge_rejected': 'The edge between vertices {0} and {1} would create a cycle - it is not added to the result tree.',
+        'boruvka.phase': 'Phase {0}: searching for the cheapest edge leaving each of the {1} connected components.',
+        'boruvka.edge_added': 'The edge between vertices {0} and {1} is the cheapest edge leaving a connected component - it is added to the result tree.',
+        'prim.edge_added': 'The edge between vertices {0} and {1} has been added.',
+        'prim.edge_added_without_cycle': 'The edge between vertices {0} and {1} does not create a cycle - it has been added to the result tree.',
+        'prim.edge_rejected': 'The edge between vertices {0} and {1} would create a cycle - it has not been added to the result tree.',
+        'dijkstra.init': 'Initialization - looking for the cheapest neighbour of the start vertex.',
+        'dijkstra.vertex_selected': 'Selecting the cheapest unvisited vertex - vertex {0}.',
+        'dijkstra.target_reached': 'Target vertex {0} has been visited - its cost is final.',
+        'dijkstra.edge_relaxed': 'Cost correction based on the edge between vertices {0} and {1}.',
+        'dijkstra.vertex_visited': 'All corrections for vertex {0} have been made - it is now visited.',
+        'bellman_ford.init': 'Initialization - setting costs based on the neighbours of the start vertex.',
+        'bellman_ford.edge_replaced': 'Iteration {0}: the edge between vertices {1} and {3} is removed from the result. The edge between vertices {2} and {3} is added to the result. The cost of reaching vertex {3} is updated.',
+        'bellman_ford.edge_added': 'Iteration {0}: the edge between vertices {1} and {2} is added to the result. The cost of reaching vertex {2} is updated.',
+        'bellman_ford.edge_unchanged': 'Iteration {0}: the edge between vertices {1} and {2} brings no changes.',
+        'bellman_ford.vertex_processed': 'Iteration {0}: processing of vertex {1} is finished.',
+        'bellman_ford.converged': 'Iteration {0}: no cost has changed - the costs are final, the algorithm stops.',
+        'bellman_ford.negative_cycle': 'A negative-weight cycle reachable from the start vertex has been detected - shortest paths do not exist.',
+        'bellman_ford.no_negative_cycle': 'Negative-weight cycle check - no edge can lower any cost, the computed costs are final.'
+    }
+}
+
+
+def catalog(locale=DEFAULT_LOCALE):
+    """
+    Zwraca katalog komunikatow dla wskazanego jezyka.
+    """
+    if not isinstance(locale, str) or locale not in MESSAGES:
+        raise ValueError(f'Nieobslugiwany jezyk komunikatow: {locale}.')
+    return MESSAGES[locale]
+
+
+def render(code, args, locale=DEFAULT_LOCALE):
+    """
+    Zwraca tresc komunikatu o wskazanym kodzie z podstawionymi argumentami. Pusty kod oznacza pusty komunikat.
+    """
+    if code is None:
+        return ''
+    return catalog(locale)[code].format(*args)
@@ -0,0 +1,113 @@
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def arc_arrays(core):
+    """
+    Zwraca tablice NumPy poczatkow, koncow oraz wag wszystkich lukow grafu. Konce oraz wagi wspoldziela pamiec z reprezentacja CSR.
+    """
+    sources = numpy.repeat(numpy.arange(core.vertex_count(), dtype=numpy.int64), numpy.diff(numpy.asarray(core.offsets)))
+    # Typ elementow wynika z formatu bufora - int64 dla tablic array, int32/float64 dla grafow przeslanych w postaci binarnej
+    targets = numpy.asarray(core.targets)
+    weights = numpy.asarray(core.weights)
+    return sources, targets, weights
+
+
+def numpy_bellman_ford(core, source):
+    """
+    Wyznacza koszty dotarcia oraz poprzednikow wierzcholkow algorytmem Bellmana-Forda, relaksujac w kazdym przebiegu wszystkie luki naraz.
+    Zwraca krotke (koszty, poprzednicy, czy wykryto cykl o ujemnej wadze). Koszty wierzcholkow nieosiagalnych sa rowne math.inf.
+    """
+    vertex_count = core.vertex_count()
+    sources, targets, weights = arc_arrays(core)
+
+    # Luki uporzadkowane wedlug konca - minimum kandydatow dla kazdego wierzcholka jest liczone jednym wywolaniem reduceat
+    order = numpy.argsort(targets, kind='stable')
+    sources, targets, weights = sources[order], targets[order], weights[order]
+    segment_starts = numpy.flatnonzero(numpy.r_[True, targets[1:] != targets[:-1]]) if len(targets) else numpy.empty(0, dtype=numpy.int64)
+    segment_targets = targets[segment_starts]
+
+    costs = numpy.full(vertex_count, numpy.inf)
+    costs[source] = 0
+    parents = numpy.full(vertex_count, -1, dtype=numpy.int64)
+    negative_cycle = False
+    for iteration in range(vertex_count):
+        candidates = costs[sources] + weights
+        best = numpy.minimum.reduceat(candidates, segment_starts) if len(segment_starts) else candidates
+        improved = best < costs[segment_targets]
+        if not improved.any():
+            break
+
+        # Przebieg numer n (po n-1 przebiegach) nadal zmniejszajacy koszty oznacza cykl o ujemnej wadze
+        if iteration == vertex_count - 1:
+            negative_cycle = True
+            break
+        costs[segment_targets[improved]] = best[improved]
+
+        # Poprzednikiem wierzcholka o zmniejszonym koszcie zostaje poczatek luku, ktory wyznaczyl nowy koszt
+        improved_vertices = numpy.zeros(vertex_count, dtype=bool)
+        improved_vertices[segment_targets[improved]] = True
+        relaxing = numpy.flatnonzero(improved_vertices[targets] & (candidates == costs[targets]))
+        parents[targets[relaxing]] = sources[relaxing]
+
+    integer_costs = core.weight_format() != 'd'
+    costs = [(int(cost) if integer_costs else float(cost)) if cost != numpy.inf else math.inf for cost in costs.tolist()]
+    return costs, parents.tolist(), negative_cycle
+
+
+def numpy_floyd_warshall(core):
+    """
+    Wyznacza koszty najkrotszych drog miedzy wszystkimi parami wierzcholkow algorytmem Floyda-Warshalla - w kazdej z V iteracji
+    cala macierz kosztow jest aktualizowana jedna operacja na tablicach. Zwraca macierz kosztow (math.inf dla par nieosiagalnych)
+    oraz macierz poprzednikow (-1 dla przekatnej i par nieosiagalnych).
+    """
+    vertex_count = core.vertex_count()
+    sources, targets, weights = arc_arrays(core)
+    distances = numpy.full((vertex_count, vertex_count), numpy.inf)
+
+    # Dla lukow wielokrotnych zachowywana jest najmniejsza waga
+    numpy.minimum.at(distances, (sources, targets), weights.astype(numpy.float64))
+    numpy.fill_diagonal(distances, 0)
+    predecessors = numpy.where(distances < numpy.inf, numpy.arange(vertex_count, dtype=numpy.int64)[:, None], -1)
+    numpy.fill_diagonal(predecessors, -1)
+
+    for k in range(vertex_count):
+        through = distances[:, k, None] + distances[None, k, :]
+        shorter = through < distances
+        distances = numpy.where(shorter, through, distances)
+        predecessors = numpy.where(shorter, predecessors[None, k, :], predecessors)
+
+    integer_costs = core.weight_format() != 'd'
+    rows = list()
+    for row in distances.tolist():
+        rows.append([(int(cost) if integer_costs else cost) if cost != math.inf else math.inf for cost in row])
+    return rows, predecessors.tolist()
+
+
+def numpy_cheapest_edges(labels, weights, edge_ids):
+    """
+    Dla krawedzi przypisanych do etykiet spojnych skladowych zwraca tablice (etykiety, wagi, numery krawedzi) - po jednej,
+    najtanszej krawedzi dla kazdej etykiety. Krawedzie o rownych wagach sa porzadkowane wedlug numeru, tak jak w algorytmie Kruskala.
+    """
+    order = numpy.lexsort((edge_ids, weights, labels))
+    labels, weights, edge_ids = labels[order], weights[order], edge_ids[order]
+    first = numpy.r_[True, labels[1:] != labels[:-1]] if len(labels) else numpy.zeros(0, dtype=bool)
+    return labels[first], weights[first], edge_ids[first]
+
+
+def numpy_first_crossing_edges(component1, component2, vertex_count):
+    """
+    Dla krawedzi uporzadkowanych rosnaco wedlug (waga, numer) oraz etykiet skladowych ich koncow (indeksow wierzcholkow
+    mniejszych od vertex_count) zwraca etykiety skladowych i pozycje pierwszych, czyli najtanszych, krawedzi z nimi incydentnych.
+    """
+    edge_count = len(component1)
+    positions = numpy.arange(edge_count, dtype=numpy.int64)
+    first = numpy.full(vertex_count, edge_count, dtype=numpy.int64)
+    numpy.minimum.at(first, component1, positions)
+    numpy.minimum.at(first, component2, positions)
+    labels = numpy.flatnonzero(first < edge_count)
+    return labels, first[labels]
@@ -0,0 +1,62 @@
+from models.timeline import DeltaStepEncoder
+
+
+class StepCursor:
+    """
+    Klasa reprezentujaca wstrzymane wykonanie algorytmu (punkt kontrolny), od ktorego mozna kontynuowac pobieranie krokow.
+    Stan algorytmu odpowiada krokowi o numerze position. Kroki poprzedzajace zadana strone sa pomijane bez tworzenia migawek.
+    """
+    def __init__(self, graph):
+        """
+        Tworzy kursor ustawiony przed pierwszym krokiem algorytmu.
+        """
+        self.graph = graph
+        self.steps = graph.run()
+        self.position = -1
+        self.finished = False
+        self.advance()
+
+    def advance(self):
+        """
+        Przechodzi do kolejnego kroku algorytmu. Zwraca False, jesli algorytm zakonczyl dzialanie.
+        """
+        try:
+            next(self.steps)
+        except StopIteration:
+            self.finished = True
+            return False
+        self.position += 1
+        return True
+
+    def close(self):
+        """
+        Konczy wstrzymane wykonanie algorytmu i zwalnia jego zasoby.
+        """
+        self.steps.close()
+        self.finished = True
+
+    def can_reach(self, from_step):
+        """
+        Sprawdza, czy krok o wskazanym numerze lezy nie wczesniej niz aktualna pozycja kursora.
+        """
+        return self.position <= from_step
+
+    def page(self, from_step, limit):
+        """
+        Zwraca liste co najwyzej limit krokow, zaczynajac od kroku o numerze from_step.
+        W formacie roznicowym pierwszy krok strony jest zawsze pelna klatka kluczowa.
+        """
+        if not self.can_reach(from_step):
+            raise ValueError('Kursor znajduje sie za zadanym krokiem.')
+        while not self.finished and self.position < from_step:
+            self.advance()
+
+        encoder = None
+        if self.graph.step_encoder is not None:
+            encoder = DeltaStepEncoder(self.graph.step_encoder.keyframe_interval)
+        steps = list()
+        while not self.finished and len(steps) < limit:
+            step = self.graph.create_step()
+            steps.append(encoder.encode(step) if encoder is not None else step)
+            self.advance()
+        return steps
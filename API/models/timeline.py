@@ -0,0 +1,136 @@
+import copy
+
+
+DEFAULT_KEYFRAME_INTERVAL = 50
+
+# Pola krokow bedace zbiorami (kolejnosc elementow nie ma znaczenia)
+SET_FIELDS = ('red_edges', 'green_edges', 'green_vertices')
+
+# Pola krokow bedace listami indeksowanymi numerem wierzcholka
+INDEXED_FIELDS = ('visited',)
+
+
+def freeze(value):
+    """
+    Zamienia element zbioru (np. krawedz w postaci listy) na postac haszowalna.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class DeltaStepEncoder:
+    """
+    Klasa kodujaca kolejne kroki algorytmu jako roznice wzgledem kroku poprzedniego.
+    Co keyframe_interval krokow emitowana jest pelna klatka kluczowa, od ktorej mozna rozpoczac odtwarzanie.
+    """
+    def __init__(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Tworzy koder z pustym stanem poprzedniego kroku.
+        """
+        if isinstance(keyframe_interval, bool) or not isinstance(keyframe_interval, int) or keyframe_interval < 1:
+            raise ValueError('keyframe_interval musi byc dodatnia liczba calkowita.')
+        self.keyframe_interval = keyframe_interval
+        self.step_count = 0
+        self.previous = None
+
+    def remember(self, step):
+        """
+        Zapamietuje stan kroku w postaci pozwalajacej na szybkie wyznaczanie roznic.
+        """
+        previous = dict()
+        for key, value in step.items():
+            if key in SET_FIELDS:
+                previous[key] = set(map(freeze, value))
+            elif key in INDEXED_FIELDS:
+                previous[key] = list(value)
+            else:
+                previous[key] = value
+        self.previous = previous
+
+    def encode(self, step):
+        """
+        Zwraca zakodowana postac kroku - pelna klatke kluczowa lub roznice wzgledem kroku poprzedniego.
+        """
+        if self.step_count % self.keyframe_interval == 0 or self.previous is None:
+            encoded = {"type": "keyframe", "step": step}
+        else:
+            encoded = {"type": "delta"}
+            changed, added, removed, updated = dict(), dict(), dict(), dict()
+            for key, value in step.items():
+                previous_value = self.previous.get(key)
+                if key in SET_FIELDS:
+                    current = set(map(freeze, value))
+                    if previous_value is None:
+                        previous_value = set()
+                    if current - previous_value:
+                        added[key] = list(current - previous_value)
+                    if previous_value - current:
+                        removed[key] = list(previous_value - current)
+                elif key in INDEXED_FIELDS:
+                    changes = [[i, x] for i, x in enumerate(value) if previous_value is None or previous_value[i] != x]
+                    if changes:
+                        updated[key] = changes
+                elif key not in self.previous or previous_value != value:
+                    changed[key] = value
+            if changed:
+                encoded["changed"] = changed
+            if added:
+                encoded["added"] = added
+            if removed:
+                encoded["removed"] = removed
+            if updated:
+                encoded["updated"] = updated
+
+        self.remember(step)
+        self.step_count += 1
+        return encoded
+
+
+def encode_steps(steps, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+    """
+    Koduje gotowa liste krokow w formacie roznicowym.
+    """
+    encoder = DeltaStepEncoder(keyframe_interval)
+    return [encoder.encode(step) for step in steps]
+
+
+def decode_steps(encoded_steps):
+    """
+    Referencyjny dekoder - odtwarza pelne migawki krokow (format domyslny) z formatu roznicowego.
+    Elementy pol bedacych zbiorami sa zwracane w kolejnosci ich dodania.
+    """
+    state = None
+    for encoded in encoded_steps:
+        if encoded["type"] == "keyframe":
+            state = dict()
+            for key, value in copy.deepcopy(encoded["step"]).items():
+                if key in SET_FIELDS:
+                    state[key] = dict.fromkeys(map(freeze, value))
+                else:
+                    state[key] = value
+        else:
+            if state is None:
+                raise ValueError('Zakodowana lista krokow musi rozpoczynac sie od klatki kluczowej.')
+            for key, value in encoded.get("changed", {}).items():
+                state[key] = copy.deepcopy(value)
+            for key, values in encoded.get("removed", {}).items():
+                for value in values:
+                    del state[key][freeze(value)]
+            for key, values in encoded.get("added", {}).items():
+                members = state.setdefault(key, dict())
+                for value in values:
+                    members[freeze(value)] = None
+            for key, changes in encoded.get("updated", {}).items():
+                for i, value in changes:
+                    state[key][i] = value
+
+        step = dict()
+        for key, value in state.items():
+            if key in SET_FIELDS:
+                step[key] = list(value)
+            elif key in INDEXED_FIELDS:
+                step[key] = list(value)
+            else:
+                step[key] = value
+        yield step
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def canonical_key(algorithm, request_data):
+    """
+    Zwraca klucz pamieci podrecznej - skrot SHA-256 kanonicznej postaci JSON algorytmu oraz pol zapytania
+    (wierzcholki, listy sasiedztwa, wagi, wierzcholek startowy oraz opcje formatu krokow).
+    """
+    canonical = json.dumps([algorithm, request_data], sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+# Po przekroczeniu limitu warstwy dyskowej pliki sa usuwane az do zmniejszenia jej rozmiaru do tej czesci limitu,
+# dzieki czemu katalog nie jest przegladany przy kazdym kolejnym zapisie
+DISK_TRIM_RATIO = 0.9
+
+
+class ResultCache:
+    """
+    Klasa reprezentujaca pamiec podreczna gotowych odpowiedzi (tresc oraz naglowki) z usuwaniem najdawniej uzywanych wpisow (LRU)
+    po przekroczeniu limitu bajtow. Opcjonalnie wpisy sa zapisywane rowniez na dysku, dzieki czemu przetrwaja ponowne uruchomienie.
+    Warstwa dyskowa ma osobny limit bajtow - po jego przekroczeniu usuwane sa pliki o najstarszym czasie modyfikacji
+    (odczyt pliku odswieza ten czas). Katalog moze byc wspoldzielony przez kilka procesow, dlatego jego rozmiar jest wyznaczany
+    ponownie przy kazdym usuwaniu plikow.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None, max_disk_bytes=1024 * 1024 * 1024):
+        """
+        Tworzy pusta pamiec podreczna o wskazanym limicie bajtow oraz (opcjonalnie) katalogu warstwy dyskowej i jej limicie bajtow.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_size = 0
+        self.disk_evictions = 0
+        self.disk_lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.disk_size = sum(size for _, size, _ in self.disk_files())
+
+    def path(self, key):
+        """
+        Zwraca sciezke pliku warstwy dyskowej dla wskazanego klucza.
+        """
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """
+        Zwraca zapamietana pare (tresc, naglowki) dla wskazanego klucza lub None, jesli jej nie ma.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self.read_from_disk(key)
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self.store(key, entry)
+        return entry
+
+    def put(self, key, body, headers):
+        """
+        Zapamietuje tresc oraz naglowki odpowiedzi pod wskazanym kluczem.
+        """
+        entry = (body, dict(headers))
+        with self.lock:
+            self.store(key, entry)
+        self.write_to_disk(key, entry)
+
+    def store(self, key, entry):
+        """
+        Umieszcza wpis w pamieci i usuwa najdawniej uzywane wpisy az do zmieszczenia sie w limicie bajtow.
+        Wpis wiekszy niz caly limit nie jest zapamietywany w pamieci.
+        """
+        entry_size = len(entry[0])
+        if entry_size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[0])
+        self.entries[key] = entry
+        self.size += entry_size
+        while self.size > self.max_bytes:
+            _, (evicted_body, _) = self.entries.popitem(last=False)
+            self.size -= len(evicted_body)
+            self.evictions += 1
+
+    def read_from_disk(self, key):
+        """
+        Odczytuje wpis z warstwy dyskowej. Plik zawiera naglowki w postaci JSON w pierwszej linii oraz tresc odpowiedzi.
+        """
+        if self.directory is None:
+            return None
+        try:
+            with open(self.path(key), 'rb') as file:
+                headers = json.loads(file.readline())
+                body = file.read()
+            os.utime(self.path(key))
+        except (OSError, ValueError):
+            return None
+        return body, headers
+
+    def write_to_disk(self, key, entry):
+        """
+        Zapisuje wpis w warstwie dyskowej. Plik jest podmieniany atomowo, aby rownolegle odczyty nie widzialy niepelnej zawartosci.
+        """
+        if self.directory is None:
+            return
+        body, headers = entry
+        header_line = json.dumps(headers).encode('utf-8') + b'\n'
+        if len(header_line) + len(body) > self.max_disk_bytes:
+            return
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(header_line)
+            file.write(body)
+
+        with self.disk_lock:
+            # Plik zapisany wczesniej pod tym samym kluczem jest zastepowany - jego rozmiar przestaje sie liczyc
+            try:
+                self.disk_size -= os.stat(self.path(key)).st_size
+            except OSError:
+                pass
+            os.replace(temporary_path, self.path(key))
+            self.disk_size += len(header_line) + len(body)
+            if self.disk_size > self.max_disk_bytes:
+                self.trim_disk()
+
+    def disk_files(self):
+        """
+        Zwraca liste plikow warstwy dyskowej (sciezka, rozmiar, czas modyfikacji) - z pominieciem plikow tymczasowych.
+        """
+        files = list()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if len(entry.name) != 64 or not entry.is_file():
+                    continue
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.path, status.st_size, status.st_mtime))
+        return files
+
+    def trim_disk(self):
+        """
+        Usuwa pliki warstwy dyskowej od najdawniej modyfikowanych, az jej rozmiar spadnie do DISK_TRIM_RATIO limitu bajtow.
+        """
+        files = sorted(self.disk_files(), key=lambda file: file[2])
+        self.disk_size = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if self.disk_size <= self.max_disk_bytes * DISK_TRIM_RATIO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.disk_size -= size
+            self.disk_evictions += 1
+
+    def stats(self):
+        """
+        Zwraca liczniki trafien, chybien oraz usuniec wpisow, a takze aktualny rozmiar pamieci podrecznej.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "disk_bytes": self.disk_size if self.directory is not None else None,
+                "disk_evictions": self.disk_evictions,
+                "max_disk_bytes": self.max_disk_bytes
+            }
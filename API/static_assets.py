@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import tempfile
+import time
+from flask import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Rozszerzenia plikow kompresowanych przy uruchomieniu (obrazy PNG sa juz skompresowane)
+COMPRESSIBLE_EXTENSIONS = ('.js', '.css', '.json', '.html')
+
+# Pliki pomijane przy wczytywaniu katalogu - mapy zrodel sa pobierane jedynie przez narzedzia deweloperskie przegladarki
+SKIPPED_EXTENSIONS = ('.map',)
+
+# Pliki mniejsze niz ta wartosc (w bajtach) nie sa kompresowane
+MIN_COMPRESS_BYTES = 1024
+
+
+class StaticAsset:
+    """
+    Klasa reprezentujaca plik statyczny przechowywany w pamieci wraz z wersjami skompresowanymi (br, gzip), znacznikiem ETag
+    (skrotem tresci) oraz wartoscia naglowka Cache-Control.
+    """
+    def __init__(self, body, mimetype, cache_control):
+        """
+        Tworzy plik statyczny bez wersji skompresowanych.
+        """
+        self.body = body
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.encoded = dict()
+
+    def select(self, accept_encodings):
+        """
+        Zwraca kodowanie (lub None) oraz tresc najmniejszej wersji pliku akceptowanej przez klienta (naglowek Accept-Encoding).
+        """
+        for encoding in ('br', 'gzip'):
+            if encoding in self.encoded and encoding in accept_encodings:
+                return encoding, self.encoded[encoding]
+        return None, self.body
+
+
+class StaticAssets:
+    """
+    Klasa przechowujaca w pamieci pliki statyczne (specyfikacje API oraz pliki interfejsu Swagger UI) skompresowane przy uruchomieniu
+    aplikacji. Pliki sa zwracane z naglowkami ETag oraz Cache-Control, a na zapytania warunkowe (If-None-Match) odpowiedzia jest kod 304.
+    Opcjonalny katalog cache_dir przechowuje wersje skompresowane miedzy uruchomieniami (nazwa pliku to skrot tresci), dzieki czemu
+    kolejne uruchomienia jedynie je wczytuja.
+    """
+    def __init__(self, gzip_level=9, brotli_quality=9, cache_dir=None):
+        """
+        Tworzy pusty zbior plikow statycznych o wskazanych poziomach kompresji gzip oraz brotli.
+        """
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_dir = cache_dir
+        self.assets = dict()
+        self.seconds = 0.0
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def compress(self, asset, encoding):
+        """
+        Zwraca tresc pliku skompresowana wskazanym kodowaniem - wczytana z katalogu cache_dir lub skompresowana (i tam zapisana).
+        """
+        path = None
+        if self.cache_dir is not None:
+            level = self.brotli_quality if encoding == 'br' else self.gzip_level
+            path = os.path.join(self.cache_dir, f'{asset.etag}-{level}.{encoding}')
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    return file.read()
+
+        if encoding == 'br':
+            body = brotli.compress(asset.body, quality=self.brotli_quality)
+        else:
+            body = gzip.compress(asset.body, compresslevel=self.gzip_level, mtime=0)
+
+        if path is not None:
+            # Zapis do pliku tymczasowego i zamiana nazwy - rownolegle uruchamiane procesy nie odczytaja niepelnego pliku
+            descriptor, temporary = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(body)
+            os.replace(temporary, path)
+        return body
+
+    def add_file(self, url, path, cache_control):
+        """
+        Wczytuje plik i zapamietuje go pod wskazanym adresem. Pliki tekstowe sa kompresowane, jesli wersja skompresowana jest mniejsza.
+        """
+        start = time.perf_counter()
+        with open(path, 'rb') as file:
+            body = file.read()
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        asset = StaticAsset(body, mimetype, cache_control)
+
+        if path.endswith(COMPRESSIBLE_EXTENSIONS) and len(body) >= MIN_COMPRESS_BYTES:
+            for encoding in ('br', 'gzip') if brotli is not None else ('gzip',):
+                encoded = self.compress(asset, encoding)
+                if len(encoded) < len(body):
+                    asset.encoded[encoding] = encoded
+        self.assets[url] = asset
+        self.seconds += time.perf_counter() - start
+
+    def add_directory(self, url_prefix, directory, cache_control):
+        """
+        Wczytuje wszystkie pliki wskazanego katalogu (bez podkatalogow i map zrodel) pod adresami url_prefix/nazwa_pliku.
+        """
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and not name.endswith(SKIPPED_EXTENSIONS):
+                self.add_file(f'{url_prefix}/{name}', path, cache_control)
+
+    def response(self, request):
+        """
+        Zwraca odpowiedz z plikiem statycznym dla zapytania GET lub HEAD o zapamietany adres albo None dla pozostalych zapytan.
+        Kazda wersja pliku ma osobny znacznik ETag, poniewaz tresci roznych kodowan sie roznia.
+        """
+        asset = self.assets.get(request.path)
+        if asset is None or request.method not in ('GET', 'HEAD'):
+            return None
+
+        encoding, body = asset.select(request.accept_encodings)
+        response = Response(body, mimetype=asset.mimetype)
+        response.set_etag(asset.etag if encoding is None else f'{asset.etag}-{encoding}')
+        response.headers['Cache-Control'] = asset.cache_control
+        response.vary.add('Accept-Encoding')
+        if encoding is not None:
+            response.headers['Content-Encoding'] = encoding
+        return response.make_conditional(request)
+
+    def stats(self):
+        """
+        Zwraca liczbe plikow, ich laczny rozmiar przed i po kompresji oraz czas wczytywania i kompresji (w sekundach).
+        """
+        return {
+            "files": len(self.assets),
+            "bytes": sum(len(asset.body) for asset in self.assets.values()),
+            "compressed_bytes": {
+                encoding: sum(len(asset.encoded.get(encoding, asset.body)) for asset in self.assets.values())
+                for encoding in (('br', 'gzip') if brotli is not None else ('gzip',))
+            },
+            "seconds": round(self.seconds, 4)
+        }
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Moduly aplikacji sa importowane tak jak przy uruchomieniu z katalogu API (np. from models.graph import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
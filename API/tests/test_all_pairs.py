@@ -0,0 +1,103 @@
+"""
+Testy najkrotszych drog miedzy wszystkimi parami wierzcholkow - wyniki obu silnikow sa porownywane z kosztami wyznaczonymi
+przez DijkstraGraph (z rejestrowaniem krokow) uruchamiany osobno dla kazdego wierzcholka.
+"""
+import math
+import random
+import pytest
+from models.all_pairs import AllPairsShortestPaths
+from models.compact_graph import CompactGraph
+from models.graph import DijkstraGraph
+from models.numpy_engine import numpy
+
+ENGINES = ['dijkstra', pytest.param('floyd_warshall', marks=pytest.mark.skipif(numpy is None, reason='wymaga biblioteki NumPy'))]
+
+
+def random_graph(seed, directed, float_weights):
+    """
+    Tworzy losowy graf (skierowany lub nieskierowany) z nieujemnymi wagami calkowitymi lub rzeczywistymi, w ktorym
+    czesc par wierzcholkow moze byc nieosiagalna.
+    """
+    generator = random.Random(seed)
+    vertex_count = generator.randint(1, 15)
+    adjacency_list = [list() for _ in range(vertex_count)]
+    weights = [list() for _ in range(vertex_count)]
+    for _ in range(generator.randint(0, 3 * vertex_count)):
+        start, end = generator.randrange(vertex_count), generator.randrange(vertex_count)
+        weight = generator.uniform(0, 10) if float_weights else generator.randint(0, 10)
+        adjacency_list[start].append(end)
+        weights[start].append(weight)
+        if not directed:
+            adjacency_list[end].append(start)
+            weights[end].append(weight)
+    return CompactGraph(list(range(vertex_count)), adjacency_list, weights)
+
+
+def reference_distances(core):
+    """
+    Zwraca macierz kosztow wyznaczona przez DijkstraGraph z rejestrowaniem krokow (None dla par nieosiagalnych).
+    """
+    distances = list()
+    for source in range(core.vertex_count()):
+        graph = DijkstraGraph(current_vertex=source, core=core)
+        graph.find_shortest_paths()
+        distances.append([cost if cost != math.inf else None for cost in graph.costs])
+    return distances
+
+
+def assert_distances_equal(distances, expected):
+    """
+    Sprawdza zgodnosc macierzy kosztow - koszty rzeczywiste moga sie roznic bledem zaokraglen wynikajacym z kolejnosci sumowania.
+    """
+    assert len(distances) == len(expected)
+    for row, expected_row in zip(distances, expected):
+        assert [cost is None for cost in row] == [cost is None for cost in expected_row]
+        assert [cost for cost in row if cost is not None] == pytest.approx([cost for cost in expected_row if cost is not None])
+
+
+def assert_valid_predecessors(core, distances, predecessors):
+    """
+    Sprawdza, czy kazdy poprzednik lezy na najkrotszej drodze - koszt poprzednika powiekszony o wage luku jest rowny kosztowi wierzcholka.
+    """
+    for source in range(core.vertex_count()):
+        for vertex, parent in enumerate(predecessors[source]):
+            if parent == -1:
+                assert vertex == source or distances[source][vertex] is None
+                continue
+            weight = min(weight for neighbour, weight in core.weighted_neighbours(parent) if neighbour == vertex)
+            assert distances[source][parent] + weight == pytest.approx(distances[source][vertex])
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('directed', [False, True])
+@pytest.mark.parametrize('float_weights', [False, True])
+@pytest.mark.parametrize('seed', range(40))
+def test_engines_match_dijkstra_graph(engine, directed, float_weights, seed):
+    core = random_graph(seed, directed, float_weights)
+    result = AllPairsShortestPaths(core, engine).compute()
+    assert_distances_equal(result["distances"], reference_distances(core))
+    assert_valid_predecessors(core, result["distances"], result["predecessors"])
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_unreachable_pairs_are_null(engine):
+    core = CompactGraph([0, 1, 2, 3], [[1], [0], [3], [2]], [[4], [4], [1], [1]])
+    result = AllPairsShortestPaths(core, engine).compute()
+    assert result["distances"] == [[0, 4, None, None], [4, 0, None, None], [None, None, 0, 1], [None, None, 1, 0]]
+    assert result["predecessors"] == [[-1, 0, -1, -1], [1, -1, -1, -1], [-1, -1, -1, 2], [-1, -1, 3, -1]]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_directed_graph(engine):
+    core = CompactGraph([0, 1, 2], [[1, 2], [2], []], [[1, 5], [1], []])
+    result = AllPairsShortestPaths(core, engine).compute()
+    assert result["distances"] == [[0, 1, 2], [None, 0, 1], [None, None, 0]]
+    assert result["predecessors"] == [[-1, 0, 1], [-1, -1, 1], [-1, -1, -1]]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_float_weights(engine):
+    core = CompactGraph([0, 1, 2], [[1, 2], [0, 2], [0, 1]], [[0.5, 2.25], [0.5, 1.5], [2.25, 1.5]])
+    result = AllPairsShortestPaths(core, engine).compute()
+    assert result["distances"] == [[0, 0.5, 2.0], [0.5, 0, 1.5], [2.0, 1.5, 0]]
+    assert all(isinstance(cost, float) for row in result["distances"] for cost in row if cost != 0)
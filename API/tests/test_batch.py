@@ -0,0 +1,50 @@
+"""
+Testy wykonywania wielu przebiegow algorytmow na jednym grafie.
+"""
+import json
+import pytest
+from batch import BatchExecutor
+from models.compact_graph import CompactGraph
+
+
+def run_batch(runs):
+    """
+    Wykonuje przebiegi w biezacym procesie na malym grafie z wagami i zwraca liste wynikow przebiegow.
+    """
+    core = CompactGraph([0, 1, 2], [[1], [0, 2], [1]], [[1], [1, 2], [2]])
+    return json.loads(BatchExecutor(max_workers=1).run(core, {"runs": runs}))["runs"]
+
+
+def test_invalid_run_fields_fail_only_their_own_entry():
+    entries = run_batch([
+        {"algorithm": "Dijkstra", "start_vertex": 0},
+        {"algorithm": "Dijkstra", "start_vertex": 7},
+        {"algorithm": "BellmanFord"},
+        {"algorithm": "PrimDijkstra", "start_vertex": "x"},
+        {"algorithm": "BFS"},
+        {"algorithm": "DFS", "start_vertex": [1]},
+        {"algorithm": "Dijkstra", "start_vertex": 0, "target_vertex": 9},
+        {"algorithm": "Kruskal"}
+    ])
+    assert [("error" in entry, "output" in entry) for entry in entries] == [
+        (False, True), (True, False), (True, False), (True, False), (True, False), (True, False), (True, False), (False, True)
+    ]
+    assert entries[1]["error"] == 'start_vertex musi byc indeksem wierzcholka grafu.'
+
+
+@pytest.mark.parametrize('runs, error', [
+    ([{"algorithm": "BFS", "start_vertex": 0}, 5], 'Kazdy przebieg musi byc obiektem z polami zapytania.'),
+    ([["BFS"]], 'Kazdy przebieg musi byc obiektem z polami zapytania.'),
+    ([{"algorithm": "Unknown"}], 'Nieznany algorytm: Unknown.'),
+    ([], 'Pole runs musi byc niepusta lista przebiegow.')
+])
+def test_invalid_runs_are_rejected(runs, error):
+    with pytest.raises(ValueError, match=error.replace('.', r'\.')):
+        run_batch(runs)
+
+
+def test_algorithm_errors_are_not_masked(monkeypatch):
+    # Bledy inne niz ValueError oznaczaja blad algorytmu - nie sa zamieniane na blad przebiegu
+    monkeypatch.setattr('batch.job_body', lambda *args: [][0])
+    with pytest.raises(IndexError):
+        run_batch([{"algorithm": "Kruskal"}])
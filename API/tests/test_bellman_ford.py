@@ -0,0 +1,72 @@
+"""
+Testy zgodnosci silnikow python oraz numpy algorytmu Bellmana-Forda.
+"""
+import random
+import pytest
+from models.graph import BellmanFordGraph
+
+pytest.importorskip('numpy')
+
+
+def random_directed_graph(generator, vertex_count, arc_count, low, high):
+    """
+    Tworzy losowy graf skierowany z rzeczywistymi wagami z przedzialu [low, high], petlami oraz lukami wielokrotnymi.
+    """
+    adjacency_list = [list() for _ in range(vertex_count)]
+    weights = [list() for _ in range(vertex_count)]
+    for _ in range(arc_count):
+        start = generator.randrange(vertex_count)
+        adjacency_list[start].append(generator.randrange(vertex_count))
+        weights[start].append(generator.uniform(low, high))
+    return list(range(vertex_count)), adjacency_list, weights
+
+
+def compute(graph_fields, start_vertex, engine):
+    """
+    Zwraca wynik algorytmu Bellmana-Forda wyznaczony wskazanym silnikiem.
+    """
+    return BellmanFordGraph(*graph_fields, current_vertex=start_vertex, engine=engine).compute_result()
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_engines_agree_on_random_graphs(seed):
+    generator = random.Random(seed)
+    vertex_count = generator.randint(1, 12)
+    graph_fields = random_directed_graph(generator, vertex_count, generator.randint(0, 4 * vertex_count), 1, 10)
+    start_vertex = generator.randrange(vertex_count)
+
+    expected = compute(graph_fields, start_vertex, 'python')
+    result = compute(graph_fields, start_vertex, 'numpy')
+    assert result['costs'] == pytest.approx(expected['costs'])
+    assert result['parents'] == expected['parents']
+    assert result['negative_cycle'] == expected['negative_cycle'] is False
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_engines_agree_with_negative_weights(seed):
+    generator = random.Random(seed)
+    vertex_count = generator.randint(1, 12)
+    graph_fields = random_directed_graph(generator, vertex_count, generator.randint(0, 3 * vertex_count), -3, 10)
+    start_vertex = generator.randrange(vertex_count)
+
+    expected = compute(graph_fields, start_vertex, 'python')
+    result = compute(graph_fields, start_vertex, 'numpy')
+    assert result['negative_cycle'] == expected['negative_cycle']
+    if not expected['negative_cycle']:
+        assert result['costs'] == pytest.approx(expected['costs'])
+        assert result['parents'] == expected['parents']
+
+
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_start_vertex_self_loop_keeps_zero_cost(engine):
+    graph_fields = ([0, 1, 2], [[0, 1, 1], [2], []], [[6, 9, 8], [3], []])
+    result = compute(graph_fields, 0, engine)
+    assert result['costs'] == [0, 8, 11]
+    assert result['parents'] == [-1, 0, 1]
+    assert result['negative_cycle'] is False
+
+
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_start_vertex_negative_self_loop_is_negative_cycle(engine):
+    graph_fields = ([0, 1], [[0, 1], []], [[-1, 2], []])
+    assert compute(graph_fields, 0, engine)['negative_cycle'] is True
@@ -0,0 +1,111 @@
+"""
+Testy algorytmu Boruvki - minimalne drzewo (las) rozpinajace musi zawierac te same krawedzie i miec te sama wage,
+co drzewo wyznaczone algorytmem Kruskala.
+"""
+import random
+import pytest
+import models.boruvka
+from models.boruvka import BoruvkaGraph
+from models.compact_graph import CompactGraph
+from models.graph import KruskalGraph
+from models.numpy_engine import numpy
+
+ENGINES = ['python', pytest.param('numpy', marks=pytest.mark.skipif(numpy is None, reason='wymaga biblioteki NumPy'))]
+
+
+def random_graph(seed, max_weight):
+    """
+    Tworzy losowy graf nieskierowany - zwykle niespojny, z krawedziami wielokrotnymi oraz (dla malego max_weight) wieloma rownymi wagami.
+    """
+    generator = random.Random(seed)
+    vertex_count = generator.randint(1, 30)
+    adjacency_list = [list() for _ in range(vertex_count)]
+    weights = [list() for _ in range(vertex_count)]
+    for _ in range(generator.randint(0, 3 * vertex_count)):
+        vertex1, vertex2 = generator.randrange(vertex_count), generator.randrange(vertex_count)
+        if vertex1 == vertex2:
+            continue
+        weight = generator.randint(1, max_weight)
+        adjacency_list[vertex1].append(vertex2)
+        weights[vertex1].append(weight)
+        adjacency_list[vertex2].append(vertex1)
+        weights[vertex2].append(weight)
+    return CompactGraph(list(range(vertex_count)), adjacency_list, weights)
+
+
+def edge_set(result):
+    """
+    Zwraca posortowana liste krawedzi drzewa (mniejszy koniec, wiekszy koniec, waga).
+    """
+    return sorted((min(edge["start"], edge["end"]), max(edge["start"], edge["end"]), edge["weight"]) for edge in result["mst_edges"])
+
+
+def assert_matches_kruskal(core, engine, workers=None):
+    """
+    Sprawdza zgodnosc wyniku algorytmu Boruvki z wynikiem algorytmu Kruskala - zarowno trybu wyniku, jak i trybu krokow.
+    """
+    expected = KruskalGraph(core=core).compute_result()
+    result = BoruvkaGraph(core=core, engine=engine, workers=workers).compute_result()
+    assert edge_set(result) == edge_set(expected)
+    assert result["total_weight"] == expected["total_weight"]
+
+    graph = BoruvkaGraph(core=core, engine=engine, workers=workers)
+    graph.find_minimum_spanning_tree()
+    assert edge_set(graph.result()) == edge_set(expected)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('max_weight', [3, 1000])
+@pytest.mark.parametrize('seed', range(60))
+def test_matches_kruskal_on_random_graphs(engine, max_weight, seed):
+    assert_matches_kruskal(random_graph(seed, max_weight), engine)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_disconnected_graph_gives_spanning_forest(engine):
+    core = CompactGraph([0, 1, 2, 3, 4], [[1], [0], [3], [2], []], [[2], [2], [5], [5], []])
+    assert_matches_kruskal(core, engine)
+    assert BoruvkaGraph(core=core, engine=engine).compute_result()["total_weight"] == 7
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_tied_weights(engine):
+    # Cykl o rownych wagach - o wyborze krawedzi decyduje ich numer, tak jak w algorytmie Kruskala
+    core = CompactGraph([0, 1, 2, 3], [[1, 3], [0, 2], [1, 3], [2, 0]], [[1, 1], [1, 1], [1, 1], [1, 1]])
+    assert_matches_kruskal(core, engine)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_parallel_edges(engine):
+    core = CompactGraph([0, 1, 2], [[1, 1, 2], [0, 0, 2], [0, 1]], [[4, 2, 7], [4, 2, 3], [7, 3]])
+    assert_matches_kruskal(core, engine)
+    assert edge_set(BoruvkaGraph(core=core, engine=engine).compute_result()) == [(0, 1, 2), (1, 2, 3)]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_parallel_chunks_match_kruskal(engine, monkeypatch):
+    # Maly prog podzialu na fragmenty - wyszukiwanie najtanszych krawedzi w dwoch procesach potomnych
+    monkeypatch.setattr(models.boruvka, 'MIN_CHUNK_EDGES', 2)
+    core = random_graph(7, 5)
+    graph = BoruvkaGraph(core=core, engine=engine, workers=2)
+    graph.tracing = False
+    pool = graph.create_pool()
+    assert isinstance(pool, models.boruvka.ChunkPool)
+    pool.close()
+    assert_matches_kruskal(core, engine, workers=2)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_steps_mode_does_not_start_processes(engine, monkeypatch):
+    # Kroki moga byc pobierane stronami lub porzucone - wyszukiwanie odbywa sie w biezacym procesie
+    monkeypatch.setattr(models.boruvka, 'MIN_CHUNK_EDGES', 2)
+    graph = BoruvkaGraph(core=random_graph(7, 5), engine=engine, workers=2)
+    assert graph.worker_count() == 1
+    assert isinstance(graph.create_pool(), models.boruvka.InlinePool)
+
+
+def test_phase_step_uses_same_current_edge_sentinel():
+    core = CompactGraph([0, 1, 2], [[1], [0, 2], [1]], [[1], [1, 2], [2]])
+    steps = BoruvkaGraph(core=core).find_minimum_spanning_tree()
+    assert all(isinstance(step["current_edge"], tuple) for step in steps)
+    assert steps[0]["current_edge"] == (0, 0)
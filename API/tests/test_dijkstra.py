@@ -0,0 +1,26 @@
+"""
+Testy algorytmu Dijkstry - inicjalizacji kosztow oraz wczesnego zakonczenia po dotarciu do wierzcholka docelowego.
+"""
+import pytest
+from main import app
+from models.graph import DijkstraGraph
+
+GRAPH = {"vertices": [0, 1, 2], "adjacency_list": [[1, 1, 0], [0, 0, 2], [1]], "weights": [[5, 2, 1], [5, 2, 4], [4]], "start_vertex": 0}
+
+
+def test_parallel_edges_and_self_loop_at_start_vertex():
+    result = DijkstraGraph(GRAPH["vertices"], GRAPH["adjacency_list"], GRAPH["weights"], current_vertex=0).compute_result()
+    assert result == {"costs": [0, 2, 6], "parents": [-1, 0, 1]}
+
+
+def test_target_vertex_stops_early():
+    response = app.test_client().post('/api/Dijkstra', json=dict(GRAPH, target_vertex=1, mode='result'))
+    assert response.status_code == 200
+    assert response.get_json()["costs"][1] == 2
+
+
+@pytest.mark.parametrize('target_vertex', [3, -1, '1', 1.0, True, [1]])
+def test_invalid_target_vertex_is_rejected(target_vertex):
+    response = app.test_client().post('/api/Dijkstra', json=dict(GRAPH, target_vertex=target_vertex))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": 'target_vertex musi byc indeksem wierzcholka grafu.'}
@@ -0,0 +1,94 @@
+"""
+Testy przyrostowej aktualizacji drzewa najkrotszych drog oraz minimalnego lasu rozpinajacego - po kazdej losowej edycji
+wynik jest porownywany z wyznaczonym od poczatku, a graf po edycjach - z grafem utworzonym od poczatku z list sasiedztwa.
+"""
+import random
+import pytest
+from models.compact_graph import CompactGraph
+from models.graph import DijkstraGraph, KruskalGraph
+from models.incremental import GraphEditor, IncrementalShortestPaths, IncrementalSpanningForest, validate
+
+
+def random_rows(generator, vertex_count, max_weight):
+    """
+    Tworzy listy par [sasiad, waga] losowego grafu nieskierowanego (zwykle niespojnego, z krawedziami wielokrotnymi).
+    """
+    rows = [list() for _ in range(vertex_count)]
+    for _ in range(generator.randint(0, 2 * vertex_count)):
+        vertex1, vertex2 = generator.sample(range(vertex_count), 2)
+        weight = generator.randint(1, max_weight)
+        rows[vertex1].append([vertex2, weight])
+        rows[vertex2].append([vertex1, weight])
+    return rows
+
+
+def build(rows):
+    """
+    Tworzy zwarta reprezentacje grafu od poczatku z list par [sasiad, waga].
+    """
+    return CompactGraph(list(range(len(rows))), [[neighbour for neighbour, _ in row] for row in rows], [[weight for _, weight in row] for row in rows])
+
+
+def random_edit(generator, rows, max_weight):
+    """
+    Zwraca losowa edycje (dodanie, zmiana wagi lub usuniecie krawedzi) i nanosi ja na listy rows, tak jak GraphEditor -
+    zmiana wagi oraz usuniecie dotycza pierwszej krawedzi laczacej wskazane wierzcholki.
+    """
+    vertex1 = generator.randrange(len(rows))
+    operation = generator.choice(('insert', 'update', 'delete')) if rows[vertex1] else 'insert'
+    weight = generator.choice((generator.randint(1, max_weight), generator.uniform(1, max_weight))) if generator.random() < 0.2 else generator.randint(1, max_weight)
+    if operation == 'insert':
+        vertex2 = generator.choice([vertex for vertex in range(len(rows)) if vertex != vertex1])
+        rows[vertex1].append([vertex2, weight])
+        rows[vertex2].append([vertex1, weight])
+    else:
+        vertex2 = generator.choice(rows[vertex1])[0]
+        for vertex, neighbour in ((vertex1, vertex2), (vertex2, vertex1)):
+            position = next(i for i, (other, _) in enumerate(rows[vertex]) if other == neighbour)
+            if operation == 'delete':
+                del rows[vertex][position]
+            else:
+                rows[vertex][position][1] = weight
+    return {"op": operation, "vertex1": vertex1, "vertex2": vertex2, "weight": weight}
+
+
+def assert_same_graph(core, expected):
+    """
+    Sprawdza, czy grafy maja te same tablice reprezentacji CSR.
+    """
+    assert list(core.offsets) == list(expected.offsets)
+    assert list(core.targets) == list(expected.targets)
+    assert list(core.weights) == list(expected.weights)
+
+
+@pytest.mark.parametrize('edits_per_batch', [1, 3])
+@pytest.mark.parametrize('max_weight', [3, 100])
+@pytest.mark.parametrize('seed', range(25))
+def test_random_edits_match_full_recompute(seed, max_weight, edits_per_batch):
+    generator = random.Random(seed)
+    vertex_count = generator.randint(2, 12)
+    rows = random_rows(generator, vertex_count, max_weight)
+    core = build(rows)
+    source = generator.randrange(vertex_count)
+    paths, forest = IncrementalShortestPaths(core, source), IncrementalSpanningForest(core)
+
+    for _ in range(30):
+        editor = GraphEditor(core)
+        for _ in range(edits_per_batch):
+            forest.apply(editor.apply(random_edit(generator, rows, max_weight)), editor)
+        core = editor.build()
+        paths.update(core, editor.touched)
+
+        assert paths.incremental and forest.incremental
+        assert_same_graph(core, build(rows))
+        assert paths.result()["costs"] == DijkstraGraph(current_vertex=source, core=core).compute_result()["costs"]
+        assert validate(paths, core) == []
+        assert forest.result() == KruskalGraph(core=core).compute_result()
+
+
+def test_edit_of_missing_edge_is_rejected():
+    editor = GraphEditor(build([[[1, 2]], [[0, 2]], []]))
+    with pytest.raises(ValueError):
+        editor.apply({"op": "delete", "vertex1": 0, "vertex2": 2})
+    with pytest.raises(ValueError):
+        editor.apply({"op": "insert", "vertex1": 0, "vertex2": 0, "weight": 1})
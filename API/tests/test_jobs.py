@@ -0,0 +1,14 @@
+"""
+Testy przyjmowania zadan asynchronicznych.
+"""
+import pytest
+from main import app
+
+GRAPH = {"vertices": [0, 1], "adjacency_list": [[1], [0]], "weights": [[1], [1]], "start_vertex": 0}
+
+
+@pytest.mark.parametrize('timeout', ['10', 0, -5, True, [1]])
+def test_invalid_timeout_is_rejected(timeout):
+    response = app.test_client().post('/api/jobs', json=dict(GRAPH, algorithm='Dijkstra', timeout=timeout))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": 'Pole timeout musi byc dodatnia liczba sekund.'}
@@ -0,0 +1,26 @@
+"""
+Testy katalogu komunikatow krokow.
+"""
+import pytest
+from main import app
+from models.messages import MESSAGES, catalog
+
+GRAPH = {"vertices": [0, 1], "adjacency_list": [[1], [0]], "start_vertex": 0}
+
+
+def test_catalogs_have_the_same_codes():
+    assert all(set(messages) == set(MESSAGES['pl']) for messages in MESSAGES.values())
+
+
+@pytest.mark.parametrize('locale', [[], {}, 5, None, 'de'])
+def test_unsupported_locale_is_rejected(locale):
+    with pytest.raises(ValueError):
+        catalog(locale)
+    response = app.test_client().post('/api/BFS', json=dict(GRAPH, locale=locale))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": f'Nieobslugiwany jezyk komunikatow: {locale}.'}
+
+
+def test_english_step_messages():
+    response = app.test_client().post('/api/BFS', json=dict(GRAPH, locale='en'))
+    assert response.get_json()[0]["info"] == 'Processing vertex 0.'
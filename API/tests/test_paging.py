@@ -0,0 +1,82 @@
+"""
+Testy stronicowania krokow - sprawdzania pol from_step oraz limit i konczenia wykonan przechowywanych kursorow.
+"""
+import pytest
+from cursor_store import CursorStore
+from main import app
+from models.compact_graph import CompactGraph
+from models.graph import BFSGraph
+from models.step_cursor import StepCursor
+
+GRAPH = {"vertices": [0, 1, 2], "adjacency_list": [[1], [0, 2], [1]], "start_vertex": 0}
+
+
+@pytest.mark.parametrize('fields, error', [
+    ({"from_step": True}, 'from_step musi byc nieujemna liczba calkowita.'),
+    ({"from_step": -1}, 'from_step musi byc nieujemna liczba calkowita.'),
+    ({"from_step": 0, "limit": True}, 'limit musi byc dodatnia liczba calkowita.'),
+    ({"from_step": 0, "limit": 0}, 'limit musi byc dodatnia liczba calkowita.')
+])
+def test_invalid_paging_fields_are_rejected(fields, error):
+    response = app.test_client().post('/api/BFS', json=dict(GRAPH, **fields))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error}
+
+
+class TrackedCursor(StepCursor):
+    """
+    Kursor zapamietujacy, czy jego wykonanie zostalo zakonczone.
+    """
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def cursor():
+    """
+    Zwraca kursor przeszukiwania wszerz malego grafu ustawiony przed pierwszym krokiem.
+    """
+    return TrackedCursor(BFSGraph(core=CompactGraph(GRAPH["vertices"], GRAPH["adjacency_list"]), current_vertex=0))
+
+
+def test_evicted_cursor_is_closed():
+    store = CursorStore(max_cursors=1)
+    first, second = cursor(), cursor()
+    store.put('a', first)
+    store.put('b', second)
+    assert first.closed and first.finished
+    assert not second.closed
+
+
+def test_expired_cursor_is_closed():
+    store = CursorStore(ttl=-1)
+    expired = cursor()
+    store.put('a', expired)
+    assert store.take('a', 0) is None
+    assert expired.closed
+
+
+def test_replaced_cursor_is_closed():
+    store = CursorStore()
+    old, new = cursor(), cursor()
+    store.put('a', old)
+    store.put('a', new)
+    assert old.closed and not new.closed
+    assert store.take('a', 0) is new
+
+
+def test_close_runs_generator_cleanup():
+    cleaned = list()
+
+    class Graph(BFSGraph):
+        def run(self):
+            try:
+                yield from super().run()
+            finally:
+                cleaned.append(True)
+
+    paged = StepCursor(Graph(core=CompactGraph(GRAPH["vertices"], GRAPH["adjacency_list"]), current_vertex=0))
+    paged.close()
+    assert cleaned == [True]
@@ -0,0 +1,68 @@
+"""
+Testy pamieci podrecznej wynikow - limitow warstwy pamieciowej oraz dyskowej.
+"""
+import os
+import time
+from result_cache import ResultCache
+
+
+def key(number):
+    """
+    Zwraca klucz o dlugosci skrotu SHA-256.
+    """
+    return f'{number:064x}'
+
+
+def disk_bytes(directory):
+    """
+    Zwraca laczny rozmiar plikow katalogu.
+    """
+    return sum(entry.stat().st_size for entry in os.scandir(directory))
+
+
+def test_disk_tier_stays_within_limit(tmp_path):
+    cache = ResultCache(max_bytes=1024, directory=str(tmp_path), max_disk_bytes=10000)
+    for number in range(50):
+        cache.put(key(number), b'x' * 900, {})
+    assert disk_bytes(tmp_path) <= 10000
+    assert cache.stats()["disk_bytes"] == disk_bytes(tmp_path)
+    assert cache.stats()["disk_evictions"] > 0
+    # Najnowsze wpisy pozostaja na dysku, najstarsze zostaly usuniete
+    assert os.path.exists(tmp_path / key(49))
+    assert not os.path.exists(tmp_path / key(0))
+
+
+def test_disk_read_keeps_entry(tmp_path):
+    cache = ResultCache(max_bytes=0, directory=str(tmp_path), max_disk_bytes=3000)
+    cache.put(key(0), b'x' * 900, {})
+    for number in range(1, 10):
+        # Odczyt odswieza czas modyfikacji pliku - wpis uzywany nie jest usuwany jako najstarszy
+        time.sleep(0.01)
+        assert cache.get(key(0)) == (b'x' * 900, {})
+        cache.put(key(number), b'x' * 900, {})
+    assert os.path.exists(tmp_path / key(0))
+    assert disk_bytes(tmp_path) <= 3000
+
+
+def test_existing_files_are_counted_on_start(tmp_path):
+    ResultCache(directory=str(tmp_path)).put(key(1), b'x' * 900, {})
+    time.sleep(0.01)
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=1500)
+    assert cache.stats()["disk_bytes"] == disk_bytes(tmp_path)
+    cache.put(key(2), b'x' * 900, {})
+    assert os.listdir(tmp_path) == [key(2)]
+
+
+def test_entry_larger_than_disk_limit_is_not_written(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=100)
+    cache.put(key(1), b'x' * 900, {})
+    assert os.listdir(tmp_path) == []
+
+
+def test_overwriting_key_does_not_grow_disk_size(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=10000)
+    cache.put(key(1), b'x' * 900, {})
+    cache.put(key(1), b'x' * 500, {})
+    cache.put(key(1), b'x' * 700, {})
+    assert cache.stats()["disk_bytes"] == disk_bytes(tmp_path) == 703
+    assert cache.stats()["disk_evictions"] == 0
@@ -0,0 +1,28 @@
+"""
+Testy przeszukiwania grafu wszerz oraz w glab - sprawdzania wierzcholkow startowych.
+"""
+import pytest
+from main import app
+
+GRAPH = {"vertices": ['a', 'b', 'c'], "adjacency_list": [['b'], ['a', 'c'], ['b']]}
+
+
+@pytest.mark.parametrize('algorithm', ['BFS', 'DFS'])
+@pytest.mark.parametrize('fields, error', [
+    ({"start_vertex": [1]}, 'start_vertex musi zawierac etykiety wierzcholkow grafu.'),
+    ({"start_vertex": {"a": 1}}, 'start_vertex musi zawierac etykiety wierzcholkow grafu.'),
+    ({"start_vertices": ['a', ['b']]}, 'start_vertices musi zawierac etykiety wierzcholkow grafu.'),
+    ({"start_vertex": 'x'}, 'Nieznany wierzcholek startowy: x.'),
+    ({}, 'Zapytanie nie zawiera wierzcholka startowego (pole start_vertex lub start_vertices).')
+])
+def test_invalid_start_vertices_are_rejected(algorithm, fields, error):
+    response = app.test_client().post(f'/api/{algorithm}', json=dict(GRAPH, **fields))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error}
+
+
+@pytest.mark.parametrize('algorithm', ['BFS', 'DFS'])
+def test_start_vertices_by_label(algorithm):
+    response = app.test_client().post(f'/api/{algorithm}', json=dict(GRAPH, start_vertices=['c'], mode='result'))
+    assert response.status_code == 200
+    assert response.get_json()["order"][0] == 'c'
@@ -0,0 +1,74 @@
+"""
+Testy formatu roznicowego krokow - sprawdzania pola keyframe_interval oraz odtwarzania pelnych migawek krokow z klatek kluczowych i roznic.
+"""
+import random
+import pytest
+from algorithms import ALGORITHMS, create_core, create_graph
+from main import app
+from models.timeline import SET_FIELDS, decode_steps, encode_steps, freeze
+
+GRAPH = {"vertices": [0, 1, 2], "adjacency_list": [[1], [0, 2], [1]], "start_vertex": 0}
+
+
+@pytest.mark.parametrize('keyframe_interval', ['5', 2.5, 0, -1, True, None])
+def test_invalid_keyframe_interval_is_rejected(keyframe_interval):
+    response = app.test_client().post('/api/BFS', json=dict(GRAPH, step_format='delta', keyframe_interval=keyframe_interval))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": 'keyframe_interval musi byc dodatnia liczba calkowita.'}
+
+
+def test_valid_keyframe_interval():
+    response = app.test_client().post('/api/BFS', json=dict(GRAPH, step_format='delta', keyframe_interval=2))
+    assert response.status_code == 200
+
+
+def weighted_graph(vertex_count=8, seed=3):
+    """
+    Zwraca pola zapytania dla losowego spojnego grafu nieskierowanego z wagami.
+    """
+    generator = random.Random(seed)
+    adjacency_list = [list() for _ in range(vertex_count)]
+    weights = [list() for _ in range(vertex_count)]
+    edges = {(generator.randrange(i), i) for i in range(1, vertex_count)}
+    while len(edges) < 2 * vertex_count:
+        vertex1, vertex2 = sorted(generator.sample(range(vertex_count), 2))
+        edges.add((vertex1, vertex2))
+    for vertex1, vertex2 in sorted(edges):
+        weight = generator.randint(1, 9)
+        adjacency_list[vertex1].append(vertex2)
+        weights[vertex1].append(weight)
+        adjacency_list[vertex2].append(vertex1)
+        weights[vertex2].append(weight)
+    return {"vertices": list(range(vertex_count)), "adjacency_list": adjacency_list, "weights": weights, "start_vertex": 0}
+
+
+def normalize(step):
+    """
+    Zwraca krok z polami bedacymi zbiorami w postaci zbiorow (kolejnosc ich elementow nie ma znaczenia).
+    """
+    return {key: set(map(freeze, value)) if key in SET_FIELDS else value for key, value in step.items()}
+
+
+def full_steps(algorithm, request_data):
+    """
+    Zwraca pelne migawki krokow algorytmu (format domyslny).
+    """
+    return create_graph(algorithm, create_core(algorithm, request_data), request_data).collect_steps()
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+@pytest.mark.parametrize('keyframe_interval', [1, 2, 7, 10 ** 6])
+def test_delta_steps_round_trip(algorithm, keyframe_interval):
+    request_data = weighted_graph()
+    expected = [normalize(step) for step in full_steps(algorithm, request_data)]
+    assert len(expected) < 10 ** 6
+
+    # Kodowanie gotowej listy krokow
+    encoded = encode_steps(full_steps(algorithm, request_data), keyframe_interval)
+    assert [normalize(step) for step in decode_steps(encoded)] == expected
+
+    # Kodowanie krokow w trakcie dzialania algorytmu (step_format=delta)
+    delta_request = dict(request_data, step_format='delta', keyframe_interval=keyframe_interval)
+    encoded = create_graph(algorithm, create_core(algorithm, request_data), delta_request).collect_steps()
+    assert [step["type"] == "keyframe" for step in encoded] == [i % keyframe_interval == 0 for i in range(len(encoded))]
+    assert [normalize(step) for step in decode_steps(encoded)] == expected
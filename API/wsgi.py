@@ -0,0 +1,10 @@
+"""
+Punkt wejscia aplikacji dla serwera WSGI. Uruchomienie (z katalogu API): gunicorn -c gunicorn.conf.py wsgi:app
+Czas importu modulu aplikacji (wraz z Flask i NumPy) jest mierzony i udostepniany w metryce graph_api_startup_seconds.
+"""
+import time
+
+import_start = time.perf_counter()
+from main import create_app  # noqa: E402 - import jest celowo mierzony
+
+app = create_app(import_seconds=time.perf_counter() - import_start)